@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK - VIVA SERGIPE!
+Reproduz sessões gravadas (landmarks .npy ou vídeo) pelo pipeline real do jogo,
+sem câmera e sem janela, e mede throughput e latência por estágio.
+
+Uso:
+    python scripts/benchmark.py
+    python scripts/benchmark.py --landmarks train_model/test_data/landmarks --repeat 3
+    python scripts/benchmark.py --video sessao.mp4 --output benchmark.json
+    python scripts/benchmark.py --quality-ladder --repeat 1
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
+
+from frame_profiler import FrameProfiler
+from landmark_renderer import get_landmark_renderer
+from landmark_tracker import TrackedResults
+from performance_optimizer import get_performance_optimizer
+from quality_controller import QUALITY_LADDER
+from sergipe_utils import ContourAsset, BodyFillAnalyzer, display_sergipe_interface
+from visual_feedback import get_visual_feedback_manager
+
+DEFAULT_LANDMARKS_DIR = os.path.join(PROJECT_ROOT, "train_model", "test_data", "landmarks")
+DEFAULT_CONTOUR_PATH = os.path.join(PROJECT_ROOT, "assets", "contorno-mapa-SE.png")
+
+# Índices MediaPipe dos 12 landmarks salvos por extract_landmarks (11-16 e 23-28)
+RECORDED_LANDMARK_INDICES = list(range(11, 17)) + list(range(23, 29))
+POSE_LANDMARK_COUNT = 33
+
+
+def recorded_to_results(coordinates):
+    """
+    Converte landmarks gravados (12, 2) em resultados de pose com 33 landmarks
+
+    Args:
+        coordinates (np.ndarray): Coordenadas gravadas por extract_landmarks
+
+    Returns:
+        TrackedResults: Resultados compatíveis com o pipeline (sem pose se tudo for zero)
+    """
+    if not np.any(coordinates):
+        return TrackedResults()
+
+    landmark_array = np.zeros((POSE_LANDMARK_COUNT, 3), dtype=np.float64)
+    landmark_array[RECORDED_LANDMARK_INDICES, :2] = coordinates
+    landmark_array[RECORDED_LANDMARK_INDICES, 2] = 1.0  # Visíveis; os demais ficam invisíveis
+    return TrackedResults(landmark_array)
+
+
+def load_landmark_session(landmarks_dir):
+    """
+    Carrega uma sessão de landmarks gravados e os frames correspondentes
+
+    Os arquivos .npy de cada subpasta são reproduzidos em ordem de nome
+    (timestamp). Quando existe um frame .jpg com o mesmo nome em
+    '../frames', ele é usado como imagem de fundo.
+
+    Args:
+        landmarks_dir (str): Pasta com subpastas de arquivos .npy
+
+    Returns:
+        list: Lista de (frame, results)
+    """
+    frames_dir = os.path.join(os.path.dirname(os.path.abspath(landmarks_dir)), "frames")
+    blank = np.full((720, 1280, 3), 64, dtype=np.uint8)
+
+    session = []
+    for path in sorted(glob.glob(os.path.join(landmarks_dir, "**", "*.npy"), recursive=True)):
+        relative = os.path.relpath(path, landmarks_dir)
+        frame = cv2.imread(os.path.join(frames_dir, os.path.splitext(relative)[0] + ".jpg"))
+        session.append((frame if frame is not None else blank, recorded_to_results(np.load(path))))
+    return session
+
+
+def load_video_session(video_path, max_frames=0):
+    """
+    Carrega os frames de um vídeo e detecta a pose de cada um com o modelo real
+
+    Args:
+        video_path (str): Caminho do vídeo
+        max_frames (int): Limite de frames (0 = todos)
+
+    Returns:
+        list: Lista de (frame, results)
+    """
+    from utils import initialize_pose_model
+
+    pose = initialize_pose_model()
+    capture = cv2.VideoCapture(video_path)
+    session = []
+    while not max_frames or len(session) < max_frames:
+        success, frame = capture.read()
+        if not success:
+            break
+        session.append((frame, pose.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))))
+    capture.release()
+    pose.close()
+    return session
+
+
+def run_benchmark(session, repeat=1, display_size=(1920, 1080), analysis_resolution=(320, 180),
+                  quality="high", contour_path=DEFAULT_CONTOUR_PATH, mirror=True, pose=None):
+    """
+    Reproduz uma sessão pelo pipeline do jogo na velocidade máxima
+
+    Estágios medidos: optimize (optimize_frame_processing), resize (espelhamento
+    e escala para a tela), mask (máscara do corpo), fill (preenchimento),
+    feedback (VisualFeedbackManager) e interface (display_sergipe_interface).
+    Com 'pose', a inferência também é executada (estágio inference) na largura
+    e na frequência de detecção do nível; os resultados continuam sendo os
+    gravados, então o checksum não muda.
+
+    Args:
+        session (list): Lista de (frame, results)
+        repeat (int): Número de vezes que a sessão é reproduzida
+        display_size (tuple): Resolução de exibição (largura, altura)
+        analysis_resolution (tuple): Resolução de análise, ou None para a de exibição
+        quality (str): Nível de QUALITY_LADDER fixado no otimizador
+        contour_path (str): Caminho do contorno de Sergipe
+        mirror (bool): Espelhar o frame como no jogo
+        pose: Modelo de pose para medir a inferência (None: sem inferência)
+
+    Returns:
+        dict: Relatório com throughput, latências por estágio e checksum dos resultados
+    """
+    levels = {level.name: level for level in QUALITY_LADDER}
+    if quality not in levels:
+        raise ValueError(f"Nível de qualidade desconhecido: {quality}")
+
+    contour = ContourAsset.load(contour_path)
+    if contour is None:
+        raise RuntimeError(f"Não foi possível carregar o contorno: {contour_path}")
+
+    body_analyzer = BodyFillAnalyzer(contour, analysis_resolution)
+    visual_feedback = get_visual_feedback_manager()
+    landmark_renderer = get_landmark_renderer("enhanced")
+    profiler = FrameProfiler()
+
+    # Otimizador com configurações fixas para o resultado ser determinístico
+    optimizer = get_performance_optimizer()
+    optimizer.stop_monitoring()
+    saved_settings = optimizer.adaptive_settings.copy()
+    optimizer._apply_quality_level(levels[quality])
+    overlays = levels[quality].overlays
+
+    display_width, display_height = display_size
+    checksum = hashlib.sha256()
+    fill_total = 0.0
+
+    try:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for frame_count, (source_frame, results) in enumerate(session):
+                profiler.begin_frame()
+                frame = source_frame.copy()
+
+                frame = optimizer.optimize_frame_processing(frame)
+                profiler.lap("optimize")
+
+                if pose is not None:
+                    if not optimizer.should_skip_detection(frame_count):
+                        inference_frame = optimizer.prepare_inference_frame(frame)
+                        pose.process(cv2.cvtColor(inference_frame, cv2.COLOR_BGR2RGB))
+                    profiler.lap("inference")
+
+                if mirror:
+                    frame = cv2.flip(frame, 1)
+                frame = cv2.resize(frame, (display_width, display_height))
+                contour_variant = contour.get(display_width, display_height)
+                profiler.lap("resize")
+
+                body_pixels = body_analyzer.update(results, display_width, display_height)
+                profiler.lap("mask")
+
+                fill_percentage = body_analyzer.fill_percentage() if body_pixels > 0 else 0.0
+                profiler.lap("fill")
+
+                analysis = visual_feedback.analyze_detection_quality(frame, results, body_pixels)
+                if overlays:
+                    frame = visual_feedback.draw_detection_feedback(frame, analysis)
+                landmark_renderer.draw(frame, results, mirrored=mirror)
+                frame = visual_feedback.draw_messages(frame)
+                profiler.lap("feedback")
+
+                display_sergipe_interface(frame, contour_variant, 120, fill_percentage, True, 30.0)
+                profiler.lap("interface")
+                profiler.end_frame()
+
+                fill_total += fill_percentage
+                checksum.update(f"{body_pixels}:{fill_percentage:.4f};".encode())
+        elapsed = time.perf_counter() - start
+    finally:
+        optimizer.adaptive_settings.update(saved_settings)
+
+    frames = len(session) * repeat
+    report = profiler.get_report()
+    return {
+        "frames": frames,
+        "elapsed_s": round(elapsed, 3),
+        "fps": round(frames / elapsed, 2) if elapsed > 0 else 0.0,
+        "display_size": list(display_size),
+        "analysis_resolution": list(analysis_resolution) if analysis_resolution else None,
+        "quality": quality,
+        "inference": pose is not None,
+        "mean_fill_percentage": round(fill_total / frames, 4) if frames else 0.0,
+        "results_checksum": checksum.hexdigest(),
+        "frame": report["frame"],
+        "stages": report["stages"],
+        "system": report["system"],
+    }
+
+
+def measure_quality_ladder(session, repeat=1, display_size=(1920, 1080), analysis_resolution=(320, 180),
+                           contour_path=DEFAULT_CONTOUR_PATH, inference=True):
+    """
+    Mede o custo por frame de cada nível de QUALITY_LADDER
+
+    Cada nível roda com o seu model_complexity; se o modelo não puder ser
+    carregado (ou com inference=False), o nível é medido sem inferência e
+    marcado como tal no relatório.
+
+    Args:
+        session (list): Lista de (frame, results)
+        repeat (int): Número de vezes que a sessão é reproduzida por nível
+        display_size (tuple): Resolução de exibição (largura, altura)
+        analysis_resolution (tuple): Resolução de análise, ou None para a de exibição
+        contour_path (str): Caminho do contorno de Sergipe
+        inference (bool): Medir também a inferência do MediaPipe
+
+    Returns:
+        dict: Por nível, o tempo médio por frame, o custo relativo a "high" (None se um
+            dos dois foi medido sem inferência e o outro não) e se houve inferência
+    """
+    from utils import initialize_pose_model
+
+    models = {}
+    reports = {}
+    try:
+        for level in QUALITY_LADDER:
+            if inference and level.model_complexity not in models:
+                try:
+                    models[level.model_complexity] = initialize_pose_model(model_complexity=level.model_complexity)
+                except Exception as e:
+                    print(f"⚠️ Modelo de pose {level.model_complexity} indisponível, medindo sem inferência: {e}")
+                    models[level.model_complexity] = None
+            pose = models.get(level.model_complexity)
+            reports[level.name] = run_benchmark(session, repeat, display_size, analysis_resolution,
+                                                level.name, contour_path, pose=pose)
+    finally:
+        for pose in models.values():
+            if pose is not None:
+                pose.close()
+
+    reference = reports["high"]
+    ladder_report = {}
+    for name, report in reports.items():
+        comparable = report["inference"] == reference["inference"] and reference["frame"]["mean_ms"] > 0
+        ladder_report[name] = {
+            "frame_mean_ms": report["frame"]["mean_ms"],
+            "relative_cost": round(report["frame"]["mean_ms"] / reference["frame"]["mean_ms"], 2)
+            if comparable else None,
+            "inference": report["inference"],
+        }
+    return ladder_report
+
+
+def print_ladder_report(ladder_report):
+    """Mostra o custo medido de cada nível da escada de qualidade"""
+    print("\n📊 Custo por nível de qualidade (relativo a \"high\")")
+    for name, measurement in ladder_report.items():
+        cost = measurement["relative_cost"]
+        cost_text = f"{cost:5.2f}x" if cost is not None else "    —"
+        note = "" if measurement["inference"] else "  (sem inferência)"
+        print(f"  • {name:<8} {measurement['frame_mean_ms']:7.2f} ms  {cost_text}{note}")
+
+    if len({measurement["inference"] for measurement in ladder_report.values()}) > 1:
+        print("⚠️ Níveis medidos com e sem inferência não são comparáveis")
+        return
+    measured_order = sorted(ladder_report, key=lambda name: ladder_report[name]["frame_mean_ms"], reverse=True)
+    if measured_order != list(ladder_report):
+        print(f"⚠️ Ordem medida difere da escada: {', '.join(measured_order)}")
+
+
+def print_report(report):
+    """Mostra o relatório do benchmark no console"""
+    print(f"\n📊 {report['frames']} frames em {report['elapsed_s']:.2f}s ({report['fps']:.1f} FPS)")
+    print(f"  • Frame: p50 {report['frame']['p50_ms']:.2f} ms, p95 {report['frame']['p95_ms']:.2f} ms, "
+          f"p99 {report['frame']['p99_ms']:.2f} ms")
+    for name, stage in report["stages"].items():
+        print(f"  • {name:<10} p50 {stage['p50_ms']:7.2f} ms  p95 {stage['p95_ms']:7.2f} ms  "
+              f"p99 {stage['p99_ms']:7.2f} ms  ({stage.get('share_percent', 0.0):.1f}%)")
+    print(f"  • Checksum dos resultados: {report['results_checksum'][:16]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark offline do pipeline do VIVA SERGIPE!")
+    parser.add_argument("--landmarks", default=DEFAULT_LANDMARKS_DIR,
+                        help="Pasta com landmarks gravados (.npy)")
+    parser.add_argument("--video", help="Vídeo a reproduzir (detecta a pose com o modelo real)")
+    parser.add_argument("--max-frames", type=int, default=0, help="Limite de frames do vídeo")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetições da sessão")
+    parser.add_argument("--width", type=int, default=1920, help="Largura de exibição")
+    parser.add_argument("--height", type=int, default=1080, help="Altura de exibição")
+    parser.add_argument("--analysis-width", type=int, default=320, help="Largura de análise (0 = exibição)")
+    parser.add_argument("--analysis-height", type=int, default=180, help="Altura de análise (0 = exibição)")
+    parser.add_argument("--quality", choices=[level.name for level in QUALITY_LADDER], default="high")
+    parser.add_argument("--inference", action="store_true",
+                        help="Medir também a inferência do MediaPipe no nível escolhido")
+    parser.add_argument("--quality-ladder", action="store_true",
+                        help="Medir o custo de cada nível da escada de qualidade (com inferência)")
+    parser.add_argument("--output", help="Arquivo JSON para salvar o relatório")
+    args = parser.parse_args()
+
+    print("🎮 VIVA SERGIPE! - Benchmark do Pipeline")
+    print("=" * 50)
+
+    if args.video:
+        session = load_video_session(args.video, args.max_frames)
+    else:
+        session = load_landmark_session(args.landmarks)
+
+    if not session:
+        print("❌ Nenhum frame para reproduzir")
+        return 1
+
+    analysis = None
+    if args.analysis_width > 0 and args.analysis_height > 0:
+        analysis = (args.analysis_width, args.analysis_height)
+
+    if args.quality_ladder:
+        report = measure_quality_ladder(session, args.repeat, (args.width, args.height), analysis)
+        print_ladder_report(report)
+    else:
+        pose = None
+        if args.inference:
+            from utils import initialize_pose_model
+            level = next(level for level in QUALITY_LADDER if level.name == args.quality)
+            pose = initialize_pose_model(model_complexity=level.model_complexity)
+        try:
+            report = run_benchmark(session, args.repeat, (args.width, args.height), analysis, args.quality,
+                                   pose=pose)
+        finally:
+            if pose is not None:
+                pose.close()
+        print_report(report)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"✅ Relatório salvo em: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
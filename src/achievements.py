@@ -4,10 +4,15 @@ Sistema de achievements para motivar e recompensar jogadores
 """
 
 import time
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
 from enum import Enum
 from config_manager import get_config_manager
 
+# Chaves especiais da visão de estatísticas: relógio (hora, mês, dia) e
+# quantidade de conquistas desbloqueadas
+CLOCK_KEY = "__clock__"
+UNLOCKED_KEY = "__unlocked__"
+
 
 class AchievementType(Enum):
     """Tipos de conquistas"""
@@ -18,13 +23,184 @@ class AchievementType(Enum):
     SPECIAL = "special"         # Conquistas especiais/secretas
 
 
+class ThresholdPredicate:
+    """Condição numérica sobre uma ou mais estatísticas (ex: {"games_won": 5})"""
+
+    __slots__ = ("targets", "operator", "keys")
+
+    def __init__(self, targets: Dict[str, Any], operator: str = "greater_equal"):
+        self.targets = tuple(targets.items())
+        self.operator = operator
+        self.keys = frozenset(targets)
+
+    def is_met(self, stats: Dict[str, Any]) -> bool:
+        for key, target_value in self.targets:
+            current_value = stats.get(key, 0)
+
+            if self.operator == 'less_than':
+                if current_value == 0 or current_value >= target_value:
+                    return False
+            elif self.operator == 'greater_equal':
+                if current_value < target_value:
+                    return False
+            elif self.operator == 'equal':
+                if current_value != target_value:
+                    return False
+        return True
+
+    def progress(self, stats: Dict[str, Any]) -> float:
+        total_progress = 0
+        for key, target_value in self.targets:
+            if isinstance(target_value, (int, float)):
+                total_progress += min(100, (stats.get(key, 0) / target_value) * 100)
+        return total_progress / len(self.targets) if self.targets else 0
+
+
+class WinRatePredicate:
+    """Taxa de vitória mínima depois de um número mínimo de jogos"""
+
+    __slots__ = ("win_rate", "min_games")
+
+    keys = frozenset(("games_played", "games_won"))
+
+    def __init__(self, win_rate: float, min_games: int = 1):
+        self.win_rate = win_rate
+        self.min_games = min_games
+
+    def is_met(self, stats: Dict[str, Any]) -> bool:
+        games_played = stats.get('games_played', 0)
+        if games_played < self.min_games:
+            return False
+
+        win_rate = stats.get('games_won', 0) / games_played if games_played > 0 else 0
+        return win_rate >= self.win_rate
+
+    def progress(self, stats: Dict[str, Any]) -> float:
+        games_played = stats.get('games_played', 0)
+        if games_played < self.min_games:
+            return (games_played / self.min_games) * 50  # 50% por ter jogos suficientes
+
+        current_rate = stats.get('games_won', 0) / games_played if games_played > 0 else 0
+        return min(100, (current_rate / self.win_rate) * 100)
+
+
+class TimeRangePredicate:
+    """Jogar em uma faixa de horário (pode atravessar a meia-noite)"""
+
+    __slots__ = ("start_hour", "end_hour")
+
+    keys = frozenset((CLOCK_KEY,))
+
+    def __init__(self, start_hour: int, end_hour: int):
+        self.start_hour = start_hour
+        self.end_hour = end_hour
+
+    def is_met(self, stats: Dict[str, Any]) -> bool:
+        current_hour = stats[CLOCK_KEY][0]
+        if self.start_hour <= self.end_hour:
+            return self.start_hour <= current_hour <= self.end_hour
+        return current_hour >= self.start_hour or current_hour <= self.end_hour  # Atravessa meia-noite
+
+    def progress(self, stats: Dict[str, Any]) -> float:
+        return 0
+
+
+class SpecialDatePredicate:
+    """Jogar em uma data específica"""
+
+    __slots__ = ("month", "day")
+
+    keys = frozenset((CLOCK_KEY,))
+
+    def __init__(self, month: int, day: int):
+        self.month = month
+        self.day = day
+
+    def is_met(self, stats: Dict[str, Any]) -> bool:
+        _, month, day = stats[CLOCK_KEY]
+        return month == self.month and day == self.day
+
+    def progress(self, stats: Dict[str, Any]) -> float:
+        return 0
+
+
+class AllAchievementsPredicate:
+    """Todas as outras conquistas desbloqueadas"""
+
+    __slots__ = ("total",)
+
+    keys = frozenset((UNLOCKED_KEY,))
+
+    def __init__(self, total: int):
+        self.total = total
+
+    def is_met(self, stats: Dict[str, Any]) -> bool:
+        return stats.get(UNLOCKED_KEY, 0) >= self.total
+
+    def progress(self, stats: Dict[str, Any]) -> float:
+        return 0
+
+
+def compile_condition(condition: Dict[str, Any], achievement_count: int):
+    """
+    Converte a condição de uma conquista em um predicado
+
+    Args:
+        condition (Dict[str, Any]): Condição da definição da conquista
+        achievement_count (int): Total de conquistas definidas
+
+    Returns:
+        Predicado com 'keys' (estatísticas lidas), is_met(stats) e progress(stats)
+    """
+    if 'all_achievements' in condition:
+        return AllAchievementsPredicate(achievement_count - 1)
+    if 'time_range' in condition:
+        return TimeRangePredicate(*condition['time_range'])
+    if 'special_date' in condition:
+        return SpecialDatePredicate(*condition['special_date'])
+    if 'win_rate' in condition:
+        return WinRatePredicate(condition['win_rate'], condition.get('min_games', 1))
+
+    targets = {key: value for key, value in condition.items() if key != 'operator'}
+    return ThresholdPredicate(targets, condition.get('operator', 'greater_equal'))
+
+
 class AchievementManager:
-    """Gerenciador de conquistas"""
+    """
+    Gerenciador de conquistas
+
+    As condições são compiladas uma vez em predicados e indexadas pelas
+    estatísticas que leem. As estatísticas ficam em uma cópia própria
+    (não no dicionário da configuração); quando uma chave muda, apenas as
+    conquistas que dependem dela são reavaliadas e têm o progresso recalculado,
+    então verificar conquistas a cada frame é barato.
+    """
     
-    def __init__(self):
-        self.config_manager = get_config_manager()
+    def __init__(self, config_manager=None):
+        """
+        Args:
+            config_manager: Gerenciador de configurações (padrão: instância global)
+        """
+        self.config_manager = config_manager or get_config_manager()
         self.achievements = self._define_achievements()
         self.unlocked_achievements = self._load_unlocked_achievements()
+
+        # Predicados compilados e índice estatística -> conquistas que a leem
+        self._predicates = {
+            achievement_id: compile_condition(achievement['condition'], len(self.achievements))
+            for achievement_id, achievement in self.achievements.items()
+        }
+        self._order = {achievement_id: index for index, achievement_id in enumerate(self.achievements)}
+        self._dependents: Dict[str, List[str]] = {}
+        for achievement_id, predicate in self._predicates.items():
+            for key in predicate.keys:
+                self._dependents.setdefault(key, []).append(achievement_id)
+
+        # Visão das estatísticas, conquistas a reavaliar e progresso em cache
+        self._stats: Dict[str, Any] = {UNLOCKED_KEY: len(self.unlocked_achievements)}
+        self._pending: Set[str] = set(self.achievements)
+        self._progress_cache: Dict[str, float] = {}
+        self.evaluations = 0
         
     def _define_achievements(self) -> Dict[str, Dict[str, Any]]:
         """Define todas as conquistas disponíveis"""
@@ -233,32 +409,68 @@ class AchievementManager:
         """Salva conquistas desbloqueadas"""
         self.config_manager.set('achievements', 'unlocked', self.unlocked_achievements)
     
-    def check_achievements(self, game_data: Optional[Dict[str, Any]] = None) -> List[str]:
+    def _invalidate(self, keys: Iterable[str]):
+        """Marca para reavaliação as conquistas que leem as chaves alteradas"""
+        for key in keys:
+            for achievement_id in self._dependents.get(key, ()):
+                self._pending.add(achievement_id)
+                self._progress_cache.pop(achievement_id, None)
+
+    def _apply_changes(self, changes: Dict[str, Any]):
+        """Aplica mudanças à visão das estatísticas, invalidando só as chaves alteradas"""
+        stats = self._stats
+        changed = [key for key, value in changes.items() if key not in stats or stats[key] != value]
+        for key in changed:
+            stats[key] = changes[key]
+        self._invalidate(changed)
+
+    def _sync_stats(self, game_data: Optional[Dict[str, Any]] = None):
         """
-        Verifica e desbloqueia conquistas baseado no estado atual
-        
+        Sincroniza a visão com as estatísticas salvas, o relógio e os dados do jogo
+
         Args:
             game_data: Dados específicos do jogo atual (opcional)
-            
-        Returns:
-            Lista de conquistas recém-desbloqueadas
         """
-        newly_unlocked = []
-        stats = self.config_manager.config.get('stats', {})
-        
-        # Adicionar dados do jogo atual se fornecidos
+        current = dict(self.config_manager.config.get('stats', {}))
         if game_data:
-            stats.update(game_data)
-        
-        for achievement_id, achievement in self.achievements.items():
-            if achievement_id in self.unlocked_achievements:
-                continue  # Já desbloqueada
-            
-            if self._check_achievement_condition(achievement, stats):
-                self.unlocked_achievements.append(achievement_id)
-                newly_unlocked.append(achievement_id)
-                print(f"🏆 Conquista desbloqueada: {achievement['name']}")
-        
+            current.update(game_data)
+        current[UNLOCKED_KEY] = len(self.unlocked_achievements)
+        current[CLOCK_KEY] = self._clock()
+
+        # Chaves que sumiram (ex: dados do jogo anterior) também contam como mudança
+        removed = [key for key in self._stats if key not in current]
+        for key in removed:
+            del self._stats[key]
+        self._invalidate(removed)
+        self._apply_changes(current)
+
+    @staticmethod
+    def _clock() -> Tuple[int, int, int]:
+        """Hora, mês e dia atuais"""
+        now = time.localtime()
+        return now.tm_hour, now.tm_mon, now.tm_mday
+
+    def _evaluate_pending(self) -> List[str]:
+        """Avalia as conquistas pendentes e desbloqueia as alcançadas"""
+        newly_unlocked = []
+        while self._pending:
+            pending, self._pending = self._pending, set()
+            unlocked_before = len(newly_unlocked)
+
+            for achievement_id in sorted(pending, key=self._order.get):
+                if achievement_id in self.unlocked_achievements:
+                    continue  # Já desbloqueada
+                self.evaluations += 1
+                if self._predicates[achievement_id].is_met(self._stats):
+                    self.unlocked_achievements.append(achievement_id)
+                    self._progress_cache.pop(achievement_id, None)
+                    newly_unlocked.append(achievement_id)
+                    print(f"🏆 Conquista desbloqueada: {self.achievements[achievement_id]['name']}")
+
+            # Novos desbloqueios podem completar conquistas que dependem deles
+            if len(newly_unlocked) > unlocked_before:
+                self._apply_changes({UNLOCKED_KEY: len(self.unlocked_achievements)})
+
         if newly_unlocked:
             self._save_unlocked_achievements()
             
@@ -268,77 +480,38 @@ class AchievementManager:
                 for aid in self.unlocked_achievements
             )
             self.config_manager.set('achievements', 'total_points', total_points)
-        
+
         return newly_unlocked
-    
-    def _check_achievement_condition(self, achievement: Dict[str, Any], 
-                                   stats: Dict[str, Any]) -> bool:
+
+    def check_achievements(self, game_data: Optional[Dict[str, Any]] = None) -> List[str]:
         """
-        Verifica se uma conquista foi alcançada
+        Verifica e desbloqueia conquistas baseado no estado atual
         
         Args:
-            achievement: Dados da conquista
-            stats: Estatísticas do jogador
+            game_data: Dados específicos do jogo atual (opcional)
             
         Returns:
-            True se a conquista foi alcançada
+            Lista de conquistas recém-desbloqueadas
         """
-        condition = achievement['condition']
-        
-        # Conquista especial: todas as outras
-        if 'all_achievements' in condition:
-            other_achievements = [aid for aid in self.achievements.keys() if aid != 'completionist']
-            return all(aid in self.unlocked_achievements for aid in other_achievements)
-        
-        # Conquistas baseadas em horário
-        if 'time_range' in condition:
-            current_hour = time.localtime().tm_hour
-            start_hour, end_hour = condition['time_range']
-            
-            if start_hour <= end_hour:
-                return start_hour <= current_hour <= end_hour
-            else:  # Atravessa meia-noite
-                return current_hour >= start_hour or current_hour <= end_hour
-        
-        # Conquistas baseadas em data especial
-        if 'special_date' in condition:
-            current_date = time.localtime()
-            target_month, target_day = condition['special_date']
-            return current_date.tm_mon == target_month and current_date.tm_mday == target_day
-        
-        # Conquistas baseadas em taxa de vitória
-        if 'win_rate' in condition:
-            games_played = stats.get('games_played', 0)
-            games_won = stats.get('games_won', 0)
-            min_games = condition.get('min_games', 1)
-            
-            if games_played < min_games:
-                return False
-            
-            win_rate = games_won / games_played if games_played > 0 else 0
-            return win_rate >= condition['win_rate']
-        
-        # Conquistas com operadores especiais
-        operator = condition.get('operator', 'greater_equal')
-        
-        for key, target_value in condition.items():
-            if key == 'operator':
-                continue
-            
-            current_value = stats.get(key, 0)
-            
-            if operator == 'less_than':
-                if current_value == 0 or current_value >= target_value:
-                    return False
-            elif operator == 'greater_equal':
-                if current_value < target_value:
-                    return False
-            elif operator == 'equal':
-                if current_value != target_value:
-                    return False
-        
-        return True
-    
+        self._sync_stats(game_data)
+        return self._evaluate_pending()
+
+    def check_stat_changes(self, changes: Dict[str, Any]) -> List[str]:
+        """
+        Verifica conquistas afetadas por mudanças de estatísticas (barato o bastante por frame)
+
+        Apenas as conquistas que leem as chaves alteradas são reavaliadas; as
+        estatísticas salvas na configuração não são modificadas.
+
+        Args:
+            changes: Estatísticas alteradas (ex: {'best_percentage': 42.0})
+
+        Returns:
+            Lista de conquistas recém-desbloqueadas
+        """
+        self._apply_changes(changes)
+        return self._evaluate_pending()
+
     def get_achievement_progress(self) -> Dict[str, Any]:
         """
         Obtém progresso das conquistas
@@ -346,7 +519,7 @@ class AchievementManager:
         Returns:
             Dict com progresso das conquistas
         """
-        stats = self.config_manager.config.get('stats', {})
+        self._sync_stats()
         progress = {}
         
         for achievement_id, achievement in self.achievements.items():
@@ -360,58 +533,25 @@ class AchievementManager:
                 'points': achievement['reward_points'],
                 'unlocked': is_unlocked,
                 'hidden': achievement.get('hidden', False),
-                'progress_percentage': 100 if is_unlocked else self._calculate_progress(achievement, stats)
+                'progress_percentage': 100 if is_unlocked else self._get_progress(achievement_id)
             }
         
         return progress
     
-    def _calculate_progress(self, achievement: Dict[str, Any], 
-                          stats: Dict[str, Any]) -> float:
+    def _get_progress(self, achievement_id: str) -> float:
         """
-        Calcula progresso percentual de uma conquista
+        Obtém o progresso percentual de uma conquista (em cache até suas estatísticas mudarem)
         
         Args:
-            achievement: Dados da conquista
-            stats: Estatísticas do jogador
+            achievement_id: ID da conquista
             
         Returns:
             Progresso percentual (0-100)
         """
-        condition = achievement['condition']
-        
-        # Conquistas especiais não têm progresso linear
-        if any(key in condition for key in ['all_achievements', 'time_range', 'special_date']):
-            return 0
-        
-        # Conquistas baseadas em taxa de vitória
-        if 'win_rate' in condition:
-            games_played = stats.get('games_played', 0)
-            games_won = stats.get('games_won', 0)
-            min_games = condition.get('min_games', 1)
-            target_rate = condition['win_rate']
-            
-            if games_played < min_games:
-                return (games_played / min_games) * 50  # 50% por ter jogos suficientes
-            
-            current_rate = games_won / games_played if games_played > 0 else 0
-            return min(100, (current_rate / target_rate) * 100)
-        
-        # Conquistas baseadas em valores numéricos
-        total_progress = 0
-        condition_count = 0
-        
-        for key, target_value in condition.items():
-            if key == 'operator':
-                continue
-            
-            current_value = stats.get(key, 0)
-            condition_count += 1
-            
-            if isinstance(target_value, (int, float)):
-                progress = min(100, (current_value / target_value) * 100)
-                total_progress += progress
-        
-        return total_progress / condition_count if condition_count > 0 else 0
+        progress = self._progress_cache.get(achievement_id)
+        if progress is None:
+            progress = self._progress_cache[achievement_id] = self._predicates[achievement_id].progress(self._stats)
+        return progress
     
     def get_unlocked_achievements(self) -> List[Dict[str, Any]]:
         """
@@ -462,15 +602,12 @@ class AchievementManager:
         }
 
 
-# Instância global do gerenciador de conquistas
-achievement_manager = AchievementManager()
-
-
 def get_achievement_manager() -> AchievementManager:
     """
-    Obtém a instância global do gerenciador de conquistas
+    Obtém a instância global do gerenciador de conquistas (serviço "achievements")
     
     Returns:
         AchievementManager: Instância do gerenciador
     """
-    return achievement_manager
+    from services import get_service
+    return get_service("achievements")
@@ -3,30 +3,73 @@ SISTEMA DE ANALYTICS - VIVA SERGIPE!
 Sistema opcional de coleta de dados anônimos para melhorar o jogo
 """
 
+import gzip
 import json
+import os
+import shutil
 import time
 import hashlib
 import platform
 import uuid
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import threading
 from config_manager import get_config_manager
+from persistence import atomic_write_text
+
+# Tamanho máximo do log de eventos antes de ser rotacionado
+MAX_LOG_BYTES = 256 * 1024
+
+# Quantidade de segmentos antigos (comprimidos) mantidos
+MAX_LOG_SEGMENTS = 5
+
+
+def _empty_summary() -> Dict[str, Any]:
+    """Agregados zerados das estatísticas locais"""
+    return {
+        'events': 0,
+        'sessions': 0,
+        'playtime': 0.0,
+        'wins': 0,
+        'percentage_sum': 0.0,
+        'achievements': 0,
+        'points': 0,
+    }
 
 
 class AnalyticsManager:
-    """Gerenciador de analytics respeitando privacidade"""
+    """
+    Gerenciador de analytics respeitando privacidade
+
+    Os eventos são acrescentados a um log com um evento JSON por linha
+    (analytics_events.jsonl); quando o log passa de MAX_LOG_BYTES ele é
+    comprimido em um segmento e um novo log é iniciado. Um resumo pequeno
+    (analytics_summary.json) guarda os totais atualizados a cada evento, então
+    gravar custa apenas os eventos novos e as estatísticas locais não dependem
+    do tamanho do histórico.
+    """
     
-    def __init__(self):
+    def __init__(self, data_dir: str = "."):
+        """
+        Args:
+            data_dir (str): Pasta dos arquivos de analytics
+        """
         self.config_manager = get_config_manager()
-        self.analytics_file = Path("analytics_data.json")
+        self.data_dir = Path(data_dir)
+        self.events_file = self.data_dir / "analytics_events.jsonl"
+        self.summary_file = self.data_dir / "analytics_summary.json"
+        self.legacy_file = self.data_dir / "analytics_data.json"
         self.session_id = str(uuid.uuid4())[:8]
         self.session_start = time.time()
         self.events = []
+        self._lock = threading.Lock()
         self.enabled = self._check_analytics_consent()
         
         # Dados anônimos do sistema (apenas para otimização)
         self.system_info = self._get_anonymous_system_info()
+
+        # Totais persistidos das estatísticas locais
+        self.summary = self._load_summary()
         
     def _check_analytics_consent(self) -> bool:
         """Verifica se o usuário consentiu com analytics"""
@@ -97,7 +140,9 @@ class AnalyticsManager:
             'properties': properties or {}
         }
         
-        self.events.append(event)
+        with self._lock:
+            self.events.append(event)
+            self._update_summary(event)
         
         # Salvar eventos periodicamente
         if len(self.events) >= 10:
@@ -202,77 +247,158 @@ class AnalyticsManager:
         
         self.track_event('error_occurred', error_data)
     
-    def _save_events(self):
-        """Salva eventos no arquivo local"""
+    def _update_summary(self, event: Dict[str, Any]):
+        """Atualiza os totais com um evento (O(1))"""
+        summary = self.summary
+        properties = event.get('properties', {})
+        summary['events'] += 1
+
+        if event['event_type'] == 'game_session':
+            summary['sessions'] += 1
+            summary['playtime'] += properties.get('duration', 0)
+            summary['percentage_sum'] += properties.get('percentage', 0)
+            if properties.get('won', False):
+                summary['wins'] += 1
+        elif event['event_type'] == 'achievement_unlocked':
+            summary['achievements'] += 1
+            summary['points'] += properties.get('points', 0)
+
+    def _load_summary(self) -> Dict[str, Any]:
+        """Carrega os totais persistidos (migrando o arquivo antigo, se existir)"""
+        summary = _empty_summary()
+        self.legacy_migrated = False
         try:
-            # Carregar eventos existentes
-            existing_events = []
-            if self.analytics_file.exists():
-                with open(self.analytics_file, 'r', encoding='utf-8') as f:
+            if self.summary_file.exists():
+                with open(self.summary_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    existing_events = data.get('events', [])
-            
-            # Adicionar novos eventos
-            existing_events.extend(self.events)
-            
-            # Manter apenas os últimos 1000 eventos
-            if len(existing_events) > 1000:
-                existing_events = existing_events[-1000:]
-            
-            # Salvar dados
-            analytics_data = {
-                'system_info': self.system_info,
-                'last_updated': time.time(),
-                'events': existing_events
-            }
-            
-            with open(self.analytics_file, 'w', encoding='utf-8') as f:
-                json.dump(analytics_data, f, indent=2)
-            
-            # Limpar eventos da memória
-            self.events = []
-            
-        except Exception as e:
-            print(f"Erro ao salvar analytics: {e}")
+                for key in summary:
+                    summary[key] = data.get('totals', {}).get(key, summary[key])
+                self.legacy_migrated = bool(data.get('legacy_migrated', False))
+        except (OSError, ValueError) as e:
+            print(f"Erro ao carregar resumo de analytics: {e}")
+
+        self.summary = summary
+        if self.legacy_file.exists():
+            self._migrate_legacy_file()
+        return self.summary
+
+    def _migrate_legacy_file(self):
+        """
+        Move os eventos do antigo analytics_data.json para o log de eventos
+
+        A migração pode ser interrompida e repetida sem duplicar nada: os eventos
+        antigos viram um segmento de nome fixo (regravado por inteiro) e o resumo
+        marca que os totais já os incluem antes de o arquivo antigo ser removido.
+        """
+        try:
+            if not self.legacy_migrated:
+                with open(self.legacy_file, 'r', encoding='utf-8') as f:
+                    events = json.load(f).get('events', [])
+                self._write_legacy_segment(events)
+                for event in events:
+                    self._update_summary(event)
+                self.legacy_migrated = True
+                self._write_summary()
+                print(f"📦 {len(events)} eventos de analytics migrados para {self.events_file.name}")
+            self.legacy_file.unlink()
+        except (OSError, ValueError) as e:
+            print(f"Erro ao migrar analytics: {e}")
+
+    def _write_legacy_segment(self, events: List[Dict[str, Any]]):
+        """Grava os eventos antigos como o segmento mais antigo do log (escrita atômica)"""
+        segment = self.data_dir / f"{self.events_file.stem}.{0:014d}.jsonl.gz"
+        temp_path = segment.with_name(segment.name + ".tmp")
+        with gzip.open(temp_path, 'wt', encoding='utf-8') as target:
+            target.writelines(json.dumps(event, separators=(',', ':')) + "\n" for event in events)
+        os.replace(temp_path, segment)
+
+    def _append_events(self, events: List[Dict[str, Any]]):
+        """Acrescenta eventos ao log (uma linha JSON por evento) e rotaciona se necessário"""
+        if not events:
+            return
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        lines = "".join(json.dumps(event, separators=(',', ':')) + "\n" for event in events)
+        with open(self.events_file, 'a', encoding='utf-8') as f:
+            f.write(lines)
+            size = f.tell()
+        if size > MAX_LOG_BYTES:
+            self._rotate_log()
+
+    def _segment_files(self) -> List[Path]:
+        """Segmentos comprimidos do log, do mais antigo para o mais novo"""
+        return sorted(self.data_dir.glob(self.events_file.stem + ".*.jsonl.gz"))
+
+    def _rotate_log(self):
+        """Comprime o log atual em um segmento e descarta os segmentos mais antigos"""
+        segment = self.data_dir / f"{self.events_file.stem}.{int(time.time() * 1000):014d}.jsonl.gz"
+        with open(self.events_file, 'rb') as source, gzip.open(segment, 'wb') as target:
+            shutil.copyfileobj(source, target)
+        self.events_file.unlink()
+
+        for old_segment in self._segment_files()[:-MAX_LOG_SEGMENTS]:
+            old_segment.unlink()
+
+    def _write_summary(self):
+        """Grava os totais (arquivo pequeno, escrita atômica)"""
+        summary_data = {
+            'system_info': self.system_info,
+            'last_updated': time.time(),
+            'totals': self.summary,
+            'legacy_migrated': self.legacy_migrated,
+        }
+        atomic_write_text(str(self.summary_file), json.dumps(summary_data, indent=2))
+
+    def _save_events(self):
+        """Acrescenta os eventos pendentes ao log e grava os totais"""
+        with self._lock:
+            events, self.events = self.events, []
+            try:
+                self._append_events(events)
+                self._write_summary()
+            except Exception as e:
+                print(f"Erro ao salvar analytics: {e}")
     
+    def read_events(self) -> List[Dict[str, Any]]:
+        """
+        Lê todos os eventos gravados (segmentos comprimidos e log atual)
+
+        Returns:
+            List[Dict[str, Any]]: Eventos em ordem de gravação
+        """
+        events = []
+        sources = [gzip.open(segment, 'rt', encoding='utf-8') for segment in self._segment_files()]
+        if self.events_file.exists():
+            sources.append(open(self.events_file, 'r', encoding='utf-8'))
+        for source in sources:
+            with source:
+                events.extend(json.loads(line) for line in source if line.strip())
+        return events
+
     def get_local_statistics(self) -> Dict[str, Any]:
         """
-        Obtém estatísticas locais para o usuário
+        Obtém estatísticas locais para o usuário (a partir dos totais, O(1))
         
         Returns:
             Dict com estatísticas locais
         """
-        try:
-            if not self.analytics_file.exists():
-                return {}
-            
-            with open(self.analytics_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                events = data.get('events', [])
-            
-            # Calcular estatísticas
-            game_sessions = [e for e in events if e['event_type'] == 'game_session']
-            achievements = [e for e in events if e['event_type'] == 'achievement_unlocked']
-            
-            stats = {
-                'total_sessions': len(game_sessions),
-                'total_playtime': sum(s['properties'].get('duration', 0) for s in game_sessions),
-                'win_rate': 0,
-                'avg_percentage': 0,
-                'achievements_unlocked': len(achievements),
-                'total_points': sum(a['properties'].get('points', 0) for a in achievements)
-            }
-            
-            if game_sessions:
-                won_sessions = [s for s in game_sessions if s['properties'].get('won', False)]
-                stats['win_rate'] = len(won_sessions) / len(game_sessions) * 100
-                stats['avg_percentage'] = sum(s['properties'].get('percentage', 0) for s in game_sessions) / len(game_sessions)
-            
-            return stats
-            
-        except Exception as e:
-            print(f"Erro ao calcular estatísticas: {e}")
+        summary = self.summary
+        if summary['events'] == 0:
             return {}
+
+        stats = {
+            'total_sessions': summary['sessions'],
+            'total_playtime': summary['playtime'],
+            'win_rate': 0,
+            'avg_percentage': 0,
+            'achievements_unlocked': summary['achievements'],
+            'total_points': summary['points']
+        }
+
+        if summary['sessions']:
+            stats['win_rate'] = summary['wins'] / summary['sessions'] * 100
+            stats['avg_percentage'] = summary['percentage_sum'] / summary['sessions']
+
+        return stats
     
     def export_data(self, export_path: Path) -> bool:
         """
@@ -285,11 +411,16 @@ class AnalyticsManager:
             True se exportou com sucesso
         """
         try:
-            if not self.analytics_file.exists():
+            if self.events:
+                self._save_events()
+            if not self.summary_file.exists():
                 return False
             
-            with open(self.analytics_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = {
+                'system_info': self.system_info,
+                'totals': self.summary,
+                'events': self.read_events()
+            }
             
             # Adicionar informações de exportação
             export_data = {
@@ -316,11 +447,15 @@ class AnalyticsManager:
             True se deletou com sucesso
         """
         try:
-            if self.analytics_file.exists():
-                self.analytics_file.unlink()
-            
-            # Limpar eventos da memória
-            self.events = []
+            with self._lock:
+                for path in [self.events_file, self.summary_file, self.legacy_file] + self._segment_files():
+                    if path.exists():
+                        path.unlink()
+
+                # Limpar eventos e totais da memória
+                self.events = []
+                self.summary = _empty_summary()
+                self.legacy_migrated = False
             
             # Desabilitar analytics
             self.enabled = False
@@ -359,40 +494,34 @@ class AnalyticsManager:
             self._save_events()
 
 
-# Instância global do gerenciador de analytics
-analytics_manager = AnalyticsManager()
-
-
 def get_analytics_manager() -> AnalyticsManager:
     """
-    Obtém a instância global do gerenciador de analytics
+    Obtém a instância global do gerenciador de analytics (serviço "analytics")
+
+    A sessão é finalizada quando o serviço é parado (SyncManager.shutdown na saída).
     
     Returns:
         AnalyticsManager: Instância do gerenciador
     """
-    return analytics_manager
+    from services import get_service
+    return get_service("analytics")
 
 
 def track_game_start(mode: str):
     """Registra início de jogo"""
-    analytics_manager.track_event('game_start', {'mode': mode})
+    get_analytics_manager().track_event('game_start', {'mode': mode})
 
 
 def track_game_end(mode: str, duration: float, result: Dict[str, Any]):
     """Registra fim de jogo"""
-    analytics_manager.track_game_session(mode, duration, result)
+    get_analytics_manager().track_game_session(mode, duration, result)
 
 
 def track_menu_action(action: str):
     """Registra ação no menu"""
-    analytics_manager.track_feature_usage('menu', action)
+    get_analytics_manager().track_feature_usage('menu', action)
 
 
 def track_config_change(setting: str):
     """Registra mudança de configuração"""
-    analytics_manager.track_feature_usage('config', f'changed_{setting}')
-
-
-# Cleanup automático na saída
-import atexit
-atexit.register(analytics_manager.finalize_session)
+    get_analytics_manager().track_feature_usage('config', f'changed_{setting}')
@@ -0,0 +1,295 @@
+"""
+PRÉ-CARREGAMENTO DE RECURSOS - VIVA SERGIPE!
+Carrega contorno, sons, câmera e modelo de pose em segundo plano enquanto o menu é mostrado
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Raiz do projeto (assets/ e sounds/)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CONTOUR_PATH = os.path.join(PROJECT_ROOT, "assets", "contorno-mapa-SE.png")
+
+# Sons usados durante a partida (nome -> arquivo)
+GAME_SOUNDS = {
+    "confirmation": "sounds/confirmation.mp3",
+    "countdown": "sounds/countdown.mp3",
+    "victory": "sounds/game_over_100.mp3",
+    "game_over": "sounds/game_over_50.mp3",
+    "bye": "sounds/bye.mp3",
+}
+
+# Frames enviados ao modelo de pose para aquecer o grafo
+WARMUP_FRAMES = 3
+
+# Tempo máximo que o jogo espera pelo pré-carregamento antes de carregar por conta própria
+WAIT_TIMEOUT = 10.0
+
+
+class AssetPreloader:
+    """
+    Prepara em uma thread tudo o que a primeira partida precisa.
+
+    As etapas (contorno e suas variantes por resolução, decodificação dos sons,
+    abertura da câmera e aquecimento do modelo de pose com alguns frames vazios
+    do tamanho da inferência) rodam em ordem; a falha de uma etapa não impede
+    as demais e o jogo carrega o que faltar do jeito normal. A câmera e o
+    modelo são entregues ao jogo com take_camera()/take_pose(); o que não for
+    entregue é liberado em shutdown().
+    """
+
+    def __init__(self, resolutions: Iterable[Tuple[int, int]] = (), camera_device: int = 0,
+                 camera_settings: Optional[Dict[str, Any]] = None, model_complexity: int = 0,
+                 prepare_inference_frame: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+                 contour_path: str = CONTOUR_PATH, sounds: Optional[Dict[str, str]] = None,
+                 open_camera: bool = True, warmup_frames: int = WARMUP_FRAMES,
+                 pose_factory: Optional[Callable[[int], Any]] = None):
+        """
+        Args:
+            resolutions (Iterable[Tuple[int, int]]): Resoluções (largura, altura) das variantes do contorno
+            camera_device (int): ID da câmera
+            camera_settings (Optional[Dict[str, Any]]): Configurações da câmera (CameraCapture)
+            model_complexity (int): model_complexity do modelo de pose
+            prepare_inference_frame (Optional[Callable]): Reduz o frame ao tamanho da inferência
+            contour_path (str): Arquivo do contorno de Sergipe
+            sounds (Optional[Dict[str, str]]): Sons a decodificar (nome -> caminho relativo à raiz)
+            open_camera (bool): Abrir a câmera (desligado, o aquecimento usa frames de camera_settings)
+            warmup_frames (int): Frames enviados ao modelo de pose
+            pose_factory (Optional[Callable[[int], Any]]): Cria o modelo a partir da complexidade
+                (padrão: initialize_pose_model)
+        """
+        self.resolutions = list(dict.fromkeys(resolutions))
+        self.camera_device = camera_device
+        self.camera_settings = camera_settings or {}
+        self.model_complexity = model_complexity
+        self.prepare_inference_frame = prepare_inference_frame
+        self.contour_path = contour_path
+        self.sound_files = GAME_SOUNDS if sounds is None else sounds
+        self.open_camera = open_camera
+        self.warmup_frames = warmup_frames
+        self.pose_factory = pose_factory
+
+        self.contour = None
+        self.sounds: Dict[str, Any] = {}
+        self.errors: Dict[str, str] = {}
+        self.timings: Dict[str, float] = {}
+
+        self._camera = None
+        self._pose = None
+        self._steps: List[Tuple[str, Callable[[], None]]] = [
+            ("contorno", self._load_contour),
+            ("câmera", self._open_camera),
+            ("sons", self._load_sounds),
+            ("modelo de pose", self._warm_up_pose),
+        ]
+        self.current_step: Optional[str] = None
+        self.steps_done = 0
+        self.ready = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stopping = False
+
+    @property
+    def total_steps(self) -> int:
+        """Número de etapas do pré-carregamento"""
+        return len(self._steps)
+
+    def start(self):
+        """Inicia o pré-carregamento em segundo plano (uma única vez)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="AssetPreloader", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """Executa as etapas em ordem"""
+        started = time.perf_counter()
+        for name, step in self._steps:
+            if self._stopping:
+                break
+            self.current_step = name
+            step_start = time.perf_counter()
+            try:
+                step()
+            except Exception as e:
+                self.errors[name] = str(e)
+                logger.warning("⚠️ Pré-carregamento de %s falhou: %s", name, e)
+            self.timings[name] = time.perf_counter() - step_start
+            self.steps_done += 1
+
+        self.current_step = None
+        self.ready.set()
+        logger.info("✅ Recursos pré-carregados em %.2f s (%s)", time.perf_counter() - started,
+                    ", ".join(f"{name} {elapsed * 1000:.0f} ms" for name, elapsed in self.timings.items()))
+
+    def _load_contour(self):
+        """Carrega o contorno e prepara as variantes das resoluções usadas pelo jogo"""
+        from sergipe_utils import ContourAsset
+
+        contour = ContourAsset.load(self.contour_path)
+        if contour is None:
+            raise FileNotFoundError(self.contour_path)
+        for width, height in self.resolutions:
+            contour.get(width, height)
+        self.contour = contour
+
+    def _open_camera(self):
+        """Abre a câmera e espera o primeiro frame (exposição e buffers já ajustados)"""
+        if not self.open_camera:
+            return
+        from camera_capture import CameraCapture
+
+        camera = CameraCapture(self.camera_device, self.camera_settings)
+        if not camera.start():
+            raise RuntimeError(f"câmera {self.camera_device} não abriu")
+        camera.read(timeout=2.0)
+        with self._lock:
+            if self._stopping:
+                camera.release()
+                return
+            self._camera = camera
+
+    def _load_sounds(self):
+        """Inicializa o mixer e decodifica os sons da partida"""
+        if not self.sound_files:
+            return
+        import pygame
+
+        pygame.mixer.init()
+        for name, relative_path in self.sound_files.items():
+            self.sounds[name] = pygame.mixer.Sound(os.path.join(PROJECT_ROOT, relative_path))
+
+    def _warm_up_pose(self):
+        """Cria o modelo de pose e processa alguns frames vazios do tamanho da inferência"""
+        if self.pose_factory is not None:
+            pose = self.pose_factory(self.model_complexity)
+        else:
+            from utils import initialize_pose_model
+            pose = initialize_pose_model(model_complexity=self.model_complexity)
+        frame = np.zeros(self._warmup_shape(), dtype=np.uint8)
+        if self.prepare_inference_frame is not None:
+            frame = self.prepare_inference_frame(frame)
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        for _ in range(self.warmup_frames):
+            pose.process(rgb_frame)
+
+        # Os frames vazios não deixam landmarks para o rastreamento; o modelo está pronto
+        with self._lock:
+            if self._stopping:
+                pose.close()
+                return
+            self._pose = pose
+
+    def _warmup_shape(self) -> Tuple[int, int, int]:
+        """Formato dos frames da câmera (o frame real, se a câmera já abriu)"""
+        camera = self._camera
+        if camera is not None:
+            success, frame = camera.read(timeout=1.0)
+            if success:
+                return frame.shape
+        return (self.camera_settings.get("height", 480), self.camera_settings.get("width", 640), 3)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera o pré-carregamento terminar
+
+        Args:
+            timeout (Optional[float]): Tempo máximo de espera (segundos)
+
+        Returns:
+            bool: True se terminou
+        """
+        if self._thread is None:
+            return self.ready.is_set()
+        return self.ready.wait(timeout)
+
+    def take_camera(self):
+        """
+        Entrega a câmera aberta ao jogo (que passa a ser responsável por liberá-la)
+
+        Returns:
+            Optional[CameraCapture]: Câmera aberta, ou None se não foi pré-aberta
+        """
+        with self._lock:
+            camera, self._camera = self._camera, None
+        return camera
+
+    def take_pose(self, model_complexity: Optional[int] = None):
+        """
+        Entrega o modelo de pose aquecido ao jogo (que passa a ser responsável por fechá-lo)
+
+        Args:
+            model_complexity (Optional[int]): Complexidade desejada (None: qualquer)
+
+        Returns:
+            Optional[mediapipe.solutions.pose.Pose]: Modelo aquecido, ou None se não há um compatível
+        """
+        with self._lock:
+            if self._pose is None or (model_complexity is not None and model_complexity != self.model_complexity):
+                return None
+            pose, self._pose = self._pose, None
+        return pose
+
+    def get_sound(self, name: str):
+        """
+        Obtém um som decodificado
+
+        Args:
+            name (str): Nome do som (chave de GAME_SOUNDS)
+
+        Returns:
+            Optional[pygame.mixer.Sound]: Som, ou None se não foi carregado
+        """
+        return self.sounds.get(name)
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Obtém o andamento do pré-carregamento (para o menu)
+
+        Returns:
+            Dict[str, Any]: ready, steps_done, total_steps, current_step e errors
+        """
+        return {
+            "ready": self.ready.is_set(),
+            "steps_done": self.steps_done,
+            "total_steps": self.total_steps,
+            "current_step": self.current_step,
+            "errors": dict(self.errors),
+        }
+
+    def shutdown(self):
+        """Interrompe o pré-carregamento e libera câmera e modelo que não foram entregues"""
+        with self._lock:
+            self._stopping = True
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+
+        camera = self.take_camera()
+        if camera is not None:
+            camera.release()
+        pose = self.take_pose()
+        if pose is not None:
+            pose.close()
+
+
+def get_asset_preloader() -> AssetPreloader:
+    """
+    Obtém o pré-carregador global (serviço "preloader"), iniciando-o se necessário
+
+    Returns:
+        AssetPreloader: Instância do pré-carregador
+    """
+    from services import get_service
+    return get_service("preloader")
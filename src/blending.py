@@ -0,0 +1,118 @@
+"""
+MISTURA DE CAMADAS - VIVA SERGIPE!
+Tintas e sobreposições aplicadas no lugar, apenas onde a máscara ou a ROI estão ativas
+"""
+
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+@lru_cache(maxsize=64)
+def _tint_weights(color: Tuple[int, ...], alpha: float) -> Tuple[float, Tuple[float, float, float, float]]:
+    """
+    Pesos da tinta: frame * (1 - alfa) + cor * alfa
+
+    Args:
+        color (Tuple[int, ...]): Cor da tinta (BGR)
+        alpha (float): Opacidade da tinta
+
+    Returns:
+        Tuple: Escala do frame e deslocamento por canal (escalar do OpenCV)
+    """
+    offset = tuple(float(channel) * alpha for channel in color[:3])
+    return 1.0 - alpha, offset + (0.0,) * (4 - len(offset))
+
+
+def _clip_rect(frame: np.ndarray, rect: Tuple[int, int, int, int]) -> Optional[Tuple[int, int, int, int]]:
+    """Limita o retângulo (x0, y0, x1, y1) ao frame; None se ficar vazio"""
+    height, width = frame.shape[:2]
+    x0, y0, x1, y1 = rect
+    x0, y0 = max(int(x0), 0), max(int(y0), 0)
+    x1, y1 = min(int(x1), width), min(int(y1), height)
+    if x0 >= x1 or y0 >= y1:
+        return None
+    return x0, y0, x1, y1
+
+
+def tint(frame: np.ndarray, color: Tuple[int, ...], alpha: float,
+         mask: Optional[np.ndarray] = None, rect: Optional[Tuple[int, int, int, int]] = None) -> np.ndarray:
+    """
+    Aplica uma tinta translúcida ao frame, no lugar
+
+    Equivale a cv2.addWeighted(frame, 1 - alpha, cor_sólida, alpha, 0), mas sem
+    criar a imagem de cor sólida e percorrendo apenas a ROI e/ou a máscara.
+
+    Args:
+        frame (np.ndarray): Frame BGR (modificado no lugar)
+        color (Tuple[int, ...]): Cor da tinta (BGR)
+        alpha (float): Opacidade da tinta (0.0 a 1.0)
+        mask (Optional[np.ndarray]): Máscara 8 bits do tamanho do frame; só os pixels
+            diferentes de zero recebem a tinta
+        rect (Optional[Tuple[int, int, int, int]]): Região (x0, y0, x1, y1); None para o
+            frame inteiro
+
+    Returns:
+        np.ndarray: O próprio frame
+    """
+    if alpha <= 0:
+        return frame
+
+    if rect is None:
+        rect = (0, 0, frame.shape[1], frame.shape[0])
+    if mask is not None:
+        # Apenas a área ocupada pela máscara precisa ser percorrida
+        mx, my, mw, mh = cv2.boundingRect(mask)
+        rect = (max(rect[0], mx), max(rect[1], my), min(rect[2], mx + mw), min(rect[3], my + mh))
+
+    clipped = _clip_rect(frame, rect)
+    if clipped is None:
+        return frame
+    x0, y0, x1, y1 = clipped
+
+    scale, offset = _tint_weights(tuple(int(channel) for channel in color), float(alpha))
+    roi = frame[y0:y1, x0:x1]
+    if mask is None:
+        cv2.convertScaleAbs(roi, dst=roi, alpha=scale)
+        cv2.add(roi, offset, dst=roi)
+    else:
+        tinted = cv2.convertScaleAbs(roi, alpha=scale)
+        cv2.add(tinted, offset, dst=tinted)
+        cv2.copyTo(tinted, mask[y0:y1, x0:x1], roi)
+    return frame
+
+
+def blend_premultiplied(frame: np.ndarray, premultiplied: np.ndarray, inverse_alpha: np.ndarray,
+                        position: Tuple[int, int]) -> np.ndarray:
+    """
+    Compõe uma camada pré-multiplicada sobre o frame, no lugar
+
+    A camada traz a tabela de pesos por pixel já calculada (alfa invertido),
+    então a composição é frame * (1 - alfa) + cor pré-multiplicada apenas na
+    área da camada que cai dentro do frame.
+
+    Args:
+        frame (np.ndarray): Frame BGR (modificado no lugar)
+        premultiplied (np.ndarray): Cor pré-multiplicada da camada (BGR)
+        inverse_alpha (np.ndarray): 255 * (1 - alfa), com 3 canais
+        position (Tuple[int, int]): Canto superior esquerdo da camada no frame
+
+    Returns:
+        np.ndarray: O próprio frame
+    """
+    height, width = premultiplied.shape[:2]
+    left, top = int(position[0]), int(position[1])
+    clipped = _clip_rect(frame, (left, top, left + width, top + height))
+    if clipped is None:
+        return frame
+    x0, y0, x1, y1 = clipped
+
+    roi = frame[y0:y1, x0:x1]
+    sx0, sy0 = x0 - left, y0 - top
+    sx1, sy1 = sx0 + (x1 - x0), sy0 + (y1 - y0)
+
+    cv2.multiply(roi, inverse_alpha[sy0:sy1, sx0:sx1], dst=roi, scale=1.0 / 255.0)
+    cv2.add(roi, premultiplied[sy0:sy1, sx0:sx1], dst=roi)
+    return frame
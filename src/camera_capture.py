@@ -0,0 +1,245 @@
+"""
+CAPTURA DE CÂMERA - VIVA SERGIPE!
+Captura de frames em thread própria com buffer circular (o frame mais novo vence)
+"""
+
+import cv2
+import numpy as np
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple, Union
+
+
+class CameraCapture:
+    """
+    Captura frames da câmera (ou de um arquivo de vídeo) em uma thread dedicada.
+
+    Os frames são lidos para um anel pré-alocado de buffers. O consumidor sempre
+    recebe o frame mais recente; frames que nunca foram consumidos são contados
+    como descartados. O buffer entregue ao consumidor pertence a ele até a
+    próxima chamada de read(), então pode ser desenhado no lugar. Loops de
+    renderização usam read_latest(), que nunca espera pela câmera; o fim da
+    fonte é indicado por isOpened().
+    """
+
+    def __init__(self, source: Union[int, str] = 0,
+                 camera_settings: Optional[Dict[str, Any]] = None,
+                 ring_size: int = 3, realtime: Optional[bool] = None):
+        """
+        Inicializa a captura
+
+        Args:
+            source (Union[int, str]): ID da câmera ou caminho de um arquivo de vídeo
+            camera_settings (Optional[Dict[str, Any]]): Configurações da câmera
+                (width, height, fps, buffer_size), como as de
+                PerformanceOptimizer.get_optimized_camera_settings()
+            ring_size (int): Número de buffers do anel (mínimo 3)
+            realtime (Optional[bool]): Ler arquivos de vídeo no ritmo do seu FPS.
+                Se None, ativo apenas para arquivos de vídeo
+        """
+        self.source = source
+        self.camera_settings = camera_settings or {}
+        self.ring_size = max(3, ring_size)
+        self.is_file = isinstance(source, str)
+        self.realtime = self.is_file if realtime is None else realtime
+
+        self.capture = None
+        self.capture_thread = None
+        self.running = False
+        self.finished = False
+
+        # Anel de buffers (alocado no primeiro frame)
+        self._ring = [None] * self.ring_size
+        self._ring_ids = [0] * self.ring_size
+        self._latest = -1      # Slot do frame mais recente ainda não consumido
+        self._reading = -1     # Slot em uso pelo consumidor
+        self._condition = threading.Condition()
+
+        # Estatísticas
+        self.frames_captured = 0
+        self.frames_delivered = 0
+        self.frames_dropped = 0
+        self.last_frame_id = 0
+
+    def start(self) -> bool:
+        """
+        Abre a fonte de vídeo e inicia a thread de captura
+
+        Returns:
+            bool: True se a fonte foi aberta com sucesso
+        """
+        if self.running:
+            return True
+
+        self.capture = cv2.VideoCapture(self.source)
+        if not self.capture.isOpened():
+            print(f"❌ Não foi possível abrir a fonte de vídeo: {self.source}")
+            self.capture.release()
+            self.capture = None
+            return False
+
+        if not self.is_file:
+            self.apply_camera_settings(self.camera_settings)
+
+        self.running = True
+        self.finished = False
+        self.capture_thread = threading.Thread(
+            target=self._capture_loop,
+            daemon=True,
+            name="CameraCapture"
+        )
+        self.capture_thread.start()
+        return True
+
+    def apply_camera_settings(self, settings: Dict[str, Any]):
+        """
+        Aplica configurações de resolução, FPS e buffer interno na câmera
+
+        Args:
+            settings (Dict[str, Any]): Configurações (width, height, fps, buffer_size)
+        """
+        if self.capture is None:
+            return
+
+        properties = {
+            "width": cv2.CAP_PROP_FRAME_WIDTH,
+            "height": cv2.CAP_PROP_FRAME_HEIGHT,
+            "fps": cv2.CAP_PROP_FPS,
+            "buffer_size": cv2.CAP_PROP_BUFFERSIZE,
+        }
+        for key, prop in properties.items():
+            if key in settings:
+                # Nem todo backend suporta todas as propriedades
+                self.capture.set(prop, settings[key])
+
+        width = int(self.capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(self.capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        print(f"📷 Câmera configurada: {width}x{height}")
+
+    def _next_write_slot(self) -> int:
+        """Escolhe um slot que não é o mais recente nem o do consumidor"""
+        for slot in range(self.ring_size):
+            if slot != self._latest and slot != self._reading:
+                return slot
+        return 0
+
+    def _capture_loop(self):
+        """Loop da thread de captura"""
+        frame_interval = 0.0
+        if self.realtime:
+            fps = self.capture.get(cv2.CAP_PROP_FPS)
+            frame_interval = 1.0 / fps if fps and fps > 0 else 1.0 / 30
+        next_frame_time = time.time()
+
+        while self.running:
+            with self._condition:
+                slot = self._next_write_slot()
+            buffer = self._ring[slot]
+
+            success, frame = self.capture.read(buffer)
+            if not success:
+                if not self.is_file:
+                    print("❌ Erro ao ler frame da câmera")
+                break
+
+            if frame is not buffer:
+                # Primeiro frame ou mudança de resolução: (re)aloca o slot
+                self._ring[slot] = frame
+
+            with self._condition:
+                if self._latest != -1:
+                    self.frames_dropped += 1
+                self.frames_captured += 1
+                self._ring_ids[slot] = self.frames_captured
+                self._latest = slot
+                self._condition.notify_all()
+
+            if frame_interval:
+                next_frame_time += frame_interval
+                delay = next_frame_time - time.time()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_frame_time = time.time()
+
+        with self._condition:
+            self.finished = True
+            self._condition.notify_all()
+
+    def read(self, timeout: float = 1.0) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Obtém o frame mais recente
+
+        Retorna imediatamente quando há um frame novo. Só espera (até 'timeout')
+        quando o frame mais novo já foi consumido, ou seja, quando não há nada
+        novo para mostrar.
+
+        Args:
+            timeout (float): Tempo máximo de espera por um frame novo (segundos)
+
+        Returns:
+            Tuple[bool, Optional[np.ndarray]]: (sucesso, frame)
+        """
+        with self._condition:
+            if self._latest == -1 and not self.finished:
+                self._condition.wait_for(
+                    lambda: self._latest != -1 or self.finished,
+                    timeout
+                )
+
+            if self._latest == -1:
+                return False, None
+
+            self._reading = self._latest
+            self._latest = -1
+            self.frames_delivered += 1
+            self.last_frame_id = self._ring_ids[self._reading]
+            return True, self._ring[self._reading]
+
+    def read_latest(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Obtém o frame mais recente sem esperar pela câmera
+
+        Sem frame novo, retorna (False, None) na hora: o chamador continua
+        mostrando o frame anterior. Uma câmera lenta ou travada não encerra a
+        leitura; use isOpened() para saber se a fonte terminou.
+
+        Returns:
+            Tuple[bool, Optional[np.ndarray]]: (há frame novo, frame)
+        """
+        return self.read(timeout=0)
+
+    def isOpened(self) -> bool:
+        """
+        Verifica se a captura está ativa (mesma interface de cv2.VideoCapture)
+
+        Returns:
+            bool: True se ainda há frames para ler
+        """
+        return self.capture is not None and (not self.finished or self._latest != -1)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Obtém estatísticas da captura
+
+        Returns:
+            Dict[str, int]: Frames capturados, entregues e descartados
+        """
+        with self._condition:
+            return {
+                "frames_captured": self.frames_captured,
+                "frames_delivered": self.frames_delivered,
+                "frames_dropped": self.frames_dropped,
+            }
+
+    def release(self):
+        """Para a thread de captura e libera a fonte de vídeo"""
+        self.running = False
+        if self.capture_thread and self.capture_thread.is_alive():
+            self.capture_thread.join(timeout=2)
+        if self.capture is not None:
+            self.capture.release()
+            self.capture = None
+        with self._condition:
+            self.finished = True
+            self._condition.notify_all()
@@ -3,19 +3,118 @@ GERENCIADOR DE CONFIGURAÇÕES - VIVA SERGIPE!
 Sistema para salvar e carregar configurações do jogo de forma persistente
 """
 
+import copy
 import json
 import os
-from typing import Dict, Any, Optional
+import threading
+import weakref
+from typing import Dict, Any, Optional, Tuple
+
+from persistence import WriteBehindFile
+
+# Configurações lidas a cada frame: atributo do snapshot -> (seção, chave, tipo)
+SETTINGS_SCHEMA = {
+    "duration": ("game", "duration", int),
+    "win_threshold": ("game", "win_threshold", float),
+    "min_body_pixels": ("game", "min_body_pixels", int),
+    "fullscreen": ("game", "fullscreen", bool),
+    "analysis_width": ("game", "analysis_width", int),
+    "analysis_height": ("game", "analysis_height", int),
+    "camera_mirror": ("visual", "camera_mirror", bool),
+    "landmark_style": ("visual", "landmark_style", str),
+    "show_body_overlay": ("visual", "show_body_overlay", bool),
+    "show_detection_feedback": ("visual", "show_detection_feedback", bool),
+    "show_debug_info": ("visual", "show_debug_info", bool),
+    "scene_analysis_interval": ("visual", "scene_analysis_interval", float),
+    "scene_analysis_background": ("visual", "scene_analysis_background", bool),
+    "pipelined_inference": ("performance", "pipelined_inference", bool),
+    "frame_profiler": ("performance", "frame_profiler", bool),
+}
+
+_SCHEMA_TYPES = {(section, key): value_type for section, key, value_type in SETTINGS_SCHEMA.values()}
+
+
+class SettingsSnapshot:
+    """
+    Cópia imutável e tipada das configurações usadas no loop de renderização.
+
+    Criada por ConfigManager.get_snapshot() e recriada apenas quando alguma
+    configuração muda; 'version' identifica de qual versão ela foi criada.
+    """
+
+    __slots__ = ("version", "analysis_resolution") + tuple(SETTINGS_SCHEMA)
+
+    def __init__(self, version: int, values: Dict[str, Any]):
+        """
+        Args:
+            version (int): Versão das configurações
+            values (Dict[str, Any]): Valor de cada atributo de SETTINGS_SCHEMA (já validado)
+        """
+        for name in SETTINGS_SCHEMA:
+            object.__setattr__(self, name, values[name])
+        object.__setattr__(self, "version", version)
+
+        resolution = None
+        if values["analysis_width"] > 0 and values["analysis_height"] > 0:
+            resolution = (values["analysis_width"], values["analysis_height"])
+        object.__setattr__(self, "analysis_resolution", resolution)
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError("SettingsSnapshot é imutável")
+
+    def __delattr__(self, name: str):
+        raise AttributeError("SettingsSnapshot é imutável")
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in SETTINGS_SCHEMA)
+        return f"SettingsSnapshot(version={self.version}, {values})"
+
+
+def _coerce_value(value: Any, value_type: type) -> Any:
+    """
+    Converte um valor para o tipo da configuração
+
+    Raises:
+        ValueError: Se o valor não puder ser convertido
+    """
+    if value_type is bool:
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, (int, float)):
+            return bool(value)
+        if isinstance(value, str) and value.strip().lower() in ("true", "1", "yes", "sim", "on"):
+            return True
+        if isinstance(value, str) and value.strip().lower() in ("false", "0", "no", "nao", "não", "off"):
+            return False
+        raise ValueError(f"valor booleano inválido: {value!r}")
+    if value_type is int:
+        if isinstance(value, bool):
+            raise ValueError(f"valor inteiro inválido: {value!r}")
+        return int(float(value))
+    if value_type is float:
+        if isinstance(value, bool):
+            raise ValueError(f"valor numérico inválido: {value!r}")
+        return float(value)
+    if not isinstance(value, str):
+        raise ValueError(f"texto inválido: {value!r}")
+    return value
+
+
+# Gerenciadores vivos: ao carregar um arquivo, mudanças pendentes de outro
+# gerenciador do mesmo arquivo são gravadas antes
+_managers = weakref.WeakSet()
+
 
 class ConfigManager:
     """Gerenciador de configurações do jogo"""
     
-    def __init__(self, config_file: str = "config.json"):
+    def __init__(self, config_file: str = "config.json", flush_delay: float = 0.5):
         """
         Inicializa o gerenciador de configurações
         
         Args:
             config_file (str): Caminho para o arquivo de configuração
+            flush_delay (float): Tempo sem mudanças (segundos) antes de gravar o arquivo
         """
         self.config_file = config_file
         self.default_config = {
@@ -26,6 +125,8 @@ class ConfigManager:
                 "min_body_pixels": 1000,  # Mínimo de pixels do corpo para detecção válida
                 "fullscreen": True,  # Iniciar em tela cheia
                 "auto_save_photos": True,  # Salvar fotos automaticamente
+                "analysis_width": 320,   # Largura da resolução de análise (0 = resolução da tela)
+                "analysis_height": 180,  # Altura da resolução de análise (0 = resolução da tela)
             },
             
             # Configurações de áudio
@@ -45,6 +146,12 @@ class ConfigManager:
                 "show_timer": True,           # Mostrar timer
                 "show_progress_bar": True,    # Mostrar barra de progresso
                 "camera_mirror": True,        # Espelhar câmera
+                "landmark_style": "enhanced",  # Estilo dos landmarks: enhanced, classic ou none
+                "show_body_overlay": False,    # Mostrar a máscara do corpo (depuração)
+                "show_detection_feedback": True,  # Mostrar indicador de qualidade da detecção
+                "show_debug_info": False,      # Mostrar FPS e métricas na tela
+                "scene_analysis_interval": 0.5,       # Intervalo (s) da análise de iluminação/contraste
+                "scene_analysis_background": False,   # Analisar a cena em uma thread separada
             },
             
             # Configurações da câmera
@@ -55,6 +162,20 @@ class ConfigManager:
                 "fps": 30,             # Frames por segundo
             },
             
+            # Configurações de performance
+            "performance": {
+                "pipelined_inference": True,  # Detecção de pose em thread própria, em paralelo com a renderização
+                "frame_profiler": True,       # Medir o tempo de cada estágio do frame (relatório em config/frame_profile.json)
+            },
+            
+            # Configurações de log
+            "logging": {
+                "level": "INFO",            # Nível geral (DEBUG, INFO, WARNING, ERROR)
+                "modules": {},              # Níveis por módulo (ex: {"sergipe_utils": "DEBUG"})
+                "rate_limit_interval": 5.0, # Intervalo mínimo entre mensagens repetidas (segundos)
+                "file": "",                 # Arquivo de log (vazio = apenas console)
+            },
+            
             # Configurações de interface
             "interface": {
                 "language": "pt-BR",   # Idioma da interface
@@ -74,8 +195,18 @@ class ConfigManager:
             }
         }
         
+        # Versão das configurações: incrementada a cada mudança (ver get_snapshot)
+        self.version = 0
+        self._snapshot = None
+
+        # Mudanças são gravadas em segundo plano, agrupadas e de forma atômica
+        self._lock = threading.RLock()
+        self._writer = WriteBehindFile(config_file, self._serialize, flush_delay, lock=self._lock)
+
         # Carrega configurações existentes ou cria arquivo padrão
         self.config = self.load_config()
+        self._validate_config()
+        _managers.add(self)
     
     def load_config(self) -> Dict[str, Any]:
         """
@@ -84,6 +215,12 @@ class ConfigManager:
         Returns:
             Dict[str, Any]: Dicionário com as configurações
         """
+        # Grava antes o que outro gerenciador do mesmo arquivo ainda não gravou
+        config_path = os.path.abspath(self.config_file)
+        for manager in list(_managers):
+            if manager is not self and os.path.abspath(manager.config_file) == config_path:
+                manager.flush()
+
         try:
             if os.path.exists(self.config_file):
                 with open(self.config_file, 'r', encoding='utf-8') as f:
@@ -96,16 +233,16 @@ class ConfigManager:
             else:
                 print(f"📄 Arquivo de configuração não encontrado. Criando {self.config_file} com valores padrão.")
                 self.save_config(self.default_config)
-                return self.default_config.copy()
+                return copy.deepcopy(self.default_config)
                 
         except Exception as e:
             print(f"❌ Erro ao carregar configurações: {e}")
             print("🔄 Usando configurações padrão.")
-            return self.default_config.copy()
+            return copy.deepcopy(self.default_config)
     
     def save_config(self, config: Optional[Dict[str, Any]] = None) -> bool:
         """
-        Salva configurações no arquivo JSON
+        Salva configurações no arquivo JSON imediatamente (escrita atômica)
         
         Args:
             config (Optional[Dict[str, Any]]): Configurações para salvar. Se None, usa self.config
@@ -114,17 +251,49 @@ class ConfigManager:
             bool: True se salvou com sucesso, False caso contrário
         """
         try:
-            config_to_save = config if config is not None else self.config
-            
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config_to_save, f, indent=4, ensure_ascii=False)
-            
-            print(f"💾 Configurações salvas em {self.config_file}")
-            return True
-            
-        except Exception as e:
+            with self._lock:
+                text = self._serialize(config)
+        except (TypeError, ValueError) as e:
             print(f"❌ Erro ao salvar configurações: {e}")
             return False
+
+        if not self._writer.write_now(text):
+            print(f"❌ Erro ao salvar configurações em {self.config_file}")
+            return False
+
+        print(f"💾 Configurações salvas em {self.config_file}")
+        return True
+
+    def _serialize(self, config: Optional[Dict[str, Any]] = None) -> str:
+        """Gera o JSON das configurações (chamado com o lock adquirido)"""
+        return json.dumps(config if config is not None else self.config, indent=4, ensure_ascii=False)
+
+    def schedule_save(self):
+        """Marca as configurações como alteradas; a gravação é feita em segundo plano"""
+        self._writer.mark_dirty()
+
+    def flush(self) -> bool:
+        """
+        Grava agora as mudanças pendentes (se houver)
+
+        Returns:
+            bool: True se o arquivo está em dia
+        """
+        return self._writer.flush()
+
+    def shutdown(self):
+        """Para a gravação em segundo plano e grava as mudanças pendentes"""
+        self._writer.shutdown()
+
+    @property
+    def dirty(self) -> bool:
+        """True se há mudanças ainda não gravadas"""
+        return self._writer.dirty
+
+    @property
+    def writes(self) -> int:
+        """Número de gravações do arquivo feitas por este gerenciador"""
+        return self._writer.writes
     
     def get(self, section: str, key: str, default: Any = None) -> Any:
         """
@@ -151,19 +320,21 @@ class ConfigManager:
             section (str): Seção da configuração
             key (str): Chave da configuração
             value (Any): Valor para definir
-            save (bool): Se deve salvar automaticamente no arquivo
+            save (bool): Se deve salvar no arquivo (em segundo plano, agrupado com outras mudanças)
             
         Returns:
             bool: True se definiu com sucesso
         """
         try:
-            if section not in self.config:
-                self.config[section] = {}
-            
-            self.config[section][key] = value
+            with self._lock:
+                if section not in self.config:
+                    self.config[section] = {}
+                
+                self.config[section][key] = self._coerce(section, key, value)
+                self.version += 1
             
             if save:
-                return self.save_config()
+                self.schedule_save()
             
             return True
             
@@ -184,6 +355,24 @@ class ConfigManager:
             'min_body_pixels': self.get('game', 'min_body_pixels', 1000),
         }
     
+    def get_analysis_resolution(self) -> Optional[Tuple[int, int]]:
+        """
+        Obtém a resolução fixa usada para criar a máscara corporal e calcular o preenchimento
+        
+        Returns:
+            Optional[Tuple[int, int]]: (largura, altura) de análise, ou None para usar a resolução da tela
+        """
+        try:
+            width = int(self.get('game', 'analysis_width', 320))
+            height = int(self.get('game', 'analysis_height', 180))
+        except (TypeError, ValueError):
+            return (320, 180)
+        
+        if width <= 0 or height <= 0:
+            return None
+        
+        return (width, height)
+    
     def update_game_settings(self, settings: Dict[str, Any], save: bool = True) -> bool:
         """
         Atualiza configurações do jogo
@@ -200,7 +389,7 @@ class ConfigManager:
                 self.set('game', key, value, save=False)
             
             if save:
-                return self.save_config()
+                self.schedule_save()
             
             return True
             
@@ -220,16 +409,18 @@ class ConfigManager:
             bool: True se restaurou com sucesso
         """
         try:
-            if section is None:
-                self.config = self.default_config.copy()
-            else:
-                if section in self.default_config:
-                    self.config[section] = self.default_config[section].copy()
+            with self._lock:
+                if section is None:
+                    self.config = copy.deepcopy(self.default_config)
                 else:
-                    return False
+                    if section in self.default_config:
+                        self.config[section] = copy.deepcopy(self.default_config[section])
+                    else:
+                        return False
+                self.version += 1
             
             if save:
-                return self.save_config()
+                self.schedule_save()
             
             return True
             
@@ -248,7 +439,7 @@ class ConfigManager:
         Returns:
             Dict[str, Any]: Configurações mescladas
         """
-        result = default.copy()
+        result = copy.deepcopy(default)
         
         for section, values in loaded.items():
             if section in result and isinstance(values, dict):
@@ -258,6 +449,55 @@ class ConfigManager:
         
         return result
     
+    def _coerce(self, section: str, key: str, value: Any) -> Any:
+        """
+        Valida e converte um valor das configurações lidas a cada frame
+
+        Valores inválidos são substituídos pelo padrão; chaves fora de
+        SETTINGS_SCHEMA são mantidas como estão.
+
+        Args:
+            section (str): Seção da configuração
+            key (str): Chave da configuração
+            value (Any): Valor recebido
+
+        Returns:
+            Any: Valor convertido para o tipo da configuração
+        """
+        value_type = _SCHEMA_TYPES.get((section, key))
+        if value_type is None:
+            return value
+
+        try:
+            return _coerce_value(value, value_type)
+        except (TypeError, ValueError) as e:
+            default = self.default_config[section][key]
+            print(f"⚠️ Configuração inválida {section}.{key} ({e}); usando {default!r}")
+            return default
+
+    def _validate_config(self):
+        """Valida e converte uma vez, no carregamento, as configurações lidas a cada frame"""
+        for section, key, _ in SETTINGS_SCHEMA.values():
+            values = self.config.setdefault(section, {})
+            values[key] = self._coerce(section, key, values.get(key, self.default_config[section][key]))
+
+    def get_snapshot(self) -> SettingsSnapshot:
+        """
+        Obtém o snapshot imutável das configurações lidas a cada frame
+
+        O snapshot só é recriado quando alguma configuração mudou; o loop de
+        renderização pode chamar este método a cada frame (ou comparar
+        'version' com a do snapshot que já tem) e ler atributos simples.
+
+        Returns:
+            SettingsSnapshot: Configurações da versão atual
+        """
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.version != self.version:
+            values = {name: self.config[section][key] for name, (section, key, _) in SETTINGS_SCHEMA.items()}
+            snapshot = self._snapshot = SettingsSnapshot(self.version, values)
+        return snapshot
+
     def update_stats(self, **kwargs) -> bool:
         """
         Atualiza estatísticas do jogador
@@ -287,7 +527,8 @@ class ConfigManager:
                     else:
                         self.set('stats', key, value, save=False)
             
-            return self.save_config()
+            self.schedule_save()
+            return True
             
         except Exception as e:
             print(f"❌ Erro ao atualizar estatísticas: {e}")
@@ -0,0 +1,263 @@
+"""
+PROFILER DE FRAMES - VIVA SERGIPE!
+Mede o tempo de cada estágio do loop do jogo com histogramas de latência
+"""
+
+import bisect
+import json
+import math
+import os
+import platform
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+import psutil
+
+# Limites dos buckets (ms): escala logarítmica de 0.01 ms a 10 s, ~12% por bucket
+BUCKET_COUNT = 120
+BUCKET_MIN_MS = 0.01
+BUCKET_MAX_MS = 10000.0
+BUCKET_BOUNDS_MS = [
+    BUCKET_MIN_MS * (BUCKET_MAX_MS / BUCKET_MIN_MS) ** (i / (BUCKET_COUNT - 1))
+    for i in range(BUCKET_COUNT)
+]
+
+# Relatório salvo ao lado de config/system_report.json
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_REPORT_PATH = os.path.join(PROJECT_ROOT, "config", "frame_profile.json")
+
+
+class LatencyHistogram:
+    """Histograma de latência com buckets fixos em escala logarítmica"""
+
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.counts = [0] * (BUCKET_COUNT + 1)  # Último bucket: acima de BUCKET_MAX_MS
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, value_ms: float):
+        """
+        Registra uma amostra
+
+        Args:
+            value_ms (float): Latência em milissegundos
+        """
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS_MS, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def percentile(self, percent: float) -> float:
+        """
+        Estima um percentil pelo limite superior do bucket correspondente
+
+        Args:
+            percent (float): Percentil (0-100)
+
+        Returns:
+            float: Latência em milissegundos (0.0 sem amostras)
+        """
+        if self.count == 0:
+            return 0.0
+
+        target = max(1, math.ceil(self.count * percent / 100.0))
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= target:
+                if index >= BUCKET_COUNT:
+                    return self.max_ms
+                return min(BUCKET_BOUNDS_MS[index], self.max_ms)
+        return self.max_ms
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Resumo do histograma
+
+        Returns:
+            Dict[str, float]: Contagem, média, p50, p95, p99 e máximo (ms)
+        """
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "p99_ms": round(self.percentile(99), 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class FrameProfiler:
+    """
+    Profiler por estágio do loop do jogo.
+
+    Uso no loop: begin_frame() no início do frame, lap('estágio') ao fim de cada
+    estágio (o tempo desde a marca anterior é atribuído ao estágio) e
+    end_frame() no fim. Estágios repetidos no mesmo frame são somados.
+    """
+
+    def __init__(self, enabled: bool = True):
+        """
+        Args:
+            enabled (bool): Se False, todas as chamadas retornam sem medir
+        """
+        self.enabled = enabled
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.frame_histogram = LatencyHistogram()
+        self.started_at = datetime.now()
+
+        self._frame_start = None
+        self._last_mark = None
+        self._frame_totals: Dict[str, float] = {}
+
+    def begin_frame(self):
+        """Marca o início de um frame"""
+        if not self.enabled:
+            return
+        self._frame_start = self._last_mark = time.perf_counter()
+        self._frame_totals.clear()
+
+    def lap(self, stage: str):
+        """
+        Atribui o tempo desde a última marca ao estágio informado
+
+        Args:
+            stage (str): Nome do estágio (ex: 'capture', 'inference')
+        """
+        if not self.enabled or self._last_mark is None:
+            return
+        now = time.perf_counter()
+        self._frame_totals[stage] = self._frame_totals.get(stage, 0.0) + (now - self._last_mark)
+        self._last_mark = now
+
+    def skip(self):
+        """Descarta o tempo desde a última marca (ex: espera fora do frame)"""
+        if self.enabled and self._last_mark is not None:
+            self._last_mark = time.perf_counter()
+
+    @contextmanager
+    def stage(self, stage: str):
+        """
+        Mede um bloco como estágio
+
+        Args:
+            stage (str): Nome do estágio
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def record(self, stage: str, seconds: float):
+        """
+        Registra diretamente uma amostra de um estágio
+
+        Args:
+            stage (str): Nome do estágio
+            seconds (float): Duração em segundos
+        """
+        if not self.enabled:
+            return
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            histogram = self.histograms[stage] = LatencyHistogram()
+        histogram.add(seconds * 1000.0)
+
+    def end_frame(self):
+        """Registra os estágios e o tempo total do frame atual"""
+        if not self.enabled or self._frame_start is None:
+            return
+        now = time.perf_counter()
+        for stage, seconds in self._frame_totals.items():
+            self.record(stage, seconds)
+        self.frame_histogram.add((now - self._frame_start) * 1000.0)
+        self._frame_start = self._last_mark = None
+
+    def get_report(self) -> Dict[str, Any]:
+        """
+        Gera o relatório de latência por estágio
+
+        Returns:
+            Dict com informações do sistema, do frame e de cada estágio
+        """
+        frame = self.frame_histogram.summary()
+        stages = {name: histogram.summary() for name, histogram in self.histograms.items()}
+
+        # Participação de cada estágio no tempo total dos frames
+        if self.frame_histogram.total_ms > 0:
+            for name, histogram in self.histograms.items():
+                stages[name]["share_percent"] = round(
+                    histogram.total_ms / self.frame_histogram.total_ms * 100.0, 1
+                )
+
+        return {
+            "generated_at": datetime.now().isoformat(),
+            "started_at": self.started_at.isoformat(),
+            "system": {
+                "hostname": platform.node(),
+                "platform": platform.platform(),
+                "processor": platform.processor(),
+                "cpu_cores": psutil.cpu_count(logical=False),
+                "ram_gb": round(psutil.virtual_memory().total / (1024 ** 3), 1),
+            },
+            "frame": frame,
+            "stages": stages,
+        }
+
+    def save_report(self, path: Optional[str] = None) -> bool:
+        """
+        Salva o relatório em JSON
+
+        Args:
+            path (Optional[str]): Caminho do arquivo (padrão: config/frame_profile.json)
+
+        Returns:
+            bool: True se salvou com sucesso
+        """
+        if not self.enabled or self.frame_histogram.count == 0:
+            return False
+
+        path = path or DEFAULT_REPORT_PATH
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.get_report(), f, indent=2, ensure_ascii=False)
+            print(f"⏱️ Relatório de frames salvo em: {path}")
+            return True
+        except Exception as e:
+            print(f"❌ Erro ao salvar relatório de frames: {e}")
+            return False
+
+    def reset(self):
+        """Descarta todas as amostras"""
+        self.histograms.clear()
+        self.frame_histogram = LatencyHistogram()
+        self.started_at = datetime.now()
+        self._frame_start = self._last_mark = None
+        self._frame_totals.clear()
+
+
+# Instância global do profiler
+frame_profiler = FrameProfiler()
+
+
+def get_frame_profiler() -> FrameProfiler:
+    """
+    Obtém a instância global do profiler de frames
+
+    Returns:
+        FrameProfiler: Instância do profiler
+    """
+    return frame_profiler
@@ -1,6 +1,6 @@
 """
 CONTROLADOR DO JOGO VIVA SERGIPE!
-Sistema para coordenar menu PyQt e jogo OpenCV
+Sistema para coordenar menu PyQt e jogo OpenCV (mostrado na mesma aplicação Qt)
 """
 
 import threading
@@ -8,7 +8,7 @@ import time
 import queue
 import os
 from enum import Enum
-from sync_manager import get_sync_manager
+from services import get_service_registry
 
 class GameState(Enum):
     MENU = "menu"
@@ -28,6 +28,9 @@ class GameController:
         self.menu_thread = None
         self.running = True
 
+        # O jogo em background só começa a carregar depois que o menu aparece
+        self.menu_shown = threading.Event()
+
         # Resultados do jogo
         self.last_fill_percentage = 0.0
         self.game_won = False
@@ -36,6 +39,10 @@ class GameController:
         """Inicia o controlador"""
         print("Iniciando Game Controller...")
 
+        # Serviços criados na thread principal (handlers de sinais do SyncManager)
+        self.services = get_service_registry()
+        self.services.get("sync")
+
         # Inicia o jogo em background (invisível)
         self.game_thread = threading.Thread(target=self._run_game_background, daemon=True)
         self.game_thread.start()
@@ -45,6 +52,8 @@ class GameController:
 
     def _run_game_background(self):
         """Executa o jogo em background"""
+        # Importar o jogo (MediaPipe, pygame, câmera) disputaria a CPU com a abertura do menu
+        self.menu_shown.wait(timeout=5.0)
         from sergipe_game_headless import run_game_headless
         run_game_headless(self.command_queue, self.result_queue)
 
@@ -59,11 +68,8 @@ class GameController:
                     self._exit_game()
 
             elif self.state == GameState.PLAYING:
-                # Aguarda resultado do jogo
-                self._wait_for_game_result()
-                # Pequeno delay para não sobrecarregar
-                import time
-                time.sleep(0.1)
+                # Mostra o jogo até a partida terminar e lê o resultado
+                self._play_game()
 
             elif self.state == GameState.GAME_OVER or self.state == GameState.VICTORY:
                 print(f"Mostrando menu pós-jogo - Estado: {self.state}")
@@ -83,7 +89,7 @@ class GameController:
     def _show_main_menu(self):
         """Mostra menu principal"""
         from menu_gui import show_main_menu
-        return show_main_menu()
+        return show_main_menu(on_shown=self.menu_shown.set)
 
     def _show_post_game_menu(self):
         """Mostra menu pós-jogo"""
@@ -100,8 +106,22 @@ class GameController:
         print("Iniciando jogo...")
         self.state = GameState.PLAYING
 
-        # Envia comando para mostrar jogo
-        self.command_queue.put({"action": "show_game"})
+    def _play_game(self):
+        """Mostra a tela do jogo (na thread da interface) enquanto a partida roda"""
+        from menu_gui import get_game_view, show_game_view
+        view = get_game_view()
+
+        # Envia comando para mostrar jogo quando a tela já está visível
+        show_game_view(
+            view,
+            on_shown=lambda: self.command_queue.put({"action": "show_game", "view": view}),
+            is_running=self.game_thread.is_alive,
+        )
+        self._wait_for_game_result()
+
+        if self.state == GameState.PLAYING and not self.game_thread.is_alive():
+            print("Erro: o jogo parou sem enviar o resultado")
+            self.state = GameState.MENU
 
     def _wait_for_game_result(self):
         """Aguarda resultado do jogo sem bloquear o menu"""
@@ -133,6 +153,13 @@ class GameController:
         self.running = False
         self.command_queue.put({"action": "exit"})
 
+        # O jogo em background grava as estatísticas antes de os serviços pararem
+        if self.game_thread is not None:
+            self.game_thread.join(timeout=3.0)
+
+        # Para os processos e os serviços (monitoramento, gravação das configurações, analytics)
+        self.services.shutdown()
+
 
 def main():
     """Função principal"""
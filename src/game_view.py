@@ -0,0 +1,175 @@
+"""
+TELA DO JOGO - VIVA SERGIPE!
+Mostra os frames do jogo (arrays NumPy BGR) em um widget Qt, sem cópia e no ritmo da tela
+"""
+
+import queue
+import threading
+from typing import Optional
+
+import numpy as np
+from PyQt5.QtCore import Qt, QTimer, QRect, pyqtSignal
+from PyQt5.QtGui import QImage, QPainter
+from PyQt5.QtWidgets import QApplication, QWidget
+
+# QImage lê o BGR do OpenCV diretamente a partir do Qt 5.14; antes disso é preciso converter
+BGR_FORMAT = getattr(QImage, "Format_BGR888", None)
+
+# Código devolvido por read_key() quando nenhuma tecla foi pressionada (como cv2.waitKey() & 0xFF)
+NO_KEY = 255
+
+# Frequência usada quando a tela não informa a sua
+DEFAULT_REFRESH_RATE = 60.0
+
+
+class GameView(QWidget):
+    """
+    Tela do jogo.
+
+    A thread do jogo entrega cada frame pronto com present(); um QTimer na
+    thread da interface, no ritmo da tela, mostra o frame mais recente (os
+    intermediários são descartados). O QImage aponta para o buffer do próprio
+    array, sem cópia: depois de present() o jogo não deve mais alterar o frame.
+    As teclas pressionadas ficam em uma fila lida com read_key(), no lugar de
+    cv2.waitKey().
+    """
+
+    finished = pyqtSignal()
+
+    def __init__(self, refresh_rate: Optional[float] = None):
+        """
+        Args:
+            refresh_rate (Optional[float]): Frequência de atualização em Hz (padrão: a da tela)
+        """
+        super().__init__()
+        self.setWindowTitle("VIVA SERGIPE!")
+        self.setWindowFlags(Qt.FramelessWindowHint)
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+
+        self._lock = threading.Lock()
+        self._pending: Optional[np.ndarray] = None
+        self._frame: Optional[np.ndarray] = None
+        self._image: Optional[QImage] = None
+        self._keys: "queue.Queue[int]" = queue.Queue()
+
+        self.frames_presented = 0
+        self.frames_shown = 0
+
+        if refresh_rate is None:
+            screen = QApplication.primaryScreen()
+            refresh_rate = screen.refreshRate() if screen is not None else 0.0
+        self.refresh_rate = refresh_rate if refresh_rate > 0 else DEFAULT_REFRESH_RATE
+
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.setInterval(max(1, int(1000 / self.refresh_rate)))
+        self.timer.timeout.connect(self.refresh)
+
+        # finish() pode ser chamado da thread do jogo; o sinal chega na thread da interface
+        self.finished.connect(self.hide)
+
+    def present(self, frame: np.ndarray):
+        """
+        Entrega um frame para ser mostrado (qualquer thread)
+
+        Args:
+            frame (np.ndarray): Frame BGR (uint8); passa a pertencer à tela
+        """
+        with self._lock:
+            self._pending = frame
+            self.frames_presented += 1
+
+    def refresh(self):
+        """Mostra o frame mais recente entregue desde a última atualização"""
+        with self._lock:
+            frame, self._pending = self._pending, None
+        if frame is None:
+            return
+
+        self._set_frame(frame)
+        self.frames_shown += 1
+        self.update()
+
+    def _set_frame(self, frame: np.ndarray):
+        """Cria o QImage sobre o buffer do frame (mantido vivo enquanto o QImage é usado)"""
+        frame = np.ascontiguousarray(frame)
+        height, width = frame.shape[:2]
+        if BGR_FORMAT is not None:
+            image = QImage(frame.data, width, height, frame.strides[0], BGR_FORMAT)
+        else:
+            image = QImage(frame.data, width, height, frame.strides[0], QImage.Format_RGB888).rgbSwapped()
+        self._frame = frame
+        self._image = image
+
+    @property
+    def image(self) -> Optional[QImage]:
+        """Imagem mostrada atualmente"""
+        return self._image
+
+    def paintEvent(self, event):
+        """Desenha o frame atual ocupando a tela (mantendo a proporção)"""
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), Qt.black)
+        if self._image is not None:
+            size = self._image.size().scaled(self.size(), Qt.KeepAspectRatio)
+            target = QRect(0, 0, size.width(), size.height())
+            target.moveCenter(self.rect().center())
+            painter.drawImage(target, self._image)
+        painter.end()
+
+    def keyPressEvent(self, event):
+        """Guarda a tecla pressionada para a thread do jogo"""
+        text = event.text()
+        if len(text) == 1:
+            self._keys.put(ord(text) & 0xFF)
+        else:
+            super().keyPressEvent(event)
+
+    def closeEvent(self, event):
+        """Fechar a janela durante a partida equivale a pressionar ESC"""
+        if self.timer.isActive():
+            self._keys.put(27)
+            event.ignore()
+        else:
+            super().closeEvent(event)
+
+    def read_key(self, timeout: float = 0.0) -> int:
+        """
+        Obtém a próxima tecla pressionada (thread do jogo)
+
+        Args:
+            timeout (float): Tempo máximo de espera por uma tecla (segundos; 0 não espera)
+
+        Returns:
+            int: Código da tecla, ou NO_KEY se nenhuma foi pressionada
+        """
+        try:
+            if timeout > 0:
+                return self._keys.get(timeout=timeout)
+            return self._keys.get_nowait()
+        except queue.Empty:
+            return NO_KEY
+
+    def start(self):
+        """Prepara uma partida: descarta frames e teclas antigos e passa a atualizar a tela"""
+        with self._lock:
+            self._pending = None
+        self._frame = None
+        self._image = None
+        while self.read_key() != NO_KEY:
+            pass
+        self.timer.start()
+
+    def stop(self):
+        """Para de atualizar a tela"""
+        self.timer.stop()
+
+    def finish(self):
+        """Encerra a partida mostrada (qualquer thread): a tela é escondida"""
+        self.finished.emit()
+
+    def hideEvent(self, event):
+        """Escondida, a tela não é mais atualizada"""
+        self.stop()
+        super().hideEvent(event)
@@ -0,0 +1,209 @@
+"""
+COMPOSITOR DO HUD - VIVA SERGIPE!
+Camadas do HUD em cache, re-renderizadas apenas quando seus dados mudam
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from blending import blend_premultiplied
+
+
+class HudLayer:
+    """
+    Camada do HUD com cor pré-multiplicada e alfa invertido, limitada à sua ROI.
+
+    A camada é renderizada desenhando a mesma função sobre um fundo preto e
+    um fundo branco: o fundo preto dá a cor pré-multiplicada e a diferença
+    entre os dois dá a transparência. Assim qualquer desenho do OpenCV (ou
+    draw_bold_text) vira uma camada com alfa sem mudar a forma de desenhar.
+    """
+
+    __slots__ = ("name", "key", "x", "y", "premultiplied", "inverse_alpha", "renders")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.key = None
+        self.x = 0
+        self.y = 0
+        self.premultiplied = None
+        self.inverse_alpha = None
+        self.renders = 0
+
+    def render(self, key: Any, frame_shape: Tuple[int, int], rect: Optional[Tuple[int, int, int, int]],
+               draw: Callable[[np.ndarray, Tuple[int, int]], None]):
+        """
+        Renderiza a camada
+
+        Args:
+            key (Any): Dados dos quais a camada depende
+            frame_shape (Tuple[int, int]): (altura, largura) do frame
+            rect (Optional[Tuple[int, int, int, int]]): Região (x0, y0, x1, y1) onde a camada
+                desenha, ou None para o frame inteiro
+            draw (Callable): Função draw(canvas, origin) que desenha a camada; as
+                coordenadas do frame devem ser deslocadas por -origin
+        """
+        height, width = frame_shape
+        x0, y0, x1, y1 = rect if rect is not None else (0, 0, width, height)
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x1, width), min(y1, height)
+
+        self.key = key
+        self.renders += 1
+        self.premultiplied = self.inverse_alpha = None
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        black = np.zeros((y1 - y0, x1 - x0, 3), dtype=np.uint8)
+        white = np.full((y1 - y0, x1 - x0, 3), 255, dtype=np.uint8)
+        for canvas in (black, white):
+            draw(canvas, (x0, y0))
+
+        inverse_alpha = cv2.subtract(white, black)
+        inverse_alpha = cv2.min(cv2.min(inverse_alpha[:, :, 0], inverse_alpha[:, :, 1]), inverse_alpha[:, :, 2])
+
+        # Recorta a área realmente desenhada
+        covered = cv2.findNonZero((inverse_alpha < 255).astype(np.uint8))
+        if covered is None:
+            return
+        bx, by, bw, bh = cv2.boundingRect(covered)
+
+        self.x, self.y = x0 + bx, y0 + by
+        self.premultiplied = black[by:by + bh, bx:bx + bw].copy()
+        self.inverse_alpha = cv2.merge([inverse_alpha[by:by + bh, bx:bx + bw]] * 3)
+
+    def blend(self, frame: np.ndarray):
+        """
+        Aplica a camada ao frame (apenas na ROI da camada)
+
+        Args:
+            frame (np.ndarray): Frame BGR (modificado no lugar)
+        """
+        if self.premultiplied is not None:
+            blend_premultiplied(frame, self.premultiplied, self.inverse_alpha, (self.x, self.y))
+
+
+class HudCompositor:
+    """
+    Compositor do HUD do jogo.
+
+    Cada camada guarda a chave dos dados com que foi renderizada e só é
+    re-renderizada quando a chave muda; nos demais frames o custo é uma
+    composição limitada à ROI da camada.
+    """
+
+    def __init__(self):
+        self.layers: Dict[str, HudLayer] = {}
+        self._contour_layers: Dict[Any, Tuple[Any, HudLayer]] = {}
+
+    def draw_layer(self, frame: np.ndarray, name: str, key: Any,
+                   draw: Callable[[np.ndarray, Tuple[int, int]], None],
+                   rect: Optional[Tuple[int, int, int, int]] = None) -> bool:
+        """
+        Compõe uma camada no frame, re-renderizando-a se a chave mudou
+
+        Args:
+            frame (np.ndarray): Frame BGR (modificado no lugar)
+            name (str): Nome da camada
+            key (Any): Dados dos quais a camada depende
+            draw (Callable): Função draw(canvas, origin) que desenha a camada
+            rect (Optional[Tuple[int, int, int, int]]): Região onde a camada desenha
+
+        Returns:
+            bool: True se a camada foi re-renderizada neste frame
+        """
+        layer = self.layers.get(name)
+        if layer is None:
+            layer = self.layers[name] = HudLayer(name)
+
+        frame_shape = frame.shape[:2]
+        full_key = (key, frame_shape, rect)
+        rendered = layer.key != full_key
+        if rendered:
+            layer.render(full_key, frame_shape, rect, draw)
+
+        layer.blend(frame)
+        return rendered
+
+    def draw_contour(self, frame: np.ndarray, contour, color=(0, 255, 0), thickness: int = 3,
+                     alpha: float = 0.4):
+        """
+        Compõe o contorno de Sergipe (linha + tinta) no frame
+
+        A tinta é aplicada apenas dentro do contorno e a linha por cima dela; os
+        pesos por pixel são calculados uma vez por resolução e a composição
+        percorre só a ROI do contorno (o resto do frame não é tocado).
+
+        Args:
+            frame (np.ndarray): Frame BGR (modificado no lugar)
+            contour (ContourVariant): Contorno pré-processado na resolução do frame
+            color (tuple): Cor da linha do contorno (BGR)
+            thickness (int): Espessura da linha
+            alpha (float): Opacidade da tinta do contorno
+        """
+        style = (tuple(color), thickness, alpha)
+        cached = self._contour_layers.get(id(contour))
+        if cached is None or cached[0] is not contour or cached[1].key != style:
+            layer = HudLayer("contour")
+            self._render_contour(layer, contour, style)
+            self._contour_layers = {id(contour): (contour, layer)}
+        else:
+            layer = cached[1]
+
+        layer.blend(frame)
+
+    @staticmethod
+    def _render_contour(layer: HudLayer, contour, style):
+        """Pré-calcula tinta e linha do contorno na ROI do contorno"""
+        color, thickness, alpha = style
+        layer.key = style
+        layer.renders += 1
+        layer.premultiplied = layer.inverse_alpha = None
+        if not contour.outlines:
+            return
+
+        x, y, w, h = cv2.boundingRect(np.vstack(contour.outlines))
+        x0, y0 = max(x - thickness, 0), max(y - thickness, 0)
+        x1 = min(x + w + thickness, contour.width)
+        y1 = min(y + h + thickness, contour.height)
+
+        overlay = contour.overlay[y0:y1, x0:x1].astype(np.float32) * alpha
+        line = np.zeros((y1 - y0, x1 - x0), dtype=np.uint8)
+        cv2.drawContours(line, contour.outlines, -1, 255, thickness, offset=(-x0, -y0))
+
+        # Na linha: cor da linha misturada com a tinta; dentro do contorno: frame + tinta;
+        # fora dele o frame fica intacto
+        on_line = line > 0
+        premultiplied = overlay
+        premultiplied[on_line] += np.float32(color) * (1.0 - alpha)
+        inverse_alpha = np.where(contour.mask[y0:y1, x0:x1] > 0, np.rint(255 * (1.0 - alpha)), 255)
+        inverse_alpha = np.where(on_line, 0, inverse_alpha).astype(np.uint8)
+
+        layer.x, layer.y = x0, y0
+        layer.premultiplied = np.clip(np.rint(premultiplied), 0, 255).astype(np.uint8)
+        layer.inverse_alpha = cv2.merge([inverse_alpha] * 3)
+
+    def get_render_counts(self) -> Dict[str, int]:
+        """
+        Obtém quantas vezes cada camada foi renderizada
+
+        Returns:
+            Dict[str, int]: Renderizações por camada
+        """
+        return {name: layer.renders for name, layer in self.layers.items()}
+
+
+# Instância global do compositor
+hud_compositor = HudCompositor()
+
+
+def get_hud_compositor() -> HudCompositor:
+    """
+    Obtém a instância global do compositor do HUD
+
+    Returns:
+        HudCompositor: Instância do compositor
+    """
+    return hud_compositor
@@ -0,0 +1,163 @@
+"""
+RENDERIZADOR DE LANDMARKS - VIVA SERGIPE!
+Desenho dos landmarks da pose em uma única passada, com estilos pré-calculados
+"""
+
+from typing import Dict, Optional
+
+import cv2
+import numpy as np
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Conexões do esqueleto (mesmos pares de mediapipe.solutions.pose.POSE_CONNECTIONS)
+POSE_CONNECTIONS = np.array([
+    (0, 1), (0, 4), (1, 2), (2, 3), (3, 7), (4, 5), (5, 6), (6, 8), (9, 10),
+    (11, 12), (11, 13), (11, 23), (12, 14), (12, 24), (13, 15), (14, 16),
+    (15, 17), (15, 19), (15, 21), (16, 18), (16, 20), (16, 22), (17, 19), (18, 20),
+    (23, 24), (23, 25), (24, 26), (25, 27), (26, 28), (27, 29), (27, 31),
+    (28, 30), (28, 32), (29, 31), (30, 32),
+], dtype=np.int32)
+
+# Landmarks abaixo desta visibilidade não são desenhados (como no MediaPipe)
+VISIBILITY_THRESHOLD = 0.5
+
+# Cor da borda dos círculos dos landmarks (como no MediaPipe)
+BORDER_COLOR = (224, 224, 224)
+
+# Estilos de desenho disponíveis (config: visual.landmark_style)
+LANDMARK_STYLES: Dict[str, Optional[Dict]] = {
+    # Estilo de process_frame: círculos brancos e conexões azuis grossas
+    "classic": {
+        "landmark_color": (255, 255, 255),
+        "landmark_thickness": 4,
+        "circle_radius": 5,
+        "connection_color": (255, 0, 0),
+        "connection_thickness": 15,
+    },
+    # Estilo do feedback visual: landmarks e conexões verdes finas
+    "enhanced": {
+        "landmark_color": (0, 255, 0),
+        "landmark_thickness": 3,
+        "circle_radius": 3,
+        "connection_color": (0, 200, 0),
+        "connection_thickness": 2,
+    },
+    # Não desenhar landmarks
+    "none": None,
+}
+
+DEFAULT_LANDMARK_STYLE = "enhanced"
+
+
+class LandmarkRenderer:
+    """
+    Desenha o esqueleto da pose com uma chamada cv2.polylines para todas as
+    conexões e um par de círculos por landmark.
+
+    Os índices das conexões e o estilo são preparados na criação, então cada
+    frame só converte os landmarks para pixels e desenha.
+    """
+
+    def __init__(self, style: str = DEFAULT_LANDMARK_STYLE):
+        """
+        Args:
+            style (str): Nome do estilo em LANDMARK_STYLES
+        """
+        self.style_name = None
+        self.style = None
+        self.set_style(style)
+
+    def set_style(self, style: str):
+        """
+        Define o estilo de desenho
+
+        Args:
+            style (str): Nome do estilo em LANDMARK_STYLES (estilos desconhecidos usam o padrão)
+        """
+        if style not in LANDMARK_STYLES:
+            logger.warning("Estilo de landmarks desconhecido: %s (usando '%s')", style, DEFAULT_LANDMARK_STYLE)
+            style = DEFAULT_LANDMARK_STYLE
+
+        self.style_name = style
+        self.style = LANDMARK_STYLES[style]
+        if self.style is not None:
+            radius = self.style["circle_radius"]
+            self.border_radius = max(radius + 1, int(radius * 1.2))
+
+    def draw(self, frame: np.ndarray, results, mirrored: bool = False) -> np.ndarray:
+        """
+        Desenha os landmarks da pose no frame (no lugar)
+
+        Args:
+            frame (np.ndarray): Frame BGR
+            results: Resultados do MediaPipe ou do LandmarkTracker
+            mirrored (bool): True se o frame foi espelhado depois da detecção
+
+        Returns:
+            np.ndarray: O próprio frame
+        """
+        if self.style is None or results is None or results.pose_landmarks is None:
+            return frame
+
+        landmark_array = getattr(results, 'landmark_array', None)
+        if landmark_array is None:
+            landmark_array = np.array(
+                [(landmark.x, landmark.y, landmark.visibility) for landmark in results.pose_landmarks.landmark],
+                dtype=np.float64,
+            )
+        if len(landmark_array) == 0:
+            return frame
+
+        height, width = frame.shape[:2]
+        x, y, visibility = landmark_array[:, 0], landmark_array[:, 1], landmark_array[:, 2]
+
+        # Apenas landmarks visíveis e dentro da imagem (mesma regra do MediaPipe)
+        visible = (visibility >= VISIBILITY_THRESHOLD) & (x >= 0) & (x <= 1) & (y >= 0) & (y <= 1)
+        if not visible.any():
+            return frame
+
+        points = np.empty((len(landmark_array), 2), dtype=np.int32)
+        np.minimum(np.floor(x * width), width - 1, out=points[:, 0], casting='unsafe')
+        np.minimum(np.floor(y * height), height - 1, out=points[:, 1], casting='unsafe')
+        if mirrored:
+            points[:, 0] = width - 1 - points[:, 0]
+
+        # Conexões com as duas pontas visíveis, desenhadas de uma vez
+        connections = POSE_CONNECTIONS[(POSE_CONNECTIONS < len(landmark_array)).all(axis=1)]
+        connections = connections[visible[connections[:, 0]] & visible[connections[:, 1]]]
+        if len(connections):
+            cv2.polylines(frame, points[connections], False, self.style["connection_color"],
+                          self.style["connection_thickness"])
+
+        # Landmarks por cima das conexões: borda clara e círculo colorido
+        color = self.style["landmark_color"]
+        thickness = self.style["landmark_thickness"]
+        radius = self.style["circle_radius"]
+        for point in points[visible].tolist():
+            point = tuple(point)
+            cv2.circle(frame, point, self.border_radius, BORDER_COLOR, thickness)
+            cv2.circle(frame, point, radius, color, thickness)
+        return frame
+
+
+# Renderizadores por estilo, criados sob demanda
+_renderers: Dict[str, LandmarkRenderer] = {}
+
+
+def get_landmark_renderer(style: str = DEFAULT_LANDMARK_STYLE) -> LandmarkRenderer:
+    """
+    Obtém o renderizador de landmarks de um estilo
+
+    Args:
+        style (str): Nome do estilo em LANDMARK_STYLES
+
+    Returns:
+        LandmarkRenderer: Renderizador do estilo
+    """
+    renderer = _renderers.get(style)
+    if renderer is None:
+        renderer = _renderers[style] = LandmarkRenderer(style)
+    return renderer
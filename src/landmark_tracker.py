@@ -0,0 +1,190 @@
+"""
+RASTREADOR DE LANDMARKS - VIVA SERGIPE!
+Filtro alfa-beta que prevê os landmarks da pose nos frames sem detecção
+"""
+
+import numpy as np
+import time
+from collections import deque
+from typing import Optional
+
+
+class TrackedLandmark:
+    """Landmark previsto (mesma interface de um landmark do MediaPipe)"""
+
+    __slots__ = ("x", "y", "z", "visibility")
+
+    def __init__(self, x: float, y: float, z: float, visibility: float):
+        self.x = x
+        self.y = y
+        self.z = z
+        self.visibility = visibility
+
+    def HasField(self, name: str) -> bool:
+        """Compatível com mp_drawing.draw_landmarks (apenas 'visibility' existe)"""
+        return name == "visibility"
+
+
+class TrackedLandmarkList:
+    """Lista de landmarks previstos (mesma interface de NormalizedLandmarkList)"""
+
+    __slots__ = ("landmark",)
+
+    def __init__(self, landmark):
+        self.landmark = landmark
+
+
+class TrackedResults:
+    """
+    Resultados de pose gerados pelo rastreador.
+
+    Podem ser usados no lugar dos resultados do MediaPipe por create_body_mask,
+    VisualFeedbackManager e draw_pose_landmarks. O atributo 'landmark_array'
+    guarda os landmarks como array (N, 3) de x, y e visibilidade.
+    """
+
+    __slots__ = ("pose_landmarks", "landmark_array", "predicted")
+
+    def __init__(self, landmark_array: Optional[np.ndarray] = None, z: Optional[np.ndarray] = None,
+                 predicted: bool = False):
+        """
+        Args:
+            landmark_array (Optional[np.ndarray]): Array (N, 3) de x, y e visibilidade, ou None sem pose
+            z (Optional[np.ndarray]): Profundidade de cada landmark
+            predicted (bool): True se os landmarks foram previstos (frame sem detecção)
+        """
+        self.landmark_array = landmark_array
+        self.predicted = predicted
+
+        if landmark_array is None:
+            self.pose_landmarks = None
+        else:
+            if z is None:
+                z = np.zeros(len(landmark_array))
+            self.pose_landmarks = TrackedLandmarkList([
+                TrackedLandmark(x, y, depth, visibility)
+                for (x, y, visibility), depth in zip(landmark_array.tolist(), z.tolist())
+            ])
+
+
+class LandmarkTracker:
+    """
+    Rastreador de landmarks com filtro alfa-beta (velocidade constante).
+
+    Cada detecção corrige a posição e a velocidade estimadas de cada landmark.
+    Nos frames sem detecção a posição é extrapolada a partir da última
+    correção, então o preenchimento e o feedback não "piscam" quando a
+    detecção roda com frequência menor que a renderização.
+    """
+
+    def __init__(self, alpha: float = 0.85, beta: float = 0.3, history_size: int = 5,
+                 max_prediction_time: float = 0.5):
+        """
+        Inicializa o rastreador
+
+        Args:
+            alpha (float): Ganho de correção da posição (0-1)
+            beta (float): Ganho de correção da velocidade (0-2)
+            history_size (int): Número de detecções guardadas no histórico
+            max_prediction_time (float): Tempo máximo de extrapolação sem detecção (segundos)
+        """
+        self.alpha = alpha
+        self.beta = beta
+        self.max_prediction_time = max_prediction_time
+
+        # Histórico das últimas detecções: (timestamp, array (N, 4) de x, y, z, visibilidade)
+        self.history = deque(maxlen=history_size)
+
+        # Estado do filtro
+        self.position = None    # (N, 3): x, y, z
+        self.velocity = None    # (N, 3) por segundo
+        self.visibility = None  # (N,)
+        self.last_update = None
+
+    def reset(self):
+        """Descarta o estado do filtro e o histórico"""
+        self.history.clear()
+        self.position = None
+        self.velocity = None
+        self.visibility = None
+        self.last_update = None
+
+    def update(self, results, timestamp: Optional[float] = None) -> TrackedResults:
+        """
+        Corrige o filtro com uma nova detecção
+
+        Args:
+            results: Resultados do MediaPipe
+            timestamp (Optional[float]): Momento em que o frame detectado foi capturado
+
+        Returns:
+            TrackedResults: Landmarks filtrados no momento da detecção
+        """
+        if timestamp is None:
+            timestamp = time.time()
+
+        if results is None or results.pose_landmarks is None:
+            # Nenhuma pose detectada: não há o que rastrear
+            self.reset()
+            return TrackedResults()
+
+        measured = np.array(
+            [(landmark.x, landmark.y, getattr(landmark, "z", 0.0), landmark.visibility)
+             for landmark in results.pose_landmarks.landmark],
+            dtype=np.float64,
+        )
+        measured_position = measured[:, :3]
+
+        if self.position is None or self.position.shape != measured_position.shape:
+            self.reset()
+            self.position = measured_position.copy()
+            self.velocity = np.zeros_like(measured_position)
+        else:
+            dt = timestamp - self.last_update
+            if dt <= 0:
+                self.position = measured_position.copy()
+            elif len(self.history) == 1:
+                # Segunda detecção: inicializa a velocidade por diferença finita
+                previous_time, previous = self.history[-1]
+                self.velocity = (measured_position - previous[:, :3]) / (timestamp - previous_time)
+                self.position = measured_position.copy()
+            else:
+                predicted = self.position + self.velocity * dt
+                residual = measured_position - predicted
+                self.position = predicted + self.alpha * residual
+                self.velocity = self.velocity + (self.beta / dt) * residual
+
+        self.history.append((timestamp, measured))
+        self.visibility = measured[:, 3].copy()
+        self.last_update = timestamp
+        return self._make_results(self.position, predicted=False)
+
+    def predict(self, timestamp: Optional[float] = None) -> TrackedResults:
+        """
+        Prevê os landmarks para um frame sem detecção
+
+        Args:
+            timestamp (Optional[float]): Momento do frame a prever
+
+        Returns:
+            TrackedResults: Landmarks extrapolados, ou resultados sem pose se não
+            houver detecção recente
+        """
+        if self.position is None:
+            return TrackedResults()
+
+        if timestamp is None:
+            timestamp = time.time()
+
+        dt = timestamp - self.last_update
+        if dt > self.max_prediction_time:
+            return TrackedResults()
+
+        return self._make_results(self.position + self.velocity * max(dt, 0.0), predicted=True)
+
+    def _make_results(self, position: np.ndarray, predicted: bool) -> TrackedResults:
+        """Monta os resultados a partir de posições (N, 3)"""
+        landmark_array = np.empty((len(position), 3), dtype=np.float64)
+        landmark_array[:, :2] = position[:, :2]
+        landmark_array[:, 2] = self.visibility
+        return TrackedResults(landmark_array, position[:, 2], predicted=predicted)
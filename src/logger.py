@@ -0,0 +1,253 @@
+"""
+LOGGER - VIVA SERGIPE!
+Logging com níveis por módulo, limite de mensagens repetidas e escrita em thread de fundo
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+from typing import Any, Dict, Optional
+
+ROOT_LOGGER_NAME = "viva_sergipe"
+CONSOLE_FORMAT = "%(message)s"
+FILE_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Limita mensagens repetidas.
+
+    Mensagens com o mesmo módulo, nível e texto (já formatado com os
+    argumentos) são emitidas no máximo uma vez por intervalo; a próxima
+    emissão informa quantas foram suprimidas nesse meio tempo. Mensagens
+    diferentes vindas da mesma linha do código não se suprimem. São lembradas
+    no máximo max_entries mensagens (as usadas há mais tempo são esquecidas).
+    """
+
+    def __init__(self, interval: float = 5.0, max_entries: int = 1024):
+        """
+        Args:
+            interval (float): Intervalo mínimo entre mensagens repetidas (segundos). 0 desativa
+            max_entries (int): Quantidade máxima de mensagens lembradas
+        """
+        super().__init__()
+        self.interval = interval
+        self.max_entries = max_entries
+        self._entries: Dict[Any, list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.interval <= 0:
+            return True
+
+        key = (record.name, record.levelno, record.getMessage())
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None and record.created - entry[0] < self.interval:
+                entry[1] += 1
+                self._entries[key] = entry
+                return False
+
+            suppressed = entry[1] if entry is not None else 0
+            self._entries[key] = [record.created, 0]
+            if len(self._entries) > self.max_entries:
+                # Esquece a mensagem usada há mais tempo
+                self._entries.pop(next(iter(self._entries)))
+
+        if suppressed:
+            record.msg = f"{record.msg} (+{suppressed} repetidas suprimidas)"
+        return True
+
+
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler que inicia a thread de escrita no primeiro registro enfileirado"""
+
+    def __init__(self, log_queue: queue.Queue, start_listener):
+        """
+        Args:
+            log_queue (queue.Queue): Fila dos registros
+            start_listener (Callable[[], None]): Inicia a thread de escrita, se necessário
+        """
+        super().__init__(log_queue)
+        self.start_listener = start_listener
+
+    def enqueue(self, record: logging.LogRecord):
+        self.start_listener()
+        super().enqueue(record)
+
+
+class LogManager:
+    """Gerenciador do logging do jogo"""
+
+    def __init__(self):
+        """
+        Inicializa o logging com saída no console
+
+        A thread de escrita só é iniciada no primeiro registro ou em configure(),
+        para que importar o logger não custe nada na inicialização.
+        """
+        self.queue = queue.Queue(-1)
+        self.rate_limit_filter = RateLimitFilter()
+
+        # Os módulos só enfileiram registros; a escrita acontece na thread do listener
+        self.queue_handler = LazyQueueHandler(self.queue, self.ensure_listener)
+        self.queue_handler.addFilter(self.rate_limit_filter)
+
+        self.root_logger = logging.getLogger(ROOT_LOGGER_NAME)
+        self.root_logger.setLevel(logging.INFO)
+        self.root_logger.propagate = False
+        self.root_logger.addHandler(self.queue_handler)
+
+        self.listener = None
+        self.handlers = None
+        self.closed = False
+        self.module_levels: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        atexit.register(self.shutdown)
+
+    def _create_console_handler(self) -> logging.Handler:
+        """Cria o handler de console"""
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+        return handler
+
+    def _start_listener(self, handlers):
+        """(Re)inicia a thread que escreve os registros nos handlers"""
+        with self._lock:
+            if self.listener is not None:
+                self.listener.stop()
+            self.handlers = handlers
+            self.listener = logging.handlers.QueueListener(
+                self.queue, *handlers, respect_handler_level=True
+            )
+            self.listener.start()
+            self.closed = False
+
+    def ensure_listener(self):
+        """Inicia a thread de escrita (só console) se ela ainda não existe"""
+        if self.listener is not None or self.closed:
+            return
+        with self._lock:
+            if self.listener is None and not self.closed:
+                self.listener = logging.handlers.QueueListener(
+                    self.queue, *(self.handlers or [self._create_console_handler()]),
+                    respect_handler_level=True
+                )
+                self.listener.start()
+
+    def configure(self, config_manager=None):
+        """
+        Aplica as configurações de logging
+
+        Args:
+            config_manager: Gerenciador de configurações (usa o global se None)
+        """
+        if config_manager is None:
+            from config_manager import get_config_manager
+            config_manager = get_config_manager()
+
+        self.root_logger.setLevel(
+            self._parse_level(config_manager.get('logging', 'level', 'INFO'), logging.INFO)
+        )
+        self.rate_limit_filter.interval = float(
+            config_manager.get('logging', 'rate_limit_interval', 5.0)
+        )
+
+        # Níveis por módulo
+        for module in self.module_levels:
+            self.get_logger(module).setLevel(logging.NOTSET)
+        self.module_levels = dict(config_manager.get('logging', 'modules', {}) or {})
+        for module, level in self.module_levels.items():
+            self.set_level(module, level)
+
+        handlers = [self._create_console_handler()]
+        log_file = config_manager.get('logging', 'file', '')
+        if log_file:
+            try:
+                directory = os.path.dirname(log_file)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                file_handler = logging.handlers.RotatingFileHandler(
+                    log_file, maxBytes=1024 * 1024, backupCount=3, encoding='utf-8'
+                )
+                file_handler.setFormatter(logging.Formatter(FILE_FORMAT))
+                handlers.append(file_handler)
+            except Exception as e:
+                print(f"⚠️ Não foi possível abrir o arquivo de log {log_file}: {e}")
+
+        self._start_listener(handlers)
+
+    def _parse_level(self, level: Any, default: int) -> int:
+        """Converte nome ('DEBUG') ou número de nível"""
+        if isinstance(level, int):
+            return level
+        value = logging.getLevelName(str(level).upper())
+        return value if isinstance(value, int) else default
+
+    def set_level(self, module: str, level: Any):
+        """
+        Define o nível de log de um módulo
+
+        Args:
+            module (str): Nome do módulo (ex: 'sergipe_utils')
+            level (Any): Nível ('DEBUG', 'INFO', ...) ou número
+        """
+        self.get_logger(module).setLevel(self._parse_level(level, logging.NOTSET))
+
+    def get_logger(self, module: str) -> logging.Logger:
+        """
+        Obtém o logger de um módulo
+
+        Args:
+            module (str): Nome do módulo (normalmente __name__)
+
+        Returns:
+            logging.Logger: Logger filho de 'viva_sergipe'
+        """
+        return self.root_logger.getChild(module)
+
+    def flush(self):
+        """Espera até que todos os registros enfileirados tenham sido escritos"""
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener.start()
+
+    def shutdown(self):
+        """Escreve os registros pendentes e para a thread de escrita"""
+        with self._lock:
+            self.closed = True
+            if self.listener is not None:
+                self.listener.stop()
+                self.listener = None
+
+
+# Instância global do gerenciador de logging
+log_manager = LogManager()
+
+
+def get_log_manager() -> LogManager:
+    """
+    Obtém a instância global do gerenciador de logging
+
+    Returns:
+        LogManager: Instância do gerenciador
+    """
+    return log_manager
+
+
+def get_logger(module: str) -> logging.Logger:
+    """
+    Obtém o logger de um módulo
+
+    Args:
+        module (str): Nome do módulo (normalmente __name__)
+
+    Returns:
+        logging.Logger: Logger do módulo
+    """
+    return log_manager.get_logger(module)
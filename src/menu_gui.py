@@ -6,12 +6,13 @@ Interface gráfica usando PyQt5 com background da bandeira de Sergipe
 
 import sys
 import os
+import time
 import pygame
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QPushButton, QLabel, QFrame, QSpacerItem,
                              QSizePolicy, QMessageBox, QDialog, QScrollArea, QSlider,
                              QCheckBox, QComboBox, QSpinBox, QGroupBox, QGridLayout, QTabWidget)
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QThread, QPropertyAnimation, QEasingCurve
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QThread, QPropertyAnimation, QEasingCurve, QEventLoop
 from PyQt5.QtGui import QPixmap, QPalette, QBrush, QFont, QPainter, QColor, QIcon
 import cv2
 import numpy as np
@@ -19,8 +20,12 @@ from pathlib import Path
 
 # Importar módulos do projeto
 try:
-    from config_manager import ConfigManager
+    from config_manager import get_config_manager
     from game_modes import GameModeManager
+    from startup_profiler import get_startup_profiler
+    from asset_preloader import get_asset_preloader
+    from utils import get_screen_size
+    from game_view import GameView
     
     # Adicionar raiz do projeto ao path para imports
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -204,6 +209,211 @@ QTabBar::tab:hover {
 }
 """
 
+
+def _menu_button_style(font_size, padding, min_height):
+    """Estilo dos botões de menu; o botão selecionado (propriedade 'selected') fica verde"""
+    return f"""
+        QPushButton {{
+            background-color: rgba(255, 255, 255, 200);
+            color: rgb(0, 0, 0);
+            font-size: {font_size}px;
+            font-weight: bold;
+            font-family: 'Arial Black', Arial, sans-serif;
+            border: 4px solid rgb(255, 255, 255);
+            border-radius: 20px;
+            padding: {padding};
+            min-height: {min_height}px;
+        }}
+        QPushButton:hover {{
+            background-color: rgba(255, 255, 255, 230);
+            border: 4px solid rgb(200, 200, 200);
+        }}
+        QPushButton[selected="true"] {{
+            background-color: rgb(0, 255, 0);
+            color: rgb(255, 255, 255);
+            border: 4px solid rgb(0, 255, 0);
+        }}
+    """
+
+
+# Folhas de estilo montadas uma vez; trocar a seleção só muda a propriedade 'selected'
+MAIN_MENU_BUTTON_STYLE = _menu_button_style(42, "25px 50px", 80)
+POST_GAME_BUTTON_STYLE = _menu_button_style(36, "20px 40px", 70)
+
+FLAG_FALLBACK_STYLE = """
+    QMainWindow {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #1e3a8a, stop:0.33 #16a34a, stop:0.66 #eab308, stop:1 #16a34a);
+    }
+"""
+
+RESULT_MESSAGE_STYLE = """
+    QLabel {
+        color: #ffffff;
+        font-size: 36px;
+        font-weight: bold;
+        font-family: Arial, sans-serif;
+        background: transparent;
+        border: none;
+        margin-top: 15px;
+    }
+"""
+
+RESULT_TITLE_STYLE = """
+    QLabel {{
+        color: {color};
+        font-size: {font_size}px;
+        font-weight: bold;
+        font-family: 'Arial Black', Arial, sans-serif;
+        background: transparent;
+        border: none;
+    }}
+"""
+VICTORY_TITLE_STYLE = RESULT_TITLE_STYLE.format(color="#00ff00", font_size=72)
+DEFEAT_TITLE_STYLE = RESULT_TITLE_STYLE.format(color="#ff6666", font_size=64)
+
+# A aplicação Qt e as janelas dos menus vivem o processo inteiro: entre as partidas
+# as janelas são escondidas e mostradas de novo, sem recriar widgets, fundo e áudio
+_application = None
+_windows = {}
+_flag_backgrounds = {}
+_menu_sounds = None
+_menu_music_loaded = False
+
+
+def get_application():
+    """
+    Obtém a aplicação Qt do processo (criada na primeira chamada)
+
+    Returns:
+        QApplication: Aplicação Qt
+    """
+    global _application
+    app = QApplication.instance()
+    if app is None:
+        # Referência no módulo: sem ela a aplicação seria destruída junto com as janelas
+        app = _application = QApplication(sys.argv)
+
+        # Configurar ícone da aplicação se existir
+        if os.path.exists("logo.png"):
+            app.setWindowIcon(QIcon("logo.png"))
+
+    # Menus escondidos entre as partidas não devem encerrar a aplicação
+    app.setQuitOnLastWindowClosed(False)
+    return app
+
+
+def get_flag_background(width, height):
+    """
+    Obtém a bandeira de Sergipe escalada para o tamanho (uma vez por tamanho de tela)
+
+    Args:
+        width (int): Largura da janela
+        height (int): Altura da janela
+
+    Returns:
+        QPixmap: Bandeira escalada, ou None se a imagem não pôde ser carregada
+    """
+    key = (width, height)
+    if key not in _flag_backgrounds:
+        pixmap = QPixmap(get_asset_path("flag-se.jpg"))
+        _flag_backgrounds[key] = None if pixmap.isNull() else pixmap.scaled(
+            width, height, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation
+        )
+    return _flag_backgrounds[key]
+
+
+def apply_flag_background(window):
+    """Define a bandeira de Sergipe (escalada para a tela) como background da janela"""
+    try:
+        width, height = get_screen_size()
+        scaled_pixmap = get_flag_background(width, height)
+
+        if scaled_pixmap is not None:
+            # Define como background
+            palette = QPalette()
+            palette.setBrush(QPalette.Background, QBrush(scaled_pixmap))
+            window.setPalette(palette)
+        else:
+            # Fallback: cores da bandeira de Sergipe
+            window.setStyleSheet(FLAG_FALLBACK_STYLE)
+    except Exception as e:
+        print(f"Erro ao carregar background: {e}")
+        # Fallback: cores da bandeira
+        window.setStyleSheet(FLAG_FALLBACK_STYLE)
+
+
+def get_menu_sounds():
+    """
+    Obtém os sons dos menus, decodificados uma única vez
+
+    Returns:
+        tuple: (som de clique, som de despedida); None para os que não puderam ser carregados
+    """
+    global _menu_sounds
+    if _menu_sounds is None:
+        try:
+            pygame.mixer.init()
+            _menu_sounds = (
+                pygame.mixer.Sound(get_sound_path("sounds/confirmation.mp3")),
+                pygame.mixer.Sound(get_sound_path("sounds/bye.mp3")),
+            )
+        except Exception as e:
+            print(f"Aviso: Não foi possível carregar os arquivos de áudio: {e}")
+            _menu_sounds = (None, None)
+    return _menu_sounds
+
+
+def play_menu_music():
+    """Toca a música de fundo do menu (carregada uma única vez)"""
+    global _menu_music_loaded
+    try:
+        if not _menu_music_loaded:
+            pygame.mixer.music.load(get_sound_path("sounds/background.mp3"))
+            pygame.mixer.music.set_volume(0.3)
+            _menu_music_loaded = True
+        if not pygame.mixer.music.get_busy():
+            pygame.mixer.music.play(-1)  # Loop infinito
+    except Exception as e:
+        print(f"Aviso: Não foi possível tocar a música de fundo: {e}")
+
+
+def release_menu_audio():
+    """Encerra o áudio dos menus (saída do jogo)"""
+    global _menu_sounds, _menu_music_loaded
+    pygame.mixer.quit()
+    _menu_sounds = None
+    _menu_music_loaded = False
+
+
+def set_button_selected(button, selected):
+    """Marca o botão como selecionado e reaplica a folha de estilo já carregada"""
+    button.setProperty("selected", selected)
+    button.style().unpolish(button)
+    button.style().polish(button)
+
+
+def _get_window(name, factory):
+    """Obtém a janela 'name', criando-a na primeira vez"""
+    window = _windows.get(name)
+    if window is None:
+        window = factory()
+        _windows[name] = window
+    return window
+
+
+def _run_window(window):
+    """Mostra a janela e processa eventos até ela ser escondida"""
+    app = get_application()
+    window.show()
+    window.raise_()
+    window.activateWindow()
+
+    # Usar loop de eventos local
+    while window.isVisible():
+        app.processEvents()
+        time.sleep(0.01)
+
 class HelpWindow(QDialog):
     """
     Janela de ajuda com instruções do jogo
@@ -324,28 +534,65 @@ class SergipeMenuWindow(QMainWindow):
         super().__init__()
         self.current_button = 0  # Índice do botão selecionado
         self.buttons = []  # Lista de botões para navegação
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
         self.game_mode_manager = GameModeManager()
         self.init_ui()
-        self.init_audio()
+
+        # Escolha feita no menu ('play' ou 'exit'), lida por show_main_menu
+        self.choice = 'exit'
+
+        # Áudio carregado logo depois da primeira exibição, para o menu aparecer antes
+        self.click_sound = None
+        self.bye_sound = None
+        self.audio_ready = False
+        QTimer.singleShot(0, self.init_audio)
+
+        # Recursos da partida carregados em segundo plano enquanto o menu é mostrado
+        self.preloader = None
+        self.preload_timer = QTimer(self)
+        self.preload_timer.timeout.connect(self.update_preload_status)
+        QTimer.singleShot(0, self.start_preloading)
+
+    def start_preloading(self):
+        """Inicia o pré-carregamento de contorno, sons, câmera e modelo de pose"""
+        try:
+            self.preloader = get_asset_preloader()
+        except Exception as e:
+            print(f"Aviso: Não foi possível iniciar o pré-carregamento: {e}")
+            self.preload_label.setText("")
+            return
+        self.update_preload_status()
+        self.preload_timer.start(250)
+
+    def update_preload_status(self):
+        """Mostra no rodapé o andamento do pré-carregamento"""
+        status = self.preloader.get_status()
+        if status["ready"]:
+            self.preload_label.setText("✅ Pronto para jogar!")
+            self.preload_timer.stop()
+        else:
+            step = status["current_step"] or "recursos"
+            self.preload_label.setText(
+                f"⏳ Preparando {step}... ({status['steps_done']}/{status['total_steps']})"
+            )
 
     def init_audio(self):
         """Inicializa o sistema de áudio"""
-        try:
-            pygame.mixer.init()
-            # Carrega sons do menu
-            self.click_sound = pygame.mixer.Sound(get_sound_path("sounds/confirmation.mp3"))
-            self.bye_sound = pygame.mixer.Sound(get_sound_path("sounds/bye.mp3"))
+        # Sons decodificados uma vez e compartilhados pelos menus
+        self.click_sound, self.bye_sound = get_menu_sounds()
+        self.audio_ready = True
 
-            # Música de fundo
-            pygame.mixer.music.load(get_sound_path("sounds/background.mp3"))
-            pygame.mixer.music.set_volume(0.3)
-            pygame.mixer.music.play(-1)  # Loop infinito
+        # Música de fundo
+        play_menu_music()
 
-        except Exception as e:
-            print(f"Aviso: Não foi possível carregar os arquivos de áudio: {e}")
-            self.click_sound = None
-            self.bye_sound = None
+    def prepare_to_show(self):
+        """Volta ao estado inicial antes de ser mostrada de novo (janela reaproveitada)"""
+        self.choice = 'exit'
+        self.current_button = 0
+        for i, button in enumerate(self.buttons):
+            self.update_button_style(button, i == self.current_button)
+        if self.audio_ready:
+            play_menu_music()
 
     def init_ui(self):
         """Inicializa a interface do usuário"""
@@ -384,35 +631,7 @@ class SergipeMenuWindow(QMainWindow):
 
     def set_sergipe_flag_background(self):
         """Define a bandeira de Sergipe como background"""
-        try:
-            # Carrega a imagem da bandeira
-            pixmap = QPixmap(get_asset_path("flag-se.jpg"))
-
-            if not pixmap.isNull():
-                # Redimensiona para cobrir toda a janela
-                scaled_pixmap = pixmap.scaled(self.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-
-                # Define como background
-                palette = QPalette()
-                palette.setBrush(QPalette.Background, QBrush(scaled_pixmap))
-                self.setPalette(palette)
-            else:
-                # Fallback: cores da bandeira de Sergipe
-                self.setStyleSheet("""
-                    QMainWindow {
-                        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                            stop:0 #1e3a8a, stop:0.33 #16a34a, stop:0.66 #eab308, stop:1 #16a34a);
-                    }
-                """)
-        except Exception as e:
-            print(f"Erro ao carregar background: {e}")
-            # Fallback: cores da bandeira
-            self.setStyleSheet("""
-                QMainWindow {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #1e3a8a, stop:0.33 #16a34a, stop:0.66 #eab308, stop:1 #16a34a);
-                }
-            """)
+        apply_flag_background(self)
 
     def create_title_section(self, layout):
         """Cria a seção do título"""
@@ -476,29 +695,6 @@ class SergipeMenuWindow(QMainWindow):
         buttons_layout.setContentsMargins(40, 30, 40, 30)
         buttons_layout.setSpacing(20)
 
-        # Estilo dos botões
-        button_style = """
-            QPushButton {
-                background-color: rgba(255, 255, 255, 200);
-                color: #000000;
-                font-size: 42px;
-                font-weight: bold;
-                font-family: 'Arial Black', Arial, sans-serif;
-                border: 4px solid #ffffff;
-                border-radius: 20px;
-                padding: 25px 50px;
-                min-height: 80px;
-            }
-            QPushButton:hover {
-                background-color: rgba(0, 255, 0, 200);
-                color: #ffffff;
-            }
-            QPushButton:pressed {
-                background-color: rgba(0, 200, 0, 255);
-                border: 4px solid #00ff00;
-            }
-        """
-
         # Botão Jogar
         play_button = QPushButton("🎮 JOGAR")
         play_button.clicked.connect(self.start_game)
@@ -520,15 +716,12 @@ class SergipeMenuWindow(QMainWindow):
 
         # Aplicar estilos e adicionar ao layout
         for i, button in enumerate(self.buttons):
+            button.setStyleSheet(MAIN_MENU_BUTTON_STYLE)
             self.update_button_style(button, i == self.current_button)
             buttons_layout.addWidget(button)
 
         layout.addWidget(buttons_frame)
 
-        # Garantir que o primeiro botão esteja visualmente selecionado
-        if self.buttons:
-            self.update_button_style(self.buttons[self.current_button], True)
-
     def create_footer_info(self, layout):
         """Cria informações do rodapé"""
         footer_frame = QFrame()
@@ -557,6 +750,21 @@ class SergipeMenuWindow(QMainWindow):
         """)
 
         footer_layout.addWidget(info_label)
+
+        # Andamento do pré-carregamento da partida
+        self.preload_label = QLabel("⏳ Preparando o jogo...")
+        self.preload_label.setAlignment(Qt.AlignCenter)
+        self.preload_label.setStyleSheet("""
+            QLabel {
+                color: #ffff00;
+                font-size: 14px;
+                font-family: Arial, sans-serif;
+                background: transparent;
+                border: none;
+            }
+        """)
+        footer_layout.addWidget(self.preload_label)
+
         layout.addWidget(footer_frame)
 
     def center_window(self):
@@ -639,49 +847,13 @@ Use seu corpo para preencher pelo menos 30% do contorno do mapa de Sergipe em 5
 
     def close_application(self):
         """Fecha a aplicação"""
-        pygame.mixer.quit()
+        release_menu_audio()
         self.exit_signal.emit()
         self.close()
 
     def update_button_style(self, button, selected):
-        """Atualiza o estilo do botão baseado na seleção"""
-        # Definir propriedade personalizada para controle
-        button.setProperty("selected", selected)
-
-        if selected:
-            # Estilo do botão selecionado - VERDE
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: rgb(0, 255, 0);
-                    color: rgb(255, 255, 255);
-                    font-size: 42px;
-                    font-weight: bold;
-                    font-family: 'Arial Black', Arial, sans-serif;
-                    border: 4px solid rgb(0, 255, 0);
-                    border-radius: 20px;
-                    padding: 25px 50px;
-                    min-height: 80px;
-                }
-            """)
-        else:
-            # Estilo do botão normal - BRANCO
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: rgba(255, 255, 255, 200);
-                    color: rgb(0, 0, 0);
-                    font-size: 42px;
-                    font-weight: bold;
-                    font-family: 'Arial Black', Arial, sans-serif;
-                    border: 4px solid rgb(255, 255, 255);
-                    border-radius: 20px;
-                    padding: 25px 50px;
-                    min-height: 80px;
-                }
-                QPushButton:hover {
-                    background-color: rgba(255, 255, 255, 230);
-                    border: 4px solid rgb(200, 200, 200);
-                }
-            """)
+        """Atualiza o estilo do botão baseado na seleção (verde quando selecionado)"""
+        set_button_selected(button, selected)
 
     def navigate_buttons(self, direction):
         """Navega entre os botões"""
@@ -758,27 +930,36 @@ class PostGameMenuWindow(QMainWindow):
         self.fill_percentage = fill_percentage
         self.current_button = 0  # Índice do botão selecionado
         self.buttons = []  # Lista de botões para navegação
+        self.choice = 'exit'  # Escolha feita no menu, lida por show_post_game_menu
         self.init_ui()
         self.init_audio()
 
     def init_audio(self):
         """Inicializa o sistema de áudio"""
-        try:
-            pygame.mixer.init()
-            self.click_sound = pygame.mixer.Sound(get_sound_path("sounds/confirmation.mp3"))
-            self.bye_sound = pygame.mixer.Sound(get_sound_path("sounds/bye.mp3"))
-        except Exception as e:
-            print(f"Aviso: Não foi possível carregar os arquivos de áudio: {e}")
-            self.click_sound = None
-            self.bye_sound = None
+        # Sons decodificados uma vez e compartilhados pelos menus
+        self.click_sound, self.bye_sound = get_menu_sounds()
+
+    def set_result(self, won, fill_percentage):
+        """
+        Mostra o resultado de outra partida (janela reaproveitada)
+
+        Args:
+            won (bool): Se o jogador venceu
+            fill_percentage (float): Porcentagem de preenchimento
+        """
+        self.won = won
+        self.fill_percentage = fill_percentage
+        self.update_result_section()
+
+    def prepare_to_show(self):
+        """Volta ao estado inicial antes de ser mostrada de novo (janela reaproveitada)"""
+        self.choice = 'exit'
+        self.current_button = 0
+        for i, button in enumerate(self.buttons):
+            self.update_button_style(button, i == self.current_button)
 
     def init_ui(self):
         """Inicializa a interface do usuário"""
-        if self.won:
-            self.setWindowTitle("🎉 VITÓRIA! - Viva Sergipe!")
-        else:
-            self.setWindowTitle("⏰ Fim de Jogo - Viva Sergipe!")
-
         # Configurar para fullscreen
         self.setWindowState(Qt.WindowFullScreen)
         self.setWindowFlags(Qt.FramelessWindowHint)
@@ -809,28 +990,7 @@ class PostGameMenuWindow(QMainWindow):
 
     def set_sergipe_flag_background(self):
         """Define a bandeira de Sergipe como background"""
-        try:
-            pixmap = QPixmap(get_asset_path("flag-se.jpg"))
-            if not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(self.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-                palette = QPalette()
-                palette.setBrush(QPalette.Background, QBrush(scaled_pixmap))
-                self.setPalette(palette)
-            else:
-                self.setStyleSheet("""
-                    QMainWindow {
-                        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                            stop:0 #1e3a8a, stop:0.33 #16a34a, stop:0.66 #eab308, stop:1 #16a34a);
-                    }
-                """)
-        except Exception as e:
-            print(f"Erro ao carregar background: {e}")
-            self.setStyleSheet("""
-                QMainWindow {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #1e3a8a, stop:0.33 #16a34a, stop:0.66 #eab308, stop:1 #16a34a);
-                }
-            """)
+        apply_flag_background(self)
 
     def create_result_section(self, layout):
         """Cria a seção do resultado"""
@@ -846,68 +1006,32 @@ class PostGameMenuWindow(QMainWindow):
         result_layout = QVBoxLayout(result_frame)
         result_layout.setContentsMargins(30, 20, 30, 20)
 
-        if self.won:
-            # Título de vitória
-            title_label = QLabel("🎉 PARABÉNS! 🎉")
-            title_label.setStyleSheet("""
-                QLabel {
-                    color: #00ff00;
-                    font-size: 72px;
-                    font-weight: bold;
-                    font-family: 'Arial Black', Arial, sans-serif;
-                    background: transparent;
-                    border: none;
-                }
-            """)
-
-            # Mensagem de vitória
-            message_label = QLabel(f"Você preencheu {self.fill_percentage:.1f}% do mapa!")
-            message_label.setStyleSheet("""
-                QLabel {
-                    color: #ffffff;
-                    font-size: 36px;
-                    font-weight: bold;
-                    font-family: Arial, sans-serif;
-                    background: transparent;
-                    border: none;
-                    margin-top: 15px;
-                }
-            """)
-        else:
-            # Título de derrota
-            title_label = QLabel("⏰ TEMPO ESGOTADO!")
-            title_label.setStyleSheet("""
-                QLabel {
-                    color: #ff6666;
-                    font-size: 64px;
-                    font-weight: bold;
-                    font-family: 'Arial Black', Arial, sans-serif;
-                    background: transparent;
-                    border: none;
-                }
-            """)
-
-            # Mensagem de encorajamento
-            message_label = QLabel(f"Você conseguiu {self.fill_percentage:.1f}% - Tente novamente!")
-            message_label.setStyleSheet("""
-                QLabel {
-                    color: #ffffff;
-                    font-size: 36px;
-                    font-weight: bold;
-                    font-family: Arial, sans-serif;
-                    background: transparent;
-                    border: none;
-                    margin-top: 15px;
-                }
-            """)
-
-        title_label.setAlignment(Qt.AlignCenter)
-        message_label.setAlignment(Qt.AlignCenter)
+        self.title_label = QLabel()
+        self.message_label = QLabel()
+        self.message_label.setStyleSheet(RESULT_MESSAGE_STYLE)
+        self.title_label.setAlignment(Qt.AlignCenter)
+        self.message_label.setAlignment(Qt.AlignCenter)
+        self.update_result_section()
 
-        result_layout.addWidget(title_label)
-        result_layout.addWidget(message_label)
+        result_layout.addWidget(self.title_label)
+        result_layout.addWidget(self.message_label)
         layout.addWidget(result_frame)
 
+    def update_result_section(self):
+        """Atualiza título e mensagem com o resultado da partida"""
+        if self.won:
+            self.setWindowTitle("🎉 VITÓRIA! - Viva Sergipe!")
+            # Título e mensagem de vitória
+            self.title_label.setText("🎉 PARABÉNS! 🎉")
+            self.title_label.setStyleSheet(VICTORY_TITLE_STYLE)
+            self.message_label.setText(f"Você preencheu {self.fill_percentage:.1f}% do mapa!")
+        else:
+            self.setWindowTitle("⏰ Fim de Jogo - Viva Sergipe!")
+            # Título de derrota e mensagem de encorajamento
+            self.title_label.setText("⏰ TEMPO ESGOTADO!")
+            self.title_label.setStyleSheet(DEFEAT_TITLE_STYLE)
+            self.message_label.setText(f"Você conseguiu {self.fill_percentage:.1f}% - Tente novamente!")
+
     def create_post_game_buttons(self, layout):
         """Cria os botões do menu pós-jogo"""
         buttons_frame = QFrame()
@@ -923,29 +1047,6 @@ class PostGameMenuWindow(QMainWindow):
         buttons_layout.setContentsMargins(40, 30, 40, 30)
         buttons_layout.setSpacing(20)
 
-        # Estilo dos botões
-        button_style = """
-            QPushButton {
-                background-color: rgba(255, 255, 255, 200);
-                color: #000000;
-                font-size: 36px;
-                font-weight: bold;
-                font-family: 'Arial Black', Arial, sans-serif;
-                border: 4px solid #ffffff;
-                border-radius: 20px;
-                padding: 20px 40px;
-                min-height: 70px;
-            }
-            QPushButton:hover {
-                background-color: rgba(0, 255, 0, 200);
-                color: #ffffff;
-            }
-            QPushButton:pressed {
-                background-color: rgba(0, 200, 0, 255);
-                border: 4px solid #00ff00;
-            }
-        """
-
         # Botão Jogar Novamente
         play_again_button = QPushButton("🔄 JOGAR NOVAMENTE")
         play_again_button.clicked.connect(self.play_again)
@@ -963,15 +1064,12 @@ class PostGameMenuWindow(QMainWindow):
 
         # Aplicar estilos e adicionar ao layout
         for i, button in enumerate(self.buttons):
+            button.setStyleSheet(POST_GAME_BUTTON_STYLE)
             self.update_button_style(button, i == self.current_button)
             buttons_layout.addWidget(button)
 
         layout.addWidget(buttons_frame)
 
-        # Garantir que o primeiro botão esteja visualmente selecionado
-        if self.buttons:
-            self.update_button_style(self.buttons[self.current_button], True)
-
     def center_window(self):
         """Centraliza a janela na tela"""
         screen = QApplication.desktop().screenGeometry()
@@ -1008,44 +1106,8 @@ class PostGameMenuWindow(QMainWindow):
         self.close()
 
     def update_button_style(self, button, selected):
-        """Atualiza o estilo do botão baseado na seleção"""
-        # Definir propriedade personalizada para controle
-        button.setProperty("selected", selected)
-
-        if selected:
-            # Estilo do botão selecionado - VERDE
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: rgb(0, 255, 0);
-                    color: rgb(255, 255, 255);
-                    font-size: 36px;
-                    font-weight: bold;
-                    font-family: 'Arial Black', Arial, sans-serif;
-                    border: 4px solid rgb(0, 255, 0);
-                    border-radius: 20px;
-                    padding: 20px 40px;
-                    min-height: 70px;
-                }
-            """)
-        else:
-            # Estilo do botão normal - BRANCO
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: rgba(255, 255, 255, 200);
-                    color: rgb(0, 0, 0);
-                    font-size: 36px;
-                    font-weight: bold;
-                    font-family: 'Arial Black', Arial, sans-serif;
-                    border: 4px solid rgb(255, 255, 255);
-                    border-radius: 20px;
-                    padding: 20px 40px;
-                    min-height: 70px;
-                }
-                QPushButton:hover {
-                    background-color: rgba(255, 255, 255, 230);
-                    border: 4px solid rgb(200, 200, 200);
-                }
-            """)
+        """Atualiza o estilo do botão baseado na seleção (verde quando selecionado)"""
+        set_button_selected(button, selected)
 
     def navigate_buttons(self, direction):
         """Navega entre os botões"""
@@ -1107,45 +1169,54 @@ class PostGameMenuWindow(QMainWindow):
             super().keyPressEvent(event)
 
 
-def show_main_menu():
-    """
-    Mostra o menu principal
-    Retorna: 'play', 'exit'
-    """
-    # Verificar se já existe uma instância do QApplication
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
+def _choose(window, choice):
+    """Registra a escolha feita na janela e a esconde"""
+    window.choice = choice
+    window.close()
 
-    # Configurar ícone da aplicação se existir
-    if os.path.exists("logo.png"):
-        app.setWindowIcon(QIcon("logo.png"))
 
+def _create_main_menu():
+    """Cria a janela do menu principal (uma vez por processo)"""
     menu = SergipeMenuWindow()
+    menu.start_game_signal.connect(lambda: _choose(menu, 'play'))
+    menu.exit_signal.connect(lambda: _choose(menu, 'exit'))
+    return menu
+
 
-    # Variável para controlar o resultado
-    result = {'choice': 'exit'}
+def _create_post_game_menu():
+    """Cria a janela do menu pós-jogo (uma vez por processo)"""
+    menu = PostGameMenuWindow(False, 0.0)
+    menu.play_again_signal.connect(lambda: _choose(menu, 'play_again'))
+    menu.snapshots_signal.connect(lambda: _choose(menu, 'snapshots'))
+    menu.exit_signal.connect(lambda: _choose(menu, 'exit'))
+    return menu
 
-    def on_start_game():
-        result['choice'] = 'play'
-        menu.close()
 
-    def on_exit():
-        result['choice'] = 'exit'
-        menu.close()
+def show_main_menu(on_shown=None):
+    """
+    Mostra o menu principal
+
+    Args:
+        on_shown: Função chamada quando o menu aparece na tela (opcional)
+
+    Retorna: 'play', 'exit'
+    """
+    app = get_application()
 
-    menu.start_game_signal.connect(on_start_game)
-    menu.exit_signal.connect(on_exit)
+    menu = _get_window('main', _create_main_menu)
+    menu.prepare_to_show()
 
     menu.show()
+    app.processEvents()
 
-    # Usar loop de eventos local
-    while menu.isVisible():
-        app.processEvents()
-        import time
-        time.sleep(0.01)
+    profiler = get_startup_profiler()
+    profiler.mark("menu visível")
+    profiler.print_report()
+    if on_shown is not None:
+        on_shown()
 
-    return result['choice']
+    _run_window(menu)
+    return menu.choice
 
 
 def show_post_game_menu(won, fill_percentage):
@@ -1153,52 +1224,68 @@ def show_post_game_menu(won, fill_percentage):
     Mostra menu pós-jogo
     Retorna: 'play_again', 'snapshots', 'exit'
     """
-    # Verificar se já existe uma instância do QApplication
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
-
-    # Configurar ícone da aplicação se existir
-    if os.path.exists("logo.png"):
-        app.setWindowIcon(QIcon("logo.png"))
+    get_application()
 
-    menu = PostGameMenuWindow(won, fill_percentage)
+    menu = _get_window('post_game', _create_post_game_menu)
+    menu.set_result(won, fill_percentage)
+    menu.prepare_to_show()
 
-    # Variável para controlar o resultado
-    result = {'choice': 'exit'}
+    _run_window(menu)
+    return menu.choice
 
-    def on_play_again():
-        result['choice'] = 'play_again'
-        menu.close()
 
-    def on_snapshots():
-        result['choice'] = 'snapshots'
-        menu.close()
 
-    def on_exit():
-        result['choice'] = 'exit'
-        menu.close()
-
-    menu.play_again_signal.connect(on_play_again)
-    menu.snapshots_signal.connect(on_snapshots)
-    menu.exit_signal.connect(on_exit)
+def get_game_view():
+    """
+    Obtém a tela do jogo (criada uma vez, na thread da interface)
 
-    menu.show()
+    Returns:
+        GameView: Tela do jogo
+    """
+    get_application()
+    return _get_window('game', GameView)
 
-    # Usar loop de eventos local ao invés de app.exec_()
-    while menu.isVisible():
-        app.processEvents()
-        import time
-        time.sleep(0.01)
 
-    return result['choice']
+def show_game_view(view, on_shown=None, is_running=None):
+    """
+    Mostra a tela do jogo até a partida terminar (GameView.finish)
 
+    Args:
+        view (GameView): Tela do jogo
+        on_shown: Função chamada quando a tela aparece (opcional)
+        is_running: Função que diz se o jogo continua rodando; se ele parar, a tela é
+            escondida (opcional)
+    """
+    app = get_application()
+    loop = QEventLoop()
+    view.finished.connect(loop.quit)
+
+    # O jogo pode terminar sem chamar finish() (erro na thread do jogo)
+    watchdog = QTimer()
+    if is_running is not None:
+        watchdog.timeout.connect(lambda: is_running() or view.finish())
+        watchdog.start(500)
+
+    view.start()
+    view.showFullScreen()
+    view.raise_()
+    view.activateWindow()
+    app.processEvents()
+    if on_shown is not None:
+        on_shown()
+
+    # Um único loop de eventos: o QTimer da tela mostra os frames, as teclas vão para o jogo
+    if view.isVisible():
+        loop.exec_()
+
+    watchdog.stop()
+    view.finished.disconnect(loop.quit)
+    view.hide()
 
 def show_snapshots_viewer():
     """
     Mostra visualizador de snapshots
     """
-    import os
     import glob
 
     # Verificar se há snapshots
@@ -1214,17 +1301,18 @@ def show_snapshots_viewer():
         show_no_snapshots_message()
         return
 
-    # Mostrar galeria de snapshots
-    app = QApplication(sys.argv)
-    viewer = SnapshotsViewerWindow(snapshot_files)
-    viewer.show()
-    app.exec_()
-
+    # Mostrar galeria de snapshots (janela reaproveitada, com a lista atual de fotos)
+    get_application()
+    viewer = _windows.get('snapshots')
+    if viewer is None:
+        viewer = _windows['snapshots'] = SnapshotsViewerWindow(snapshot_files)
+    else:
+        viewer.set_snapshots(snapshot_files)
+    _run_window(viewer)
 
-def show_no_snapshots_message():
-    """Mostra mensagem quando não há snapshots"""
-    app = QApplication(sys.argv)
 
+def _create_no_snapshots_message():
+    """Cria a mensagem de galeria vazia (uma vez por processo)"""
     msg = QMessageBox()
     msg.setWindowTitle("📸 Snapshots - Viva Sergipe!")
     msg.setText("Nenhum snapshot encontrado!")
@@ -1257,7 +1345,13 @@ def show_no_snapshots_message():
             background-color: #00cc00;
         }
     """)
-    msg.exec_()
+    return msg
+
+
+def show_no_snapshots_message():
+    """Mostra mensagem quando não há snapshots"""
+    get_application()
+    _get_window('no_snapshots', _create_no_snapshots_message).exec_()
 
 
 class SnapshotsViewerWindow(QMainWindow):
@@ -1270,6 +1364,18 @@ class SnapshotsViewerWindow(QMainWindow):
         self.current_index = 0
         self.init_ui()
 
+    def set_snapshots(self, snapshot_files):
+        """
+        Mostra outra lista de fotos (janela reaproveitada), a partir da mais recente
+
+        Args:
+            snapshot_files (list): Caminhos das fotos
+        """
+        self.snapshot_files = sorted(snapshot_files, key=os.path.getmtime, reverse=True)
+        self.current_index = 0
+        self.setWindowTitle(f"📸 Snapshots ({len(self.snapshot_files)} fotos) - Viva Sergipe!")
+        self.load_current_image()
+
     def init_ui(self):
         """Inicializa a interface do usuário"""
         self.setWindowTitle(f"📸 Snapshots ({len(self.snapshot_files)} fotos) - Viva Sergipe!")
@@ -5,24 +5,35 @@ Sistema para otimizar performance e adaptar para diferentes hardwares
 
 import cv2
 import numpy as np
-import time
 import psutil
 import threading
+from collections import deque
 from typing import Dict, Any, Tuple, Optional
 from config_manager import get_config_manager
+from logger import get_logger
+from quality_controller import AdaptiveQualityController, QualityLevel
+
+logger = get_logger(__name__)
 
 
 class PerformanceOptimizer:
-    """Otimizador de performance adaptativo"""
+    """
+    Otimizador de performance adaptativo
+
+    O nível de qualidade é escolhido por um AdaptiveQualityController a partir
+    do tempo de processamento dos frames; os ajustes do nível atual ficam em
+    adaptive_settings e em 'quality'.
+    """
     
     def __init__(self):
         self.config_manager = get_config_manager()
+        # Históricos limitados (deques descartam as amostras antigas sem copiar)
         self.performance_data = {
-            "fps_history": [],
-            "cpu_usage": [],
-            "memory_usage": [],
-            "frame_processing_time": [],
-            "detection_time": []
+            "fps_history": deque(maxlen=100),
+            "cpu_usage": deque(maxlen=60),  # 1 minuto de dados
+            "memory_usage": deque(maxlen=60),
+            "frame_processing_time": deque(maxlen=100),
+            "detection_time": deque(maxlen=100)
         }
         
         # Configurações adaptativas
@@ -32,8 +43,13 @@ class PerformanceOptimizer:
             "frame_skip": 1,
             "detection_frequency": 1,
             "resolution_scale": 1.0,
-            "quality_level": "high"  # high, medium, low
+            "quality_level": "high",  # Nível da escada de qualidade (ultra, high, medium, low, minimal)
+            "model_complexity": 0,
+            "inference_width": None,
+            "overlays": True
         }
+        self.quality_controller = None
+        self._quality_lock = threading.Lock()
         
         # Limites de hardware
         self.hardware_limits = {
@@ -45,10 +61,10 @@ class PerformanceOptimizer:
         # Detectar hardware automaticamente
         self.detect_hardware_capabilities()
         
-        # Thread de monitoramento
-        self.monitoring = True
+        # Thread de monitoramento (iniciada pelo registro de serviços)
+        self.monitoring = False
         self.monitor_thread = None
-        self.start_monitoring()
+        self._stop_event = threading.Event()
     
     def detect_hardware_capabilities(self):
         """Detecta capacidades do hardware automaticamente"""
@@ -66,17 +82,14 @@ class PerformanceOptimizer:
                 hardware_class = "low_end"
                 self.adaptive_settings["quality_level"] = "low"
                 self.adaptive_settings["target_fps"] = 20
-                self.adaptive_settings["resolution_scale"] = 0.7
             elif cpu_count <= 4 and memory_gb <= 8:
                 hardware_class = "mid_range"
                 self.adaptive_settings["quality_level"] = "medium"
                 self.adaptive_settings["target_fps"] = 25
-                self.adaptive_settings["resolution_scale"] = 0.85
             else:
                 hardware_class = "high_end"
                 self.adaptive_settings["quality_level"] = "high"
                 self.adaptive_settings["target_fps"] = 30
-                self.adaptive_settings["resolution_scale"] = 1.0
             
             print(f"  • Classificação: {hardware_class}")
             print(f"  • Qualidade adaptativa: {self.adaptive_settings['quality_level']}")
@@ -90,6 +103,30 @@ class PerformanceOptimizer:
             # Usar configurações conservadoras
             self.adaptive_settings["quality_level"] = "medium"
             self.adaptive_settings["target_fps"] = 25
+
+        # O nível detectado é o ponto de partida do controle de qualidade
+        with self._quality_lock:
+            self.quality_controller = AdaptiveQualityController(
+                1.0 / self.adaptive_settings["target_fps"],
+                initial_level=self.adaptive_settings["quality_level"]
+            )
+            self._apply_quality_level(self.quality_controller.level)
+
+    @property
+    def quality(self) -> QualityLevel:
+        """Nível de qualidade atual"""
+        return self.quality_controller.level
+
+    def _apply_quality_level(self, level: QualityLevel):
+        """Copia os ajustes do nível de qualidade para adaptive_settings"""
+        self.adaptive_settings.update({
+            "quality_level": level.name,
+            "model_complexity": level.model_complexity,
+            "inference_width": level.inference_width,
+            "detection_frequency": level.detection_frequency,
+            "resolution_scale": level.resolution_scale,
+            "overlays": level.overlays
+        })
     
     def optimize_frame_processing(self, frame: np.ndarray) -> np.ndarray:
         """
@@ -108,20 +145,28 @@ class PerformanceOptimizer:
             new_height = int(height * self.adaptive_settings["resolution_scale"])
             frame = cv2.resize(frame, (new_width, new_height))
         
-        # Aplicar filtros baseados na qualidade
-        quality = self.adaptive_settings["quality_level"]
-        
-        if quality == "low":
-            # Reduzir qualidade para melhor performance
-            frame = cv2.GaussianBlur(frame, (3, 3), 0)
-        elif quality == "medium":
-            # Qualidade balanceada
-            pass  # Sem filtros adicionais
-        else:  # high
-            # Manter qualidade máxima
-            pass
-        
         return frame
+
+    def prepare_inference_frame(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Reduz o frame à largura de inferência do nível de qualidade atual
+
+        Os landmarks do MediaPipe são normalizados, então podem ser usados
+        diretamente no frame em tamanho original.
+
+        Args:
+            frame: Frame BGR
+            
+        Returns:
+            Frame para a inferência (o próprio frame se já for pequeno o bastante)
+        """
+        inference_width = self.adaptive_settings["inference_width"]
+        height, width = frame.shape[:2]
+        if inference_width is None or width <= inference_width:
+            return frame
+
+        inference_height = max(1, round(height * inference_width / width))
+        return cv2.resize(frame, (inference_width, inference_height), interpolation=cv2.INTER_AREA)
     
     def should_skip_frame(self, frame_count: int) -> bool:
         """
@@ -157,58 +202,22 @@ class PerformanceOptimizer:
             processing_time: Tempo de processamento do frame
             detection_time: Tempo de detecção corporal
         """
-        # Manter histórico limitado
-        max_history = 100
-        
         self.performance_data["fps_history"].append(fps)
         self.performance_data["frame_processing_time"].append(processing_time)
         self.performance_data["detection_time"].append(detection_time)
         
-        # Limitar tamanho do histórico
-        for key in ["fps_history", "frame_processing_time", "detection_time"]:
-            if len(self.performance_data[key]) > max_history:
-                self.performance_data[key] = self.performance_data[key][-max_history:]
-        
         # Adaptar configurações baseado na performance
         self.adapt_settings_based_on_performance()
     
     def adapt_settings_based_on_performance(self):
-        """Adapta configurações baseado na performance atual"""
-        if len(self.performance_data["fps_history"]) < 10:
-            return  # Não há dados suficientes
-        
-        # Calcular FPS médio recente
-        recent_fps = np.mean(self.performance_data["fps_history"][-10:])
-        target_fps = self.adaptive_settings["target_fps"]
-        min_fps = self.adaptive_settings["min_fps"]
-        
-        # Se FPS está muito baixo, reduzir qualidade
-        if recent_fps < min_fps:
-            if self.adaptive_settings["frame_skip"] < 3:
-                self.adaptive_settings["frame_skip"] += 1
-                print(f"⚡ Performance baixa detectada. Frame skip: {self.adaptive_settings['frame_skip']}")
-            
-            if self.adaptive_settings["detection_frequency"] < 3:
-                self.adaptive_settings["detection_frequency"] += 1
-                print(f"⚡ Reduzindo frequência de detecção: {self.adaptive_settings['detection_frequency']}")
-            
-            if self.adaptive_settings["resolution_scale"] > 0.5:
-                self.adaptive_settings["resolution_scale"] -= 0.1
-                print(f"⚡ Reduzindo resolução: {self.adaptive_settings['resolution_scale']:.1f}")
+        """Adapta o nível de qualidade ao tempo de processamento do último frame"""
+        if not self.performance_data["frame_processing_time"]:
+            return  # Não há dados
         
-        # Se FPS está bom, pode melhorar qualidade
-        elif recent_fps > target_fps * 1.2:
-            if self.adaptive_settings["frame_skip"] > 1:
-                self.adaptive_settings["frame_skip"] = max(1, self.adaptive_settings["frame_skip"] - 1)
-                print(f"⚡ Performance boa. Frame skip: {self.adaptive_settings['frame_skip']}")
-            
-            if self.adaptive_settings["detection_frequency"] > 1:
-                self.adaptive_settings["detection_frequency"] = max(1, self.adaptive_settings["detection_frequency"] - 1)
-                print(f"⚡ Aumentando frequência de detecção: {self.adaptive_settings['detection_frequency']}")
-            
-            if self.adaptive_settings["resolution_scale"] < 1.0:
-                self.adaptive_settings["resolution_scale"] = min(1.0, self.adaptive_settings["resolution_scale"] + 0.1)
-                print(f"⚡ Aumentando resolução: {self.adaptive_settings['resolution_scale']:.1f}")
+        with self._quality_lock:
+            transition = self.quality_controller.update(self.performance_data["frame_processing_time"][-1])
+            if transition is not None:
+                self._apply_quality_level(self.quality_controller.level)
     
     def get_optimized_camera_settings(self) -> Dict[str, Any]:
         """
@@ -219,7 +228,7 @@ class PerformanceOptimizer:
         """
         quality = self.adaptive_settings["quality_level"]
         
-        if quality == "low":
+        if quality in ("low", "minimal"):
             return {
                 "width": 640,
                 "height": 480,
@@ -233,7 +242,7 @@ class PerformanceOptimizer:
                 "fps": 25,
                 "buffer_size": 2
             }
-        else:  # high
+        else:  # ultra, high
             return {
                 "width": 1920,
                 "height": 1080,
@@ -246,6 +255,8 @@ class PerformanceOptimizer:
         if self.monitor_thread and self.monitor_thread.is_alive():
             return
         
+        self.monitoring = True
+        self._stop_event.clear()
         self.monitor_thread = threading.Thread(
             target=self._monitor_system,
             daemon=True,
@@ -255,33 +266,30 @@ class PerformanceOptimizer:
     
     def _monitor_system(self):
         """Loop de monitoramento do sistema"""
-        while self.monitoring:
+        # Uso de CPU medido entre chamadas sem bloquear: a thread espera no evento de
+        # parada e stop_monitoring() não precisa aguardar uma medição em andamento
+        psutil.cpu_percent(interval=None)
+        while self.monitoring and not self._stop_event.wait(1.0):
             try:
                 # Coletar métricas do sistema
-                cpu_percent = psutil.cpu_percent(interval=1)
+                cpu_percent = psutil.cpu_percent(interval=None)
                 memory_percent = psutil.virtual_memory().percent
                 
                 self.performance_data["cpu_usage"].append(cpu_percent)
                 self.performance_data["memory_usage"].append(memory_percent)
                 
-                # Limitar histórico
-                max_history = 60  # 1 minuto de dados
-                for key in ["cpu_usage", "memory_usage"]:
-                    if len(self.performance_data[key]) > max_history:
-                        self.performance_data[key] = self.performance_data[key][-max_history:]
-                
                 # Verificar se sistema está sobrecarregado
                 if cpu_percent > 90 or memory_percent > 90:
-                    print(f"⚠️ Sistema sobrecarregado - CPU: {cpu_percent:.1f}%, RAM: {memory_percent:.1f}%")
-                    # Forçar configurações mais conservadoras
-                    self.adaptive_settings["frame_skip"] = max(2, self.adaptive_settings["frame_skip"])
-                    self.adaptive_settings["detection_frequency"] = max(2, self.adaptive_settings["detection_frequency"])
-                
-                time.sleep(1)
+                    logger.warning("⚠️ Sistema sobrecarregado - CPU: %.1f%%, RAM: %.1f%%", cpu_percent, memory_percent)
+                    # Descer um nível de qualidade (respeitando o intervalo entre mudanças)
+                    with self._quality_lock:
+                        reason = f"sistema sobrecarregado (CPU {cpu_percent:.0f}%, RAM {memory_percent:.0f}%)"
+                        if self.quality_controller.step_down(reason) is not None:
+                            self._apply_quality_level(self.quality_controller.level)
                 
             except Exception as e:
-                print(f"Erro no monitoramento: {e}")
-                time.sleep(5)
+                logger.error("Erro no monitoramento: %s", e)
+                self._stop_event.wait(5)
     
     def get_performance_report(self) -> Dict[str, Any]:
         """
@@ -297,6 +305,15 @@ class PerformanceOptimizer:
                 "class": self.config_manager.get('performance', 'hardware_class', 'unknown')
             },
             "current_settings": self.adaptive_settings.copy(),
+            "quality": {
+                "level": self.quality.name,
+                "target_frame_time_ms": round(self.quality_controller.target_frame_time * 1000, 2),
+                "measured_frame_time_ms": {
+                    name: round(frame_time * 1000, 2)
+                    for name, (frame_time, _) in self.quality_controller.measured_frame_time.items()
+                },
+                "transitions": [transition.to_dict() for transition in self.quality_controller.transitions]
+            },
             "performance": {}
         }
         
@@ -319,6 +336,7 @@ class PerformanceOptimizer:
     def stop_monitoring(self):
         """Para o monitoramento"""
         self.monitoring = False
+        self._stop_event.set()
         if self.monitor_thread and self.monitor_thread.is_alive():
             self.monitor_thread.join(timeout=2)
     
@@ -328,15 +346,12 @@ class PerformanceOptimizer:
         print("🔄 Configurações adaptativas resetadas")
 
 
-# Instância global do otimizador
-performance_optimizer = PerformanceOptimizer()
-
-
 def get_performance_optimizer() -> PerformanceOptimizer:
     """
-    Obtém a instância global do otimizador de performance
+    Obtém a instância global do otimizador de performance (serviço "performance")
     
     Returns:
         PerformanceOptimizer: Instância do otimizador
     """
-    return performance_optimizer
+    from services import get_service
+    return get_service("performance")
@@ -0,0 +1,191 @@
+"""
+PERSISTÊNCIA - VIVA SERGIPE!
+Escrita atômica de arquivos e gravação adiada (write-behind) com agrupamento de mudanças
+"""
+
+import atexit
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, Optional
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def atomic_write_text(path: str, text: str):
+    """
+    Escreve um arquivo de texto de forma atômica
+
+    O conteúdo é escrito em um arquivo temporário na mesma pasta e depois
+    renomeado por cima do destino: uma falha no meio da escrita nunca deixa
+    o arquivo pela metade.
+
+    Args:
+        path (str): Caminho do arquivo
+        text (str): Conteúdo (UTF-8)
+
+    Raises:
+        OSError: Se não for possível escrever o arquivo
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class WriteBehindFile:
+    """
+    Arquivo gravado em segundo plano.
+
+    mark_dirty() apenas marca que há mudanças; uma thread grava o arquivo
+    depois de 'flush_delay' segundos sem novas mudanças (no máximo
+    'max_delay' segundos depois da primeira), agrupando várias mudanças em
+    uma única escrita atômica. flush() grava na hora e shutdown() grava o
+    que estiver pendente ao encerrar.
+    """
+
+    def __init__(self, path: str, serialize: Callable[[], str], flush_delay: float = 0.5,
+                 max_delay: float = 2.0, lock: Optional[threading.RLock] = None):
+        """
+        Args:
+            path (str): Caminho do arquivo
+            serialize (Callable[[], str]): Gera o conteúdo do arquivo (chamada com 'lock' adquirido)
+            flush_delay (float): Tempo sem mudanças antes de gravar (segundos)
+            max_delay (float): Atraso máximo desde a primeira mudança pendente (segundos)
+            lock (Optional[threading.RLock]): Lock que protege os dados serializados
+        """
+        self.path = path
+        self.serialize = serialize
+        self.flush_delay = flush_delay
+        self.max_delay = max(max_delay, flush_delay)
+        self.lock = lock if lock is not None else threading.RLock()
+        self.writes = 0
+
+        self._condition = threading.Condition(self.lock)
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._first_change = 0.0
+        self._last_change = 0.0
+        self._stopping = False
+        self._thread = None
+
+    @property
+    def dirty(self) -> bool:
+        """True se há mudanças ainda não gravadas"""
+        return self._dirty
+
+    def mark_dirty(self):
+        """Marca que há mudanças e agenda a gravação"""
+        with self._condition:
+            now = time.monotonic()
+            if not self._dirty:
+                self._dirty = True
+                self._first_change = now
+            self._last_change = now
+
+            if self._stopping:
+                return  # Encerrando: shutdown() grava o que estiver pendente
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._flush_loop, name="WriteBehindFile", daemon=True)
+                self._thread.start()
+                atexit.register(self.shutdown)
+            self._condition.notify()
+
+    def _flush_loop(self):
+        """Espera mudanças, aguarda o intervalo sem mudanças e grava"""
+        while True:
+            with self._condition:
+                while not self._dirty and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    return
+
+                # Agrupa mudanças próximas em uma única escrita
+                while self._dirty and not self._stopping:
+                    deadline = min(self._last_change + self.flush_delay, self._first_change + self.max_delay)
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                if self._stopping:
+                    return
+
+            self.flush()
+
+    def flush(self) -> bool:
+        """
+        Grava agora as mudanças pendentes
+
+        Returns:
+            bool: True se o arquivo está em dia (gravado ou sem mudanças)
+        """
+        with self._write_lock:
+            with self.lock:
+                if not self._dirty:
+                    return True
+                try:
+                    text = self.serialize()
+                except Exception as e:
+                    logger.error("Erro ao serializar %s: %s", self.path, e)
+                    return False
+                self._dirty = False
+
+            try:
+                atomic_write_text(self.path, text)
+            except OSError as e:
+                logger.error("Erro ao gravar %s: %s", self.path, e)
+                with self.lock:
+                    # Tenta de novo na próxima mudança ou no encerramento
+                    if not self._dirty:
+                        self._dirty = True
+                        self._first_change = self._last_change = time.monotonic()
+                return False
+
+            self.writes += 1
+            return True
+
+    def write_now(self, text: str) -> bool:
+        """
+        Grava um conteúdo imediatamente (descartando mudanças pendentes)
+
+        Args:
+            text (str): Conteúdo completo do arquivo
+
+        Returns:
+            bool: True se gravou com sucesso
+        """
+        with self._write_lock:
+            with self.lock:
+                self._dirty = False
+            try:
+                atomic_write_text(self.path, text)
+            except OSError as e:
+                logger.error("Erro ao gravar %s: %s", self.path, e)
+                return False
+            self.writes += 1
+            return True
+
+    def shutdown(self):
+        """Para a thread de gravação e grava o que estiver pendente"""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+        self.flush()
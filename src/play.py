@@ -17,9 +17,9 @@ from pathlib import Path
 try:
     from sergipe_utils import load_sergipe_contour, create_body_mask
     from utils import process_frame, initialize_pose_model
-    from config_manager import ConfigManager
+    from config_manager import get_config_manager
     from game_modes import GameModeManager
-    from performance_optimizer import PerformanceOptimizer
+    from performance_optimizer import get_performance_optimizer
     from visual_feedback import get_visual_feedback_manager
     import os
     import sys
@@ -41,9 +41,9 @@ except ImportError as e:
     sys.exit(1)
 
 # Configuração do jogo
-config_manager = ConfigManager()
+config_manager = get_config_manager()  # Shared instance: one in-memory config per file
 game_mode_manager = GameModeManager()
-performance_optimizer = PerformanceOptimizer()
+performance_optimizer = get_performance_optimizer()
 visual_feedback = get_visual_feedback_manager()
 
 # Carregar configurações
@@ -132,6 +132,9 @@ import pygame  # Import pygame for audio processing
 # Import TensorFlow and Keras for loading ML model
 from tensorflow.keras.models import load_model
 
+# In-place translucent overlays
+from blending import tint
+
 # Import custom utility functions
 from utils import (
     blink_screen,
@@ -391,9 +394,7 @@ def main():
                         game_over_sound_played = True  # Ensures that commands within this if-loop are only executed once.
 
                     #  Adds a translucent white background to frame.
-                    white_rect = np.zeros_like(frame) + 255
-                    alpha = 0.5
-                    frame = cv2.addWeighted(frame, 1 - alpha, white_rect, alpha, 0)
+                    tint(frame, (255, 255, 255), 0.5)
 
                     # Display 'Game Over' message (total score, restart + exit instructions).
                     display_gameover_message(frame, points, ROUNDS)
@@ -429,9 +430,7 @@ def main():
             # If countdown = False (initial setting -> start screen).
             else:
                 #  Adds a translucent white background to frame.
-                white_rect = np.zeros_like(frame) + 255
-                alpha = 0.5
-                frame = cv2.addWeighted(frame, 1 - alpha, white_rect, alpha, 0)
+                tint(frame, (255, 255, 255), 0.5)
 
                 ## Displays text on start screen.
                 # Defines a list of text and their properties
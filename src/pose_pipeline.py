@@ -0,0 +1,192 @@
+"""
+PIPELINE DE INFERÊNCIA - VIVA SERGIPE!
+Executa a detecção de pose do MediaPipe em uma thread própria, em paralelo com a renderização
+"""
+
+import cv2
+import numpy as np
+import threading
+import time
+from typing import Any, Optional
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class PoseResult:
+    """Resultado de detecção de pose associado ao frame de origem"""
+
+    __slots__ = ("results", "frame_id", "timestamp", "latency")
+
+    def __init__(self, results: Any, frame_id: int, timestamp: float, latency: float):
+        """
+        Args:
+            results (Any): Resultados do MediaPipe (pose_landmarks)
+            frame_id (int): ID do frame que originou a detecção
+            timestamp (float): Momento em que o frame foi enviado (time.time())
+            latency (float): Tempo entre o envio do frame e a publicação do resultado (segundos)
+        """
+        self.results = results
+        self.frame_id = frame_id
+        self.timestamp = timestamp
+        self.latency = latency
+
+    @property
+    def pose_landmarks(self):
+        """Landmarks detectados (mesma interface dos resultados do MediaPipe)"""
+        return self.results.pose_landmarks
+
+
+class PoseInferenceWorker:
+    """
+    Executa pose.process em uma thread dedicada.
+
+    O loop de renderização envia frames com submit() e desenha o resultado mais
+    recente obtido com latest(). Se a inferência estiver ocupada, apenas o frame
+    enviado por último fica pendente (o mais novo vence). O MediaPipe libera o
+    GIL durante a inferência, então uma thread é suficiente.
+    """
+
+    def __init__(self, pose):
+        """
+        Args:
+            pose (mediapipe.solutions.pose.Pose): Modelo de pose inicializado
+        """
+        self.pose = pose
+        self.worker_thread = None
+        self.running = False
+
+        # Dois buffers RGB: um em inferência e um pendente
+        self._buffers = [None, None]
+        self._pending = -1
+        self._processing = -1
+        self._pending_info = (0, 0.0)
+        self._condition = threading.Condition()
+
+        self._latest: Optional[PoseResult] = None
+
+        # Estatísticas
+        self.frames_submitted = 0
+        self.frames_processed = 0
+        self.frames_skipped = 0
+        self.last_inference_time = 0.0
+
+    def start(self):
+        """Inicia a thread de inferência"""
+        if self.worker_thread and self.worker_thread.is_alive():
+            return
+
+        self.running = True
+        self.worker_thread = threading.Thread(
+            target=self._inference_loop,
+            daemon=True,
+            name="PoseInference"
+        )
+        self.worker_thread.start()
+
+    def submit(self, frame: np.ndarray, frame_id: int) -> None:
+        """
+        Envia um frame BGR para inferência sem esperar pelo resultado
+
+        Args:
+            frame (np.ndarray): Frame no formato BGR
+            frame_id (int): ID do frame (ex: CameraCapture.last_frame_id)
+        """
+        with self._condition:
+            slot = 1 if self._processing == 0 else 0
+            buffer = self._buffers[slot]
+            if buffer is None or buffer.shape != frame.shape:
+                buffer = np.empty_like(frame)
+                self._buffers[slot] = buffer
+
+            # Converte para RGB direto no buffer pendente (não compartilhado com a inferência)
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=buffer)
+
+            if self._pending != -1:
+                self.frames_skipped += 1
+            self._pending = slot
+            self._pending_info = (frame_id, time.time())
+            self.frames_submitted += 1
+            self._condition.notify_all()
+
+    def set_pose(self, pose):
+        """
+        Troca o modelo de pose (ex: outro model_complexity) e fecha o anterior
+
+        Espera a inferência em andamento terminar; o próximo frame já usa o novo modelo.
+
+        Args:
+            pose (mediapipe.solutions.pose.Pose): Novo modelo de pose inicializado
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._processing == -1)
+            previous, self.pose = self.pose, pose
+        previous.close()
+
+    def latest(self) -> Optional[PoseResult]:
+        """
+        Obtém o resultado de detecção mais recente
+
+        Returns:
+            Optional[PoseResult]: Último resultado publicado, ou None se ainda não houver
+        """
+        return self._latest
+
+    def _inference_loop(self):
+        """Loop da thread de inferência"""
+        while self.running:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending != -1 or not self.running, 0.5)
+                if not self.running:
+                    break
+                if self._pending == -1:
+                    continue
+                self._processing = self._pending
+                self._pending = -1
+                frame_id, timestamp = self._pending_info
+                rgb_frame = self._buffers[self._processing]
+
+            inference_start = time.time()
+            try:
+                results = self.pose.process(rgb_frame)
+            except Exception as e:
+                logger.error("❌ Erro na inferência de pose: %s", e)
+                results = None
+            now = time.time()
+
+            with self._condition:
+                self._processing = -1
+                if results is not None:
+                    self.last_inference_time = now - inference_start
+                    self.frames_processed += 1
+                    self._latest = PoseResult(results, frame_id, timestamp, now - timestamp)
+                self._condition.notify_all()
+
+    def wait_for_result(self, frame_id: int, timeout: float = 1.0) -> Optional[PoseResult]:
+        """
+        Espera até que haja um resultado para o frame informado (ou posterior)
+
+        Args:
+            frame_id (int): ID mínimo do frame
+            timeout (float): Tempo máximo de espera (segundos)
+
+        Returns:
+            Optional[PoseResult]: Resultado mais recente, ou None se não chegou a tempo
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._latest is not None and self._latest.frame_id >= frame_id,
+                timeout
+            )
+            result = self._latest
+        if result is not None and result.frame_id >= frame_id:
+            return result
+        return None
+
+    def stop(self):
+        """Para a thread de inferência"""
+        self.running = False
+        with self._condition:
+            self._condition.notify_all()
+        if self.worker_thread and self.worker_thread.is_alive():
+            self.worker_thread.join(timeout=2)
@@ -0,0 +1,212 @@
+"""
+CONTROLE ADAPTATIVO DE QUALIDADE - VIVA SERGIPE!
+Escada de qualidade controlada pelo tempo de frame, com histerese e intervalo mínimo entre mudanças
+"""
+
+import time
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class QualityLevel:
+    """
+    Degrau da escada de qualidade.
+
+    'relative_cost' é opcional: o custo por frame relativo a "high", como o
+    medido na máquina do jogo com scripts/benchmark.py --quality-ladder.
+    Quando todos os níveis da escada o têm, ela é ordenada por ele; senão,
+    vale a ordem dada.
+    """
+
+    __slots__ = ("name", "relative_cost", "model_complexity", "inference_width",
+                 "detection_frequency", "resolution_scale", "overlays")
+
+    def __init__(self, name: str, relative_cost: Optional[float] = None, model_complexity: int = 0,
+                 inference_width: Optional[int] = None, detection_frequency: int = 1,
+                 resolution_scale: float = 1.0, overlays: bool = True):
+        """
+        Args:
+            name (str): Nome do nível
+            relative_cost (Optional[float]): Custo relativo por frame (None: desconhecido)
+            model_complexity (int): model_complexity do MediaPipe (initialize_pose_model)
+            inference_width (Optional[int]): Largura máxima da entrada da inferência (None: sem limite)
+            detection_frequency (int): Detecta a cada N frames (o tracker prevê os demais)
+            resolution_scale (float): Escala do frame capturado
+            overlays (bool): Desenhar sobreposições opcionais (feedback de detecção, máscara do corpo)
+        """
+        self.name = name
+        self.relative_cost = relative_cost
+        self.model_complexity = model_complexity
+        self.inference_width = inference_width
+        self.detection_frequency = detection_frequency
+        self.resolution_scale = resolution_scale
+        self.overlays = overlays
+
+    def __repr__(self):
+        return f"QualityLevel({self.name!r})"
+
+
+# Escada de qualidade padrão, do mais caro para o mais barato. Sem custos medidos:
+# cada nível não é mais caro que o anterior em nenhum ajuste (modelo, largura da
+# inferência, frequência de detecção, escala e sobreposições), e isso basta para a ordem.
+QUALITY_LADDER = (
+    QualityLevel("ultra", model_complexity=1),
+    QualityLevel("high"),
+    QualityLevel("medium", inference_width=640),
+    QualityLevel("low", inference_width=480, detection_frequency=2),
+    QualityLevel("minimal", inference_width=320, detection_frequency=3,
+                 resolution_scale=0.75, overlays=False),
+)
+
+
+class QualityTransition:
+    """Mudança de nível e a medição que a causou"""
+
+    __slots__ = ("timestamp", "from_level", "to_level", "frame_time", "target_frame_time", "reason")
+
+    def __init__(self, timestamp: float, from_level: str, to_level: str, frame_time: float,
+                 target_frame_time: float, reason: str):
+        self.timestamp = timestamp
+        self.from_level = from_level
+        self.to_level = to_level
+        self.frame_time = frame_time
+        self.target_frame_time = target_frame_time
+        self.reason = reason
+
+    def to_dict(self) -> Dict:
+        return {
+            "timestamp": self.timestamp,
+            "from": self.from_level,
+            "to": self.to_level,
+            "frame_time_ms": round(self.frame_time * 1000, 2),
+            "target_frame_time_ms": round(self.target_frame_time * 1000, 2),
+            "reason": self.reason,
+        }
+
+
+class AdaptiveQualityController:
+    """
+    Controlador de qualidade em malha fechada.
+
+    Compara o tempo médio de frame de uma janela com o tempo alvo e desce um
+    degrau quando passa de 'degrade_ratio' x alvo ou sobe um degrau quando fica
+    abaixo de 'upgrade_ratio' x alvo. A faixa entre as duas razões (histerese),
+    o intervalo mínimo entre mudanças e a janela recomeçada a cada mudança
+    evitam que a qualidade oscile. O tempo medido em cada degrau é guardado:
+    um degrau que se mostrou caro demais não é tentado de novo por 'memory'
+    segundos.
+    """
+
+    def __init__(self, target_frame_time: float, ladder: Sequence[QualityLevel] = QUALITY_LADDER,
+                 initial_level: str = "high", degrade_ratio: float = 1.15, upgrade_ratio: float = 0.7,
+                 cooldown: float = 3.0, window: int = 30, memory: float = 60.0):
+        """
+        Args:
+            target_frame_time (float): Tempo alvo por frame (segundos)
+            ladder (Sequence[QualityLevel]): Níveis de qualidade, do mais caro para o mais barato
+                (reordenados por relative_cost quando todos o têm)
+            initial_level (str): Nome do nível inicial
+            degrade_ratio (float): Desce um degrau acima de degrade_ratio x alvo
+            upgrade_ratio (float): Sobe um degrau abaixo de upgrade_ratio x alvo
+            cooldown (float): Intervalo mínimo entre mudanças (segundos)
+            window (int): Frames medidos antes de decidir
+            memory (float): Por quanto tempo o tempo medido de um nível é considerado (segundos)
+        """
+        if all(level.relative_cost is not None for level in ladder):
+            self.ladder: List[QualityLevel] = sorted(ladder, key=lambda level: level.relative_cost, reverse=True)
+        else:
+            self.ladder = list(ladder)
+        self.target_frame_time = target_frame_time
+        self.degrade_ratio = degrade_ratio
+        self.upgrade_ratio = upgrade_ratio
+        self.cooldown = cooldown
+        self.window = window
+        self.memory = memory
+
+        names = [level.name for level in self.ladder]
+        self.index = names.index(initial_level) if initial_level in names else 0
+        self.frame_times = deque(maxlen=window)
+        self.measured_frame_time: Dict[str, Tuple[float, float]] = {}
+        self.transitions = deque(maxlen=50)
+        self.last_change = float("-inf")
+
+    @property
+    def level(self) -> QualityLevel:
+        """Nível de qualidade atual"""
+        return self.ladder[self.index]
+
+    def set_target_frame_time(self, target_frame_time: float):
+        """Define o tempo alvo por frame (segundos)"""
+        self.target_frame_time = target_frame_time
+
+    def update(self, frame_time: float, now: Optional[float] = None) -> Optional[QualityTransition]:
+        """
+        Registra o tempo de um frame e muda de nível se necessário
+
+        Args:
+            frame_time (float): Tempo do frame (segundos)
+            now (Optional[float]): Instante atual (padrão: time.monotonic())
+
+        Returns:
+            Optional[QualityTransition]: A mudança feita, ou None
+        """
+        if now is None:
+            now = time.monotonic()
+
+        self.frame_times.append(frame_time)
+        if len(self.frame_times) < self.window or now - self.last_change < self.cooldown:
+            return None
+
+        average = sum(self.frame_times) / len(self.frame_times)
+        self.measured_frame_time[self.level.name] = (average, now)
+
+        if average > self.target_frame_time * self.degrade_ratio:
+            return self._move(self.index + 1, average, now, "frame acima do alvo")
+
+        if average < self.target_frame_time * self.upgrade_ratio and self.index > 0:
+            # Não volta para um nível que já foi medido acima do alvo
+            richer = self.ladder[self.index - 1]
+            measured, measured_at = self.measured_frame_time.get(richer.name, (0.0, float("-inf")))
+            if now - measured_at > self.memory or measured <= self.target_frame_time * self.degrade_ratio:
+                return self._move(self.index - 1, average, now, "folga no tempo de frame")
+        return None
+
+    def step_down(self, reason: str, now: Optional[float] = None) -> Optional[QualityTransition]:
+        """
+        Desce um degrau por um motivo externo (ex: sistema sobrecarregado), respeitando o intervalo
+
+        Args:
+            reason (str): Motivo da mudança
+            now (Optional[float]): Instante atual (padrão: time.monotonic())
+
+        Returns:
+            Optional[QualityTransition]: A mudança feita, ou None
+        """
+        if now is None:
+            now = time.monotonic()
+        if now - self.last_change < self.cooldown:
+            return None
+        average = sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0.0
+        return self._move(self.index + 1, average, now, reason)
+
+    def _move(self, index: int, frame_time: float, now: float, reason: str) -> Optional[QualityTransition]:
+        """Muda para o degrau 'index' (se existir) e registra a mudança"""
+        if not 0 <= index < len(self.ladder) or index == self.index:
+            return None
+
+        transition = QualityTransition(time.time(), self.level.name, self.ladder[index].name,
+                                       frame_time, self.target_frame_time, reason)
+        samples = len(self.frame_times)
+        self.index = index
+        self.last_change = now
+        self.frame_times.clear()
+        self.transitions.append(transition)
+
+        logger.info("⚡ Qualidade %s -> %s: %.1f ms/frame em %d frames (alvo %.1f ms, %s)",
+                    transition.from_level, transition.to_level, frame_time * 1000, samples,
+                    self.target_frame_time * 1000, reason)
+        return transition
@@ -1,25 +1,40 @@
 #!/usr/bin/env python3
 """
 VIVA SERGIPE! - Versão Headless
-Jogo sem interface gráfica para testes e automação
+Jogo controlado por filas; os frames são mostrados na tela do jogo (GameView) da aplicação Qt
 """
 
 import cv2
-import mediapipe as mp
 import numpy as np
 import pygame
 import time
 import os
 import sys
+import queue
 from pathlib import Path
 
 # Importar módulos do projeto
 try:
-    from sergipe_utils import load_sergipe_contour, create_body_mask
+    from sergipe_utils import (
+        ContourAsset,
+        BodyFillAnalyzer,
+        save_victory_photo,
+        display_sergipe_interface,
+        display_victory_message,
+        display_game_over_message,
+    )
     from utils import process_frame, initialize_pose_model
-    from config_manager import ConfigManager
+    from landmark_renderer import get_landmark_renderer
+    from config_manager import get_config_manager
     from game_modes import GameModeManager
-    from performance_optimizer import PerformanceOptimizer
+    from performance_optimizer import get_performance_optimizer
+    from camera_capture import CameraCapture
+    from pose_pipeline import PoseInferenceWorker
+    from landmark_tracker import LandmarkTracker
+    from logger import get_log_manager
+    from blending import tint
+    from asset_preloader import get_asset_preloader, WAIT_TIMEOUT
+    from game_view import NO_KEY
     
     # Adicionar raiz do projeto ao path para imports
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -38,9 +53,9 @@ except ImportError as e:
     sys.exit(1)
 
 # Configuração
-config_manager = ConfigManager()
+config_manager = get_config_manager()  # Shared instance: one in-memory config per file
+get_log_manager().configure(config_manager)  # Per-module log levels from config
 game_mode_manager = GameModeManager()
-performance_optimizer = PerformanceOptimizer()
 
 # Carregar configurações
 GAME_SETTINGS = config_manager.get_game_settings()
@@ -63,32 +78,66 @@ def load_audio():
 def run_game_headless(command_queue, result_queue):
     """
     Executa o jogo em modo headless, controlado por queues
+
+    O comando "show_game" traz a tela (GameView) onde a partida é mostrada; a
+    thread da interface cuida da janela e do ritmo de atualização.
     """
-    # Initialize game components
-    contour_mask = load_sergipe_contour(CONTOUR_PATH)
-    if contour_mask is None:
+    # Process-wide service (one monitor thread), started on first use
+    performance_optimizer = get_performance_optimizer()
+
+    # Contour, camera, sounds and a warmed-up pose model are prepared while the menu is shown;
+    # anything the preloader could not provide is loaded here
+    preloader = get_asset_preloader()
+    preloader.wait(WAIT_TIMEOUT)
+
+    # Initialize game components (resized contour variants are cached per resolution)
+    contour = preloader.contour or ContourAsset.load(CONTOUR_PATH)
+    if contour is None:
         print("Error: Could not load Sergipe contour.")
         return
 
-    capture = cv2.VideoCapture(0)
-    if not capture.isOpened():
-        print("Error: Could not open camera.")
-        return
+    # Body mask and fill are computed at a fixed analysis resolution
+    body_analyzer = BodyFillAnalyzer(contour, config_manager.get_analysis_resolution())
 
-    capture.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-    capture.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+    capture = preloader.take_camera()
+    if capture is None:
+        capture = CameraCapture(
+            config_manager.get('camera', 'device_id', 0),
+            performance_optimizer.get_optimized_camera_settings()
+        )
+        if not capture.start():
+            print("Error: Could not open camera.")
+            return
 
     # Initialize MediaPipe
-    pose = initialize_pose_model()
+    pose_complexity = performance_optimizer.quality.model_complexity
+    pose = preloader.take_pose(pose_complexity) or initialize_pose_model(model_complexity=pose_complexity)
+
+    # Landmarks for frames without a new detection are predicted by the tracker
+    landmark_tracker = LandmarkTracker()
+    tracked_frame_id = 0
+
+    # Landmarks are drawn once per frame, after mirroring, in the configured style
+    settings = config_manager.get_snapshot()
+    landmark_renderer = get_landmark_renderer(settings.landmark_style)
+
+    # Run pose inference on its own thread so it overlaps with rendering
+    pose_worker = None
+    if settings.pipelined_inference:
+        pose_worker = PoseInferenceWorker(pose)
+        pose_worker.start()
 
     # Initialize pygame for audio
     pygame.init()
     pygame.mixer.init()
 
-    # Load sounds
-    victory_sound, game_over_sound = load_audio()
+    # Load sounds (already decoded by the preloader when available)
+    victory_sound, game_over_sound = preloader.get_sound("victory"), preloader.get_sound("game_over")
+    if victory_sound is None or game_over_sound is None:
+        victory_sound, game_over_sound = load_audio()
 
     # Game state
+    view = None
     game_visible = False
     game_started = False
     start_time = None
@@ -105,6 +154,7 @@ def run_game_headless(command_queue, result_queue):
             action = command.get("action")
 
             if action == "show_game":
+                view = command["view"]
                 game_visible = True
                 game_started = True
                 start_time = time.time()
@@ -113,13 +163,10 @@ def run_game_headless(command_queue, result_queue):
                 game_over = False
                 print("Game started!")
 
-                # Create window
-                cv2.namedWindow("VIVA SERGIPE!", cv2.WINDOW_NORMAL)
-                cv2.setWindowProperty("VIVA SERGIPE!", cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_FULLSCREEN)
-
             elif action == "hide_game":
                 game_visible = False
-                cv2.destroyAllWindows()
+                if view is not None:
+                    view.finish()
 
             elif action == "exit":
                 break
@@ -131,23 +178,84 @@ def run_game_headless(command_queue, result_queue):
             time.sleep(0.1)
             continue
 
-        # Game loop
-        success, frame = capture.read()
+        # Handle keys - apenas teclas permitidas (lidas a cada volta, mesmo sem frame novo da câmera)
+        key = view.read_key()
+
+        # Lista de teclas permitidas (códigos ASCII e especiais)
+        allowed_keys = [
+            27,    # ESC
+            81,    # Q maiúsculo
+            113,   # q minúsculo
+            0,     # Nenhuma tecla
+            NO_KEY # Nenhuma tecla
+        ]
+
+        # Verificar se a tecla é permitida
+        if key != NO_KEY and key != 0 and key not in allowed_keys:
+            # Bloquear tecla - não fazer nada
+            key = NO_KEY
+
+        # Processar teclas permitidas
+        if key == ord('q') or key == ord('Q') or key == 27:  # Q or ESC
+            game_over = True
+
+        # Check if game ended
+        if (game_won or game_over) and game_started:
+            # Show final screen for a few seconds (the view keeps showing the last frame)
+            final_screen_end = time.time() + 3.0
+            while time.time() < final_screen_end:
+                key = view.read_key(timeout=final_screen_end - time.time())
+                if key == ord('q') or key == 27:
+                    break
+
+            # Send result
+            result = {
+                "won": game_won,
+                "fill_percentage": fill_percentage
+            }
+            result_queue.put(result)
+            print(f"Game ended - Won: {game_won}, Fill: {fill_percentage:.1f}%")
+
+            # Hide game
+            game_visible = False
+            game_started = False
+            view.finish()
+            continue
+
+        # Game loop: never wait on the camera (the view keeps showing the last frame)
+        success, frame = capture.read_latest()
         if not success:
+            if not capture.isOpened():
+                print("Error: Could not read from camera.")
+                break
+            time.sleep(0.005)
             continue
 
         # Process frame
-        results, frame = process_frame(frame, pose)
+        frame_time = time.time()
+        if pose_worker is not None:
+            pose_worker.submit(frame, capture.last_frame_id)
+            pose_result = pose_worker.latest()
+            if pose_result is None:
+                continue
+            if pose_result.frame_id != tracked_frame_id:
+                tracked_frame_id = pose_result.frame_id
+                landmark_tracker.update(pose_result.results, pose_result.timestamp)
+            results = landmark_tracker.predict(frame_time)
+        else:
+            results, frame = process_frame(frame, pose, draw_landmarks=False)
+            results = landmark_tracker.update(results, frame_time)
         frame = cv2.flip(frame, 1)
 
         # Get screen size and resize
         screen_width = 1920
         screen_height = 1080
         frame = cv2.resize(frame, (screen_width, screen_height))
+        landmark_renderer.draw(frame, results, mirrored=True)
 
-        # Resize contour mask
+        # Get contour preprocessed for the frame size
         frame_height, frame_width = frame.shape[:2]
-        contour_resized = cv2.resize(contour_mask, (frame_width, frame_height))
+        contour_variant = contour.get(frame_width, frame_height)
 
         if game_started and not game_over and not game_won:
             # Calculate time left
@@ -155,18 +263,15 @@ def run_game_headless(command_queue, result_queue):
             time_left = max(0, GAME_SETTINGS['duration'] - elapsed_time)
 
             # Create body mask
-            body_mask = create_body_mask(results, frame_width, frame_height)
-            body_pixels = np.sum(body_mask > 0)
+            body_pixels = body_analyzer.update(results, frame_width, frame_height)
 
             # Show body overlay
             if body_pixels > 0:
-                body_overlay = np.zeros_like(frame)
-                body_overlay[:, :, 0] = body_mask
-                frame = cv2.addWeighted(frame, 0.8, body_overlay, 0.2, 0)
+                tint(frame, (255, 0, 0), 0.2, mask=body_analyzer.display_mask(frame_width, frame_height))
 
             # Calculate fill percentage
             if body_pixels >= GAME_SETTINGS['min_body_pixels']:
-                fill_percentage = calculate_fill_percentage(body_mask, contour_resized)
+                fill_percentage = body_analyzer.fill_percentage()
 
                 # Check win condition
                 if fill_percentage >= GAME_SETTINGS['win_threshold']:
@@ -191,62 +296,18 @@ def run_game_headless(command_queue, result_queue):
             display_game_over_message(frame, fill_percentage)
         else:
             display_sergipe_interface(
-                frame, contour_resized,
+                frame, contour_variant,
                 GAME_SETTINGS['duration'] - (time.time() - start_time) if start_time else GAME_SETTINGS['duration'],
                 fill_percentage, game_started, GAME_SETTINGS['win_threshold']
             )
 
-        # Show frame
-        if game_visible:
-            cv2.imshow("VIVA SERGIPE!", frame)
-
-        # Handle keys - apenas teclas permitidas
-        key = cv2.waitKey(5) & 0xFF
-
-        # Lista de teclas permitidas (códigos ASCII e especiais)
-        allowed_keys = [
-            27,    # ESC
-            81,    # Q maiúsculo
-            113,   # q minúsculo
-            0,     # Nenhuma tecla
-            255    # Nenhuma tecla (máscara)
-        ]
-
-        # Verificar se a tecla é permitida
-        if key != 255 and key != 0 and key not in allowed_keys:
-            # Bloquear tecla - não fazer nada
-            continue
-
-        # Processar teclas permitidas
-        if key == ord('q') or key == ord('Q') or key == 27:  # Q or ESC
-            game_over = True
-
-        # Check if game ended
-        if (game_won or game_over) and game_started:
-            # Show final screen for a few seconds
-            final_screen_start = time.time()
-            while time.time() - final_screen_start < 3.0:
-                # Keep showing the final screen
-                if game_visible:
-                    cv2.imshow("VIVA SERGIPE!", frame)
-                    key = cv2.waitKey(100) & 0xFF
-                    if key == ord('q') or key == 27:
-                        break
-
-            # Send result
-            result = {
-                "won": game_won,
-                "fill_percentage": fill_percentage
-            }
-            result_queue.put(result)
-            print(f"Game ended - Won: {game_won}, Fill: {fill_percentage:.1f}%")
-
-            # Hide game
-            game_visible = False
-            game_started = False
-            cv2.destroyAllWindows()
+        # Show frame (the view shows the latest one at the display's refresh rate)
+        view.present(frame)
 
     # Cleanup
+    if pose_worker is not None:
+        pose_worker.stop()
     capture.release()
-    cv2.destroyAllWindows()
+    if view is not None:
+        view.finish()
     pygame.quit()
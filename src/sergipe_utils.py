@@ -13,14 +13,32 @@ import numpy as np
 import os
 import time
 from datetime import datetime
-import mediapipe as mp
-
-# Import MediaPipe solutions
-mp_pose = mp.solutions.pose
-mp_drawing = mp.solutions.drawing_utils
 
 # Import from utils.py
 from utils import draw_bold_text
+from logger import get_logger
+from hud_compositor import get_hud_compositor
+from blending import tint
+
+# Per-frame diagnostics are logged at DEBUG level (disabled by default)
+logger = get_logger(__name__)
+
+##################
+### PARAMETERS ###
+##################
+
+# Landmarks below this visibility are ignored when building the body mask
+BODY_VISIBILITY_THRESHOLD = 0.5
+
+# Radius (px) of the circles drawn around each landmark in the body mask
+BODY_CIRCLE_RADIUS = 30
+
+# Fractional bits of the fixed-point coordinates used to draw the body mask
+SUBPIXEL_SHIFT = 4
+
+# Progress bar geometry in the game HUD (top-left corner and width, height)
+PROGRESS_BAR_POSITION = (50, 180)
+PROGRESS_BAR_SIZE = (400, 25)
 
 ##################
 ### FUNCTIONS ###
@@ -75,10 +93,343 @@ def load_sergipe_contour(contour_path=None):
     return None
 
 
+class FillScorer:
+    """
+    Scores how much of a contour is filled by a body mask.
+
+    The contour pixel count and bounding box are computed once. Each score only
+    intersects the masks inside the overlap of the body and contour bounding
+    boxes, so its cost is proportional to the overlap area, not the frame size.
+
+    Attributes:
+        contour_pixels (int): Number of non-zero pixels in the contour mask.
+        contour_roi (tuple): (x0, y0, x1, y1) bounding box of the contour.
+    """
+
+    def __init__(self, contour_mask):
+        """
+        Args:
+            contour_mask (numpy.ndarray): Binary mask of the contour
+        """
+        self.mask = contour_mask
+        self.contour_pixels = int(cv2.countNonZero(contour_mask))
+
+        x, y, w, h = cv2.boundingRect(contour_mask)
+        self.contour_roi = (x, y, x + w, y + h)
+
+        # Scratch buffer for the intersection, sliced to the overlap area
+        self._intersection = np.zeros(contour_mask.shape[:2], dtype=np.uint8)
+
+    def score(self, body_mask, body_roi=None):
+        """
+        Calculates the percentage of the contour filled by the body.
+
+        Args:
+            body_mask (numpy.ndarray): Binary mask of the body
+            body_roi (tuple): (x0, y0, x1, y1) region containing every body pixel
+                (e.g. BodyMaskRasterizer.roi). Computed from the mask if None.
+
+        Returns:
+            float: Percentage of contour filled (0-100)
+        """
+        height, width = self.mask.shape[:2]
+
+        # Ensure masks are the same size
+        if body_mask.shape[:2] != (height, width):
+            body_mask = cv2.resize(body_mask, (width, height))
+            body_roi = None
+
+        if self.contour_pixels == 0:
+            logger.warning("No contour pixels found!")
+            return 0.0
+
+        if body_roi is None:
+            x, y, w, h = cv2.boundingRect(body_mask)
+            body_roi = (x, y, x + w, y + h)
+
+        # Overlap of the body and contour bounding boxes
+        x0 = max(body_roi[0], self.contour_roi[0])
+        y0 = max(body_roi[1], self.contour_roi[1])
+        x1 = min(body_roi[2], self.contour_roi[2])
+        y1 = min(body_roi[3], self.contour_roi[3])
+
+        if x0 < x1 and y0 < y1:
+            intersection = cv2.bitwise_and(
+                body_mask[y0:y1, x0:x1],
+                self.mask[y0:y1, x0:x1],
+                dst=self._intersection[y0:y1, x0:x1],
+            )
+            intersection_pixels = cv2.countNonZero(intersection)
+        else:
+            intersection_pixels = 0
+
+        # Debug information
+        logger.debug("Fill calculation: Contour=%d, Intersection=%d", self.contour_pixels, intersection_pixels)
+
+        # Calculate percentage
+        percentage = (intersection_pixels / self.contour_pixels) * 100.0
+        logger.debug("Fill percentage: %.2f%%", percentage)
+        return min(percentage, 100.0)  # Cap at 100%
+
+
+class ContourVariant:
+    """
+    Preprocessed Sergipe contour for a single output resolution.
+
+    Everything the game loop needs from the contour is computed once here,
+    so later frames at the same resolution only look the data up.
+
+    Attributes:
+        width (int): Width of the variant in pixels.
+        height (int): Height of the variant in pixels.
+        mask (numpy.ndarray): Resized binary contour mask.
+        pixel_count (int): Number of non-zero pixels in the mask.
+        outlines (list): Outline polylines found with cv2.findContours.
+        overlay (numpy.ndarray): Pre-tinted BGR overlay blended over the frame.
+        scorer (FillScorer): Fill scorer with the precomputed contour statistics.
+    """
+
+    def __init__(self, mask):
+        self.mask = mask
+        self.height, self.width = mask.shape[:2]
+        self.scorer = FillScorer(mask)
+        self.pixel_count = self.scorer.contour_pixels
+        self.outlines, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+        # Green with some blue for a cyan effect
+        self.overlay = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        self.overlay[:, :, 1] = mask
+        self.overlay[:, :, 0] = mask // 2
+
+
+class ContourAsset:
+    """
+    Sergipe contour with a per-resolution cache of preprocessed variants.
+
+    The source mask comes from 'load_sergipe_contour'. The first request for a
+    resolution resizes the mask and builds its ContourVariant; later requests
+    for the same resolution return the cached variant.
+    """
+
+    # Resolutions kept in cache (adaptive resolution scaling creates a few sizes)
+    MAX_VARIANTS = 8
+
+    def __init__(self, contour_mask):
+        """
+        Args:
+            contour_mask (numpy.ndarray): Contour mask as returned by 'load_sergipe_contour'.
+        """
+        self.source_mask = contour_mask
+        self._variants = {}
+
+    @classmethod
+    def load(cls, contour_path=None):
+        """
+        Loads the contour from disk and wraps it in a ContourAsset.
+
+        Args:
+            contour_path (str): Path to the contour file (see 'load_sergipe_contour').
+
+        Returns:
+            ContourAsset: The contour asset or None if the contour could not be loaded.
+        """
+        contour_mask = load_sergipe_contour(contour_path)
+        if contour_mask is None:
+            return None
+        return cls(contour_mask)
+
+    def get(self, width, height):
+        """
+        Returns the preprocessed contour for the given output resolution.
+
+        Args:
+            width (int): Output width in pixels.
+            height (int): Output height in pixels.
+
+        Returns:
+            ContourVariant: Cached contour data for (width, height).
+        """
+        key = (width, height)
+        variant = self._variants.get(key)
+        if variant is None:
+            if self.source_mask.shape[:2] == (height, width):
+                mask = self.source_mask
+            else:
+                mask = cv2.resize(self.source_mask, (width, height))
+
+            if len(self._variants) >= self.MAX_VARIANTS:
+                # Drop the oldest resolution
+                self._variants.pop(next(iter(self._variants)))
+
+            variant = ContourVariant(mask)
+            self._variants[key] = variant
+        return variant
+
+
+def landmarks_to_array(results):
+    """
+    Converts MediaPipe pose landmarks into a NumPy array in a single pass.
+
+    Args:
+        results: MediaPipe pose detection results
+
+    Returns:
+        numpy.ndarray: Array of shape (N, 3) with normalized x, y and visibility,
+        or None if no pose was detected
+    """
+    if results is None or results.pose_landmarks is None:
+        return None
+
+    # Results from the landmark tracker already carry the array
+    landmark_array = getattr(results, 'landmark_array', None)
+    if landmark_array is not None:
+        return landmark_array
+
+    return np.array(
+        [(landmark.x, landmark.y, landmark.visibility) for landmark in results.pose_landmarks.landmark],
+        dtype=np.float64,
+    )
+
+
+class BodyMaskRasterizer:
+    """
+    Rasterizes the body silhouette from pose landmarks into a reusable buffer.
+
+    The mask buffer is allocated once per resolution. Each call only clears the
+    region drawn on the previous call and only draws inside the region of
+    interest around the landmarks, so the cost does not depend on the frame size.
+
+    Shapes are drawn at sub-pixel precision and shrunk by half a pixel, because
+    fillPoly and ellipse also fill the pixels their outline passes through;
+    otherwise the mask would grow by half a pixel along its outline, which at a
+    low analysis resolution noticeably over-estimates the fill.
+
+    Attributes:
+        roi (tuple): (x0, y0, x1, y1) region touched by the last mask, or None if empty.
+        pixel_count (int): Number of body pixels in the last mask.
+    """
+
+    def __init__(self, radius=BODY_CIRCLE_RADIUS):
+        """
+        Args:
+            radius (float | tuple): Radius of the circles drawn around each landmark,
+                or (x, y) radii of ellipses when the two axes are scaled differently.
+        """
+        self.radius = radius
+        self.roi = None
+        self.pixel_count = 0
+        self._buffer = None
+
+    def _get_buffer(self, frame_width, frame_height):
+        """Returns the mask buffer for the resolution, clearing the last drawn region."""
+        if self._buffer is None or self._buffer.shape != (frame_height, frame_width):
+            self._buffer = np.zeros((frame_height, frame_width), dtype=np.uint8)
+        elif self.roi is not None:
+            x0, y0, x1, y1 = self.roi
+            self._buffer[y0:y1, x0:x1] = 0
+
+        self.roi = None
+        self.pixel_count = 0
+        return self._buffer
+
+    def rasterize(self, results, frame_width, frame_height):
+        """
+        Creates the binary body mask for the given pose results.
+
+        The returned mask is the internal buffer and is overwritten by the next call.
+
+        Args:
+            results: MediaPipe pose detection results
+            frame_width (int): Width of the frame
+            frame_height (int): Height of the frame
+
+        Returns:
+            Tuple[numpy.ndarray, int]: The body mask and its number of body pixels
+        """
+        mask = self._get_buffer(frame_width, frame_height)
+
+        landmarks = landmarks_to_array(results)
+        if landmarks is None:
+            logger.debug("No pose landmarks detected")
+            return mask, 0
+
+        # Convert normalized coordinates to pixel coordinates
+        pixels = landmarks[:, :2] * (frame_width, frame_height)
+
+        # Only keep points that are visible and within frame
+        valid = (
+            (pixels[:, 0] >= 0) & (pixels[:, 0] < frame_width) &
+            (pixels[:, 1] >= 0) & (pixels[:, 1] < frame_height) &
+            (landmarks[:, 2] > BODY_VISIBILITY_THRESHOLD)
+        )
+        points = pixels[valid]
+
+        logger.debug("Body detection: %d valid landmarks found", len(points))
+
+        if len(points) <= 3:  # Need at least 3 points for convex hull
+            logger.debug("Not enough visible landmarks for body detection")
+            return mask, 0
+
+        radius_x, radius_y = self.radius if isinstance(self.radius, tuple) else (self.radius, self.radius)
+
+        # Region of interest: landmarks bounding box grown by the circle radius
+        margin_x, margin_y = int(np.ceil(radius_x)), int(np.ceil(radius_y))
+        x0 = max(int(points[:, 0].min()) - margin_x, 0)
+        y0 = max(int(points[:, 1].min()) - margin_y, 0)
+        x1 = min(int(points[:, 0].max()) + margin_x + 1, frame_width)
+        y1 = min(int(points[:, 1].max()) + margin_y + 1, frame_height)
+        roi = mask[y0:y1, x0:x1]
+        self.roi = (x0, y0, x1, y1)
+
+        # Drawing coordinates are pixel centers: the pixel (i, j) covers [i, i + 1)
+        roi_points = (points - (x0 + 0.5, y0 + 0.5)).astype(np.float32)
+        one = 1 << SUBPIXEL_SHIFT
+
+        # Convex hull, with each vertex moved half a pixel towards the centroid
+        hull = cv2.convexHull(roi_points).reshape(-1, 2)
+        offsets = hull - hull.mean(axis=0)
+        distances = np.maximum(np.hypot(offsets[:, 0], offsets[:, 1]), 1e-6)[:, None]
+        hull = hull - offsets * (np.minimum(distances, 0.5) / distances)
+        cv2.fillPoly(roi, [np.round(hull * one).astype(np.int32)], 255, cv2.LINE_8, SUBPIXEL_SHIFT)
+
+        # Also draw circles around key body parts for better coverage
+        axes = (int(round(max(radius_x - 0.5, 0.0) * one)), int(round(max(radius_y - 0.5, 0.0) * one)))
+        for x, y in np.round(roi_points * one).astype(np.int32).tolist():
+            cv2.ellipse(roi, (x, y), axes, 0, 0, 360, 255, -1, cv2.LINE_8, SUBPIXEL_SHIFT)
+
+        self.pixel_count = cv2.countNonZero(roi)
+        logger.debug("Body mask created: %d pixels", self.pixel_count)
+
+        return mask, self.pixel_count
+
+
+def scale_circle_radius(analysis_size, display_size, radius=BODY_CIRCLE_RADIUS):
+    """
+    Scales the body circle radius from display to analysis resolution, per axis.
+
+    Masks built at a low analysis resolution then cover the same normalized
+    area as a mask built at the display resolution, even when the analysis
+    resolution has a different aspect ratio than the display (the circles
+    become ellipses at analysis resolution).
+
+    Args:
+        analysis_size (tuple): (width, height) of the analysis resolution
+        display_size (tuple): (width, height) of the displayed frame
+        radius (float): Circle radius at display resolution
+
+    Returns:
+        tuple: (x, y) radii at analysis resolution
+    """
+    return (radius * analysis_size[0] / display_size[0], radius * analysis_size[1] / display_size[1])
+
+
 def create_body_mask(results, frame_width, frame_height):
     """
     Creates a binary mask of the detected body from MediaPipe pose landmarks.
 
+    Allocates a new mask on every call; the game loop uses a BodyMaskRasterizer
+    instead to reuse its buffer between frames.
+
     Args:
         results: MediaPipe pose detection results
         frame_width (int): Width of the frame
@@ -87,77 +438,109 @@ def create_body_mask(results, frame_width, frame_height):
     Returns:
         numpy.ndarray: Binary mask of the body silhouette
     """
-    # Create empty mask
-    mask = np.zeros((frame_height, frame_width), dtype=np.uint8)
-
-    if results.pose_landmarks:
-        # Get landmark points
-        landmarks = results.pose_landmarks.landmark
-
-        # Convert normalized coordinates to pixel coordinates
-        points = []
-        for landmark in landmarks:
-            x = int(landmark.x * frame_width)
-            y = int(landmark.y * frame_height)
-            # Only add points that are visible and within frame
-            if (0 <= x < frame_width and 0 <= y < frame_height and
-                landmark.visibility > 0.5):  # Only use visible landmarks
-                points.append([x, y])
-
-        print(f"Body detection: {len(points)} valid landmarks found")
-
-        if len(points) > 3:  # Need at least 3 points for convex hull
-            points = np.array(points, dtype=np.int32)
-            hull = cv2.convexHull(points)
-            cv2.fillPoly(mask, [hull], 255)
-
-            # Also draw circles around key body parts for better coverage
-            for point in points:
-                cv2.circle(mask, tuple(point), 30, 255, -1)  # 30px radius circles
-
-            print(f"Body mask created: {np.sum(mask > 0)} pixels")
-        else:
-            print("Not enough visible landmarks for body detection")
-    else:
-        print("No pose landmarks detected")
-
+    mask, _ = BodyMaskRasterizer().rasterize(results, frame_width, frame_height)
     return mask
 
 
-def calculate_fill_percentage(body_mask, contour_mask):
+def calculate_fill_percentage(body_mask, contour_mask, body_roi=None):
     """
     Calculates the percentage of contour area filled by the body.
 
     Args:
         body_mask (numpy.ndarray): Binary mask of the body
-        contour_mask (numpy.ndarray): Binary mask of the contour
+        contour_mask (numpy.ndarray | ContourVariant | FillScorer): Binary mask of the
+            contour, or a cached variant/scorer holding its precomputed statistics
+        body_roi (tuple): Optional (x0, y0, x1, y1) region containing every body pixel
 
     Returns:
         float: Percentage of contour filled (0-100)
     """
-    # Ensure masks are the same size
-    if body_mask.shape != contour_mask.shape:
-        body_mask = cv2.resize(body_mask, (contour_mask.shape[1], contour_mask.shape[0]))
+    if isinstance(contour_mask, ContourVariant):
+        scorer = contour_mask.scorer
+    elif isinstance(contour_mask, FillScorer):
+        scorer = contour_mask
+    else:
+        scorer = FillScorer(contour_mask)
 
-    # Calculate intersection (overlap between body and contour)
-    intersection = cv2.bitwise_and(body_mask, contour_mask)
+    return scorer.score(body_mask, body_roi)
 
-    # Count pixels
-    contour_pixels = np.sum(contour_mask > 0)
-    intersection_pixels = np.sum(intersection > 0)
-    body_pixels = np.sum(body_mask > 0)
 
-    # Debug information
-    print(f"Fill calculation: Contour={contour_pixels}, Body={body_pixels}, Intersection={intersection_pixels}")
+class BodyFillAnalyzer:
+    """
+    Builds the body mask and scores the fill at a fixed analysis resolution.
 
-    # Calculate percentage
-    if contour_pixels > 0:
-        percentage = (intersection_pixels / contour_pixels) * 100.0
-        print(f"Fill percentage: {percentage:.2f}%")
-        return min(percentage, 100.0)  # Cap at 100%
-    else:
-        print("No contour pixels found!")
-        return 0.0
+    The analysis resolution is independent of the display resolution, so the
+    game logic costs the same on any monitor. Body pixel counts are reported
+    at display scale, because thresholds such as 'min_body_pixels' are
+    defined there.
+
+    Attributes:
+        body_mask (numpy.ndarray): Body mask of the last update, at analysis resolution.
+        body_pixels (int): Body pixels of the last update, at display scale.
+    """
+
+    def __init__(self, contour, analysis_resolution=None):
+        """
+        Args:
+            contour (ContourAsset): Sergipe contour asset.
+            analysis_resolution (tuple): (width, height) used for analysis, or None
+                to analyze at the display resolution.
+        """
+        self.contour = contour
+        self.analysis_resolution = analysis_resolution
+        self.rasterizer = BodyMaskRasterizer()
+        self.contour_variant = None
+        self.body_mask = None
+        self.body_pixels = 0
+
+    def update(self, results, display_width, display_height):
+        """
+        Rasterizes the body mask for the given pose results.
+
+        Args:
+            results: MediaPipe pose detection results
+            display_width (int): Width of the displayed frame
+            display_height (int): Height of the displayed frame
+
+        Returns:
+            int: Number of body pixels, scaled to the display resolution
+        """
+        if self.analysis_resolution is None:
+            width, height = display_width, display_height
+        else:
+            width, height = self.analysis_resolution
+
+        self.rasterizer.radius = scale_circle_radius((width, height), (display_width, display_height))
+        self.contour_variant = self.contour.get(width, height)
+        self.body_mask, pixels = self.rasterizer.rasterize(results, width, height)
+
+        pixel_scale = (display_width * display_height) / float(width * height)
+        self.body_pixels = int(round(pixels * pixel_scale))
+        return self.body_pixels
+
+    def fill_percentage(self):
+        """
+        Calculates the fill percentage of the last body mask.
+
+        Returns:
+            float: Percentage of contour filled (0-100)
+        """
+        return calculate_fill_percentage(self.body_mask, self.contour_variant, self.rasterizer.roi)
+
+    def display_mask(self, display_width, display_height):
+        """
+        Returns the last body mask at display resolution (used by the debug overlay).
+
+        Args:
+            display_width (int): Width of the displayed frame
+            display_height (int): Height of the displayed frame
+
+        Returns:
+            numpy.ndarray: Body mask at display resolution
+        """
+        if self.body_mask.shape[:2] == (display_height, display_width):
+            return self.body_mask
+        return cv2.resize(self.body_mask, (display_width, display_height), interpolation=cv2.INTER_NEAREST)
 
 
 def save_victory_photo(frame, snapshots_dir, fill_percentage):
@@ -209,78 +592,30 @@ def display_sergipe_interface(frame, contour_mask, time_left, fill_percentage, g
 
     Args:
         frame (numpy.ndarray): Current video frame
-        contour_mask (numpy.ndarray): Sergipe contour mask
+        contour_mask (numpy.ndarray | ContourVariant): Sergipe contour mask, or its
+            cached variant for the frame resolution (see ContourAsset.get)
         time_left (float): Time remaining in seconds
         fill_percentage (float): Current fill percentage
         game_started (bool): Whether the game has started
         win_threshold (float): Win threshold percentage
     """
-    # Make contour more visible
-    # Create colored contour overlay with stronger visibility
-    contour_overlay = np.zeros_like(frame)
-
-    # Make contour bright green and more visible
-    contour_overlay[:, :, 1] = contour_mask  # Green channel
-    contour_overlay[:, :, 0] = contour_mask // 2  # Some blue for cyan effect
+    # Outline and tinted overlay come precomputed from the contour variant
+    if isinstance(contour_mask, ContourVariant):
+        contour = contour_mask
+    else:
+        contour = ContourVariant(contour_mask)
 
-    # Also draw contour outline for better visibility
-    contours, _ = cv2.findContours(contour_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-    for contour in contours:
-        cv2.drawContours(frame, [contour], -1, (0, 255, 0), 3)  # Green outline
+    # Layers are cached by the compositor and only re-rendered when their inputs change
+    compositor = get_hud_compositor()
 
-    # Blend contour with frame (more visible)
-    alpha = 0.4  # Increased transparency for better visibility
-    frame_with_contour = cv2.addWeighted(frame, 1 - alpha, contour_overlay, alpha, 0)
-    frame[:] = frame_with_contour
+    # Green outline blended with the tinted contour (alpha 0.4 for better visibility)
+    compositor.draw_contour(frame, contour, color=(0, 255, 0), thickness=3, alpha=0.4)
 
     if not game_started:
-        # Start screen with improved text formatting
-        draw_bold_text(
-            frame,
-            "VIVA SERGIPE!",
-            (400, 150),
-            font_scale=3.5,
-            color=(0, 255, 0),  # Green
-            thickness=6,
-            outline_color=(0, 0, 0),  # Black outline
-            outline_thickness=12
-        )
-
-        draw_bold_text(
-            frame,
-            "Preencha o mapa com seu corpo!",
-            (250, 250),
-            font_scale=1.8,
-            color=(255, 255, 255),  # White
-            thickness=4,
-            outline_color=(0, 0, 0),  # Black outline
-            outline_thickness=8
-        )
-
         minutes = int(time_left // 60) if time_left > 0 else 5
-        draw_bold_text(
-            frame,
-            f"Meta: {win_threshold:.0f}% em {minutes} minutos",
-            (350, 350),
-            font_scale=1.5,
-            color=(255, 255, 0),  # Yellow
-            thickness=3,
-            outline_color=(0, 0, 0),  # Black outline
-            outline_thickness=7
-        )
-
-        # Removed start instruction - game starts automatically
-
-        # Additional controls info with better visibility
-        draw_bold_text(
-            frame,
-            "F11: Tela cheia | Q/ESC: Sair",
-            (300, 600),
-            font_scale=1.2,
-            color=(255, 255, 255),  # White
-            thickness=2,
-            outline_color=(0, 0, 0),  # Black outline
-            outline_thickness=6
+        compositor.draw_layer(
+            frame, "start_screen", (minutes, win_threshold),
+            lambda canvas, origin: _draw_start_screen(canvas, origin, minutes, win_threshold)
         )
     else:
         # Game interface during play with improved text formatting
@@ -297,6 +632,7 @@ def display_sergipe_interface(frame, contour_mask, time_left, fill_percentage, g
         else:
             timer_color = (0, 0, 255)  # Red
 
+        # Text sprites are cached per string, so the timer is rasterized once per second
         draw_bold_text(
             frame,
             timer_text,
@@ -308,7 +644,7 @@ def display_sergipe_interface(frame, contour_mask, time_left, fill_percentage, g
             outline_thickness=8
         )
 
-        # Fill percentage display with better formatting
+        # Fill percentage display with better formatting (re-rasterized on 0.1% changes)
         percentage_text = f"Preenchimento: {fill_percentage:.1f}%"
 
         # Color percentage based on progress
@@ -330,44 +666,131 @@ def display_sergipe_interface(frame, contour_mask, time_left, fill_percentage, g
             outline_thickness=8
         )
 
-        # Progress bar with better visibility
-        bar_x, bar_y = 50, 180
-        bar_width, bar_height = 400, 25
-
-        # Background bar with border
-        cv2.rectangle(frame, (bar_x-2, bar_y-2), (bar_x + bar_width+2, bar_y + bar_height+2), (255, 255, 255), 2)
-        cv2.rectangle(frame, (bar_x, bar_y), (bar_x + bar_width, bar_y + bar_height), (50, 50, 50), -1)
-
-        # Progress bar
+        # Progress bar: re-rendered only when the bar length, its color or the goal change
+        bar_x, bar_y = PROGRESS_BAR_POSITION
+        bar_width, bar_height = PROGRESS_BAR_SIZE
         progress_width = int((fill_percentage / 100.0) * bar_width)
-        if progress_width > 0:
-            # Gradient effect for progress bar
-            if fill_percentage >= win_threshold:
-                progress_color = (0, 255, 0)  # Green
-            elif fill_percentage >= win_threshold * 0.5:
-                progress_color = (0, 255, 255)  # Yellow
-            else:
-                progress_color = (255, 100, 100)  # Light blue
 
-            cv2.rectangle(frame, (bar_x, bar_y), (bar_x + progress_width, bar_y + bar_height), progress_color, -1)
+        # Gradient effect for progress bar
+        if fill_percentage >= win_threshold:
+            progress_color = (0, 255, 0)  # Green
+        elif fill_percentage >= win_threshold * 0.5:
+            progress_color = (0, 255, 255)  # Yellow
+        else:
+            progress_color = (255, 100, 100)  # Light blue
 
-        # Goal line at win_threshold%
         goal_x = bar_x + int((win_threshold / 100.0) * bar_width)
-        cv2.line(frame, (goal_x, bar_y - 10), (goal_x, bar_y + bar_height + 10), (0, 0, 255), 3)
-
-        # Goal text
-        draw_bold_text(
-            frame,
-            f"Meta: {win_threshold:.0f}%",
-            (goal_x - 50, bar_y - 20),
-            font_scale=0.8,
-            color=(255, 255, 255),
-            thickness=2,
-            outline_color=(0, 0, 0),
-            outline_thickness=4
+        bar_rect = (min(bar_x, goal_x - 50) - 10, bar_y - 60,
+                    max(bar_x + bar_width, goal_x + 150) + 10, bar_y + bar_height + 15)
+        compositor.draw_layer(
+            frame, "progress_bar", (max(progress_width, 0), progress_color, win_threshold),
+            lambda canvas, origin: _draw_progress_bar(canvas, origin, progress_width,
+                                                      progress_color, win_threshold),
+            rect=bar_rect
         )
 
 
+def _draw_start_screen(canvas, origin, minutes, win_threshold):
+    """
+    Draws the start screen texts (HUD layer).
+
+    Args:
+        canvas (numpy.ndarray): Layer canvas
+        origin (tuple): Frame coordinates of the canvas top-left corner
+        minutes (int): Game duration in minutes
+        win_threshold (float): Win threshold percentage
+    """
+    ox, oy = origin
+
+    # Start screen with improved text formatting
+    draw_bold_text(
+        canvas,
+        "VIVA SERGIPE!",
+        (400 - ox, 150 - oy),
+        font_scale=3.5,
+        color=(0, 255, 0),  # Green
+        thickness=6,
+        outline_color=(0, 0, 0),  # Black outline
+        outline_thickness=12
+    )
+
+    draw_bold_text(
+        canvas,
+        "Preencha o mapa com seu corpo!",
+        (250 - ox, 250 - oy),
+        font_scale=1.8,
+        color=(255, 255, 255),  # White
+        thickness=4,
+        outline_color=(0, 0, 0),  # Black outline
+        outline_thickness=8
+    )
+
+    draw_bold_text(
+        canvas,
+        f"Meta: {win_threshold:.0f}% em {minutes} minutos",
+        (350 - ox, 350 - oy),
+        font_scale=1.5,
+        color=(255, 255, 0),  # Yellow
+        thickness=3,
+        outline_color=(0, 0, 0),  # Black outline
+        outline_thickness=7
+    )
+
+    # Removed start instruction - game starts automatically
+
+    # Additional controls info with better visibility
+    draw_bold_text(
+        canvas,
+        "F11: Tela cheia | Q/ESC: Sair",
+        (300 - ox, 600 - oy),
+        font_scale=1.2,
+        color=(255, 255, 255),  # White
+        thickness=2,
+        outline_color=(0, 0, 0),  # Black outline
+        outline_thickness=6
+    )
+
+
+def _draw_progress_bar(canvas, origin, progress_width, progress_color, win_threshold):
+    """
+    Draws the progress bar with its goal line and goal text (HUD layer).
+
+    Args:
+        canvas (numpy.ndarray): Layer canvas
+        origin (tuple): Frame coordinates of the canvas top-left corner
+        progress_width (int): Filled length of the bar in pixels
+        progress_color (tuple): Fill color (BGR)
+        win_threshold (float): Win threshold percentage
+    """
+    ox, oy = origin
+    bar_x, bar_y = PROGRESS_BAR_POSITION[0] - ox, PROGRESS_BAR_POSITION[1] - oy
+    bar_width, bar_height = PROGRESS_BAR_SIZE
+
+    # Background bar with border
+    cv2.rectangle(canvas, (bar_x-2, bar_y-2), (bar_x + bar_width+2, bar_y + bar_height+2), (255, 255, 255), 2)
+    cv2.rectangle(canvas, (bar_x, bar_y), (bar_x + bar_width, bar_y + bar_height), (50, 50, 50), -1)
+
+    # Progress bar
+    if progress_width > 0:
+        cv2.rectangle(canvas, (bar_x, bar_y), (bar_x + progress_width, bar_y + bar_height), progress_color, -1)
+
+    # Goal line at win_threshold%
+    goal_x = bar_x + int((win_threshold / 100.0) * bar_width)
+    cv2.line(canvas, (goal_x, bar_y - 10), (goal_x, bar_y + bar_height + 10), (0, 0, 255), 3)
+
+    # Goal text
+    draw_bold_text(
+        canvas,
+        f"Meta: {win_threshold:.0f}%",
+        (goal_x - 50, bar_y - 20),
+        font_scale=0.8,
+        color=(255, 255, 255),
+        thickness=2,
+        outline_color=(0, 0, 0),
+        outline_thickness=4
+    )
+
+
 def display_main_menu(frame, selected_option):
     """
     Displays the main menu with options.
@@ -376,11 +799,8 @@ def display_main_menu(frame, selected_option):
         frame (numpy.ndarray): Current video frame
         selected_option (int): Currently selected menu option
     """
-    # Semi-transparent overlay
-    overlay = np.zeros_like(frame)
-    overlay[:] = (20, 20, 20)  # Dark background
-    alpha = 0.8
-    frame[:] = cv2.addWeighted(frame, 1 - alpha, overlay, alpha, 0)
+    # Semi-transparent overlay, blended in place
+    tint(frame, (20, 20, 20), 0.8)  # Dark background
 
     # Title
     draw_bold_text(
@@ -442,11 +862,8 @@ def display_config_menu(frame, config_option, game_settings):
         config_option (int): Currently selected config option
         game_settings (dict): Current game settings
     """
-    # Semi-transparent overlay
-    overlay = np.zeros_like(frame)
-    overlay[:] = (20, 20, 40)  # Dark blue background
-    alpha = 0.8
-    frame[:] = cv2.addWeighted(frame, 1 - alpha, overlay, alpha, 0)
+    # Semi-transparent overlay, blended in place
+    tint(frame, (20, 20, 40), 0.8)  # Dark blue background
 
     # Title
     draw_bold_text(
@@ -583,11 +1000,8 @@ def display_victory_message(frame, fill_percentage):
         frame (numpy.ndarray): Current video frame
         fill_percentage (float): Final fill percentage achieved
     """
-    # Semi-transparent overlay
-    overlay = np.zeros_like(frame)
-    overlay[:] = (0, 255, 0)  # Green
-    alpha = 0.3
-    frame[:] = cv2.addWeighted(frame, 1 - alpha, overlay, alpha, 0)
+    # Semi-transparent overlay, blended in place
+    tint(frame, (0, 255, 0), 0.3)  # Green
 
     # Victory messages
     draw_bold_text(
@@ -637,11 +1051,8 @@ def display_game_over_message(frame, fill_percentage):
         frame (numpy.ndarray): Current video frame
         fill_percentage (float): Final fill percentage achieved
     """
-    # Semi-transparent overlay
-    overlay = np.zeros_like(frame)
-    overlay[:] = (0, 0, 255)  # Red
-    alpha = 0.3
-    frame[:] = cv2.addWeighted(frame, 1 - alpha, overlay, alpha, 0)
+    # Semi-transparent overlay, blended in place
+    tint(frame, (0, 0, 255), 0.3)  # Red
 
     # Game over messages
     draw_bold_text(
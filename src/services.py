@@ -0,0 +1,341 @@
+"""
+REGISTRO DE SERVIÇOS - VIVA SERGIPE!
+Uma instância por processo de cada gerenciador, com início, parada e saúde explícitos
+"""
+
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from logger import get_logger
+from sync_manager import ProcessState
+
+logger = get_logger(__name__)
+
+
+class Service:
+    """Serviço registrado: como criar, iniciar, parar e verificar a instância"""
+
+    __slots__ = ("name", "factory", "start", "stop", "health", "depends", "instance", "state", "error")
+
+    def __init__(self, name: str, factory: Callable[[], Any], start: Optional[Callable[[Any], None]] = None,
+                 stop: Optional[Callable[[Any], None]] = None,
+                 health: Optional[Callable[[Any], Dict[str, Any]]] = None, depends: Iterable[str] = ()):
+        self.name = name
+        self.factory = factory
+        self.start = start
+        self.stop = stop
+        self.health = health
+        self.depends = tuple(depends)
+        self.instance = None
+        self.state = ProcessState.IDLE
+        self.error: Optional[str] = None
+
+
+class ServiceRegistry:
+    """
+    Registro dos serviços do processo.
+
+    get() cria cada serviço uma única vez (depois das suas dependências) e o
+    inicia; os serviços são parados na ordem inversa em que foram iniciados.
+    Depois de shutdown() o registro não inicia mais nada: get() apenas cria
+    (sem iniciar) um serviço que ainda não existia.
+    """
+
+    def __init__(self):
+        self._services: Dict[str, Service] = {}
+        self._started: List[str] = []
+        self._lock = threading.RLock()
+        self.closed = False
+
+    def register(self, name: str, factory: Callable[[], Any], start: Optional[Callable[[Any], None]] = None,
+                 stop: Optional[Callable[[Any], None]] = None,
+                 health: Optional[Callable[[Any], Dict[str, Any]]] = None, depends: Iterable[str] = ()):
+        """
+        Registra um serviço (substitui um registro ainda não criado com o mesmo nome)
+
+        Args:
+            name (str): Nome do serviço
+            factory (Callable): Cria a instância
+            start (Optional[Callable]): Inicia a instância (threads, recursos)
+            stop (Optional[Callable]): Para a instância e libera os recursos
+            health (Optional[Callable]): Retorna um dicionário com 'healthy' e detalhes
+            depends (Iterable[str]): Serviços iniciados antes deste
+        """
+        with self._lock:
+            existing = self._services.get(name)
+            if existing is not None and existing.instance is not None:
+                raise ValueError(f"Serviço '{name}' já foi criado")
+            self._services[name] = Service(name, factory, start, stop, health, depends)
+
+    def get(self, name: str) -> Any:
+        """
+        Obtém a instância de um serviço, criando e iniciando se necessário
+
+        Args:
+            name (str): Nome do serviço
+
+        Returns:
+            Any: Instância do serviço
+        """
+        service = self._services.get(name)
+        if service is None:
+            raise KeyError(f"Serviço '{name}' não registrado")
+        if service.state == ProcessState.RUNNING:
+            return service.instance
+
+        with self._lock:
+            if service.state == ProcessState.RUNNING:
+                return service.instance
+            if self.closed:
+                if service.instance is None:
+                    service.instance = service.factory()
+                return service.instance
+            if service.state == ProcessState.STARTING:
+                raise RuntimeError(f"Dependência circular no serviço '{name}'")
+
+            service.state = ProcessState.STARTING
+            try:
+                for dependency in service.depends:
+                    self.get(dependency)
+                if service.instance is None:
+                    service.instance = service.factory()
+                if service.start is not None:
+                    service.start(service.instance)
+            except Exception as e:
+                service.state = ProcessState.ERROR
+                service.error = str(e)
+                logger.error("Erro ao iniciar o serviço '%s': %s", name, e)
+                raise
+
+            service.state = ProcessState.RUNNING
+            service.error = None
+            if name in self._started:
+                self._started.remove(name)
+            self._started.append(name)
+            logger.debug("Serviço '%s' iniciado", name)
+            return service.instance
+
+    def is_running(self, name: str) -> bool:
+        """Verifica se um serviço está rodando"""
+        service = self._services.get(name)
+        return service is not None and service.state == ProcessState.RUNNING
+
+    def stop(self, name: str) -> bool:
+        """
+        Para um serviço (a instância é mantida e reiniciada pelo próximo get())
+
+        Args:
+            name (str): Nome do serviço
+
+        Returns:
+            bool: True se o serviço está parado
+        """
+        with self._lock:
+            service = self._services.get(name)
+            if service is None or service.state != ProcessState.RUNNING:
+                return True
+
+            service.state = ProcessState.STOPPING
+            try:
+                if service.stop is not None:
+                    service.stop(service.instance)
+            except Exception as e:
+                service.state = ProcessState.ERROR
+                service.error = str(e)
+                logger.error("Erro ao parar o serviço '%s': %s", name, e)
+                return False
+
+            service.state = ProcessState.STOPPED
+            logger.debug("Serviço '%s' parado", name)
+            return True
+
+    def stop_all(self, exclude: Iterable[str] = ()):
+        """
+        Para os serviços na ordem inversa em que foram iniciados
+
+        Args:
+            exclude (Iterable[str]): Serviços que continuam rodando
+        """
+        exclude = set(exclude)
+        with self._lock:
+            for name in reversed(list(self._started)):
+                if name not in exclude:
+                    self.stop(name)
+
+    def shutdown(self):
+        """Para todos os serviços; o registro não inicia mais nenhum serviço"""
+        with self._lock:
+            self.closed = True
+            # SyncManager.shutdown para os processos e chama shutdown() de novo (callback de
+            # limpeza), que então para os demais serviços
+            self.stop("sync")
+            self.stop_all()
+
+    def health(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Verifica a saúde dos serviços
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Por serviço: estado, 'healthy' e detalhes
+        """
+        with self._lock:
+            services = list(self._services.values())
+
+        report = {}
+        for service in services:
+            entry = {"state": service.state.value, "healthy": service.state == ProcessState.RUNNING}
+            if service.error:
+                entry["error"] = service.error
+            if service.state == ProcessState.RUNNING and service.health is not None:
+                try:
+                    entry.update(service.health(service.instance))
+                except Exception as e:
+                    entry.update(healthy=False, error=str(e))
+            report[service.name] = entry
+        return report
+
+
+def _thread_alive(thread: Optional[threading.Thread]) -> bool:
+    return thread is not None and thread.is_alive()
+
+
+def _create_sync(registry: ServiceRegistry):
+    from sync_manager import SyncManager
+
+    manager = SyncManager()
+    # SyncManager.shutdown (sinais, saída do processo) encerra o registro inteiro
+    manager.add_cleanup_callback(registry.shutdown)
+    return manager
+
+
+def _create_config():
+    # A instância do módulo já é usada por todos os outros módulos desde a importação
+    from config_manager import get_config_manager
+    return get_config_manager()
+
+
+def _create_performance():
+    from performance_optimizer import PerformanceOptimizer
+    return PerformanceOptimizer()
+
+
+def _create_visual_feedback():
+    from visual_feedback import VisualFeedbackManager
+    return VisualFeedbackManager()
+
+
+def _create_analytics():
+    from analytics import AnalyticsManager
+    return AnalyticsManager()
+
+
+def _create_achievements():
+    from achievements import AchievementManager
+    return AchievementManager()
+
+
+def _create_preloader(registry: ServiceRegistry):
+    from asset_preloader import AssetPreloader
+    from config_manager import get_config_manager
+    from utils import get_screen_size
+
+    config = get_config_manager()
+    optimizer = registry.get("performance")
+    camera_settings = optimizer.get_optimized_camera_settings()
+
+    # Variantes do contorno: tela (jogo clássico), 1920x1080 (headless) e resolução de análise
+    resolutions = [get_screen_size(), (1920, 1080)]
+    analysis_resolution = config.get_analysis_resolution()
+    if analysis_resolution is not None:
+        resolutions.append(analysis_resolution)
+
+    return AssetPreloader(
+        resolutions,
+        camera_device=config.get('camera', 'device_id', 0),
+        camera_settings=camera_settings,
+        model_complexity=optimizer.quality.model_complexity,
+        prepare_inference_frame=optimizer.prepare_inference_frame,
+    )
+
+
+def register_default_services(registry: ServiceRegistry):
+    """
+    Registra os gerenciadores do jogo
+
+    Args:
+        registry (ServiceRegistry): Registro de serviços
+    """
+    registry.register(
+        "sync", lambda: _create_sync(registry),
+        start=lambda manager: manager.start_monitoring(),
+        stop=lambda manager: manager.shutdown(),
+        health=lambda manager: {"healthy": manager.running and _thread_alive(manager.monitor_thread),
+                                "processes": len(manager.processes)},
+    )
+    registry.register(
+        "config", _create_config,
+        stop=lambda manager: manager.shutdown(),
+        health=lambda manager: {"healthy": True, "dirty": manager.dirty, "writes": manager.writes},
+        depends=("sync",),
+    )
+    registry.register(
+        "performance", _create_performance,
+        start=lambda optimizer: optimizer.start_monitoring(),
+        stop=lambda optimizer: optimizer.stop_monitoring(),
+        health=lambda optimizer: {"healthy": _thread_alive(optimizer.monitor_thread),
+                                  "quality_level": optimizer.quality.name},
+        depends=("config",),
+    )
+    registry.register(
+        "visual_feedback", _create_visual_feedback,
+        health=lambda manager: {"healthy": True, "detection_status": manager.detection_status},
+        depends=("config",),
+    )
+    registry.register(
+        "analytics", _create_analytics,
+        stop=lambda manager: manager.finalize_session(),
+        health=lambda manager: {"healthy": True, "enabled": manager.enabled, "pending_events": len(manager.events)},
+        depends=("config",),
+    )
+    registry.register(
+        "achievements", _create_achievements,
+        health=lambda manager: {"healthy": True, "unlocked": len(manager.unlocked_achievements),
+                                "evaluations": manager.evaluations},
+        depends=("config",),
+    )
+    registry.register(
+        "preloader", lambda: _create_preloader(registry),
+        start=lambda preloader: preloader.start(),
+        stop=lambda preloader: preloader.shutdown(),
+        health=lambda preloader: {"healthy": not preloader.errors, **preloader.get_status()},
+        depends=("performance",),
+    )
+
+
+# Registro global de serviços
+service_registry = ServiceRegistry()
+register_default_services(service_registry)
+
+
+def get_service_registry() -> ServiceRegistry:
+    """
+    Obtém o registro global de serviços
+
+    Returns:
+        ServiceRegistry: Registro de serviços
+    """
+    return service_registry
+
+
+def get_service(name: str) -> Any:
+    """
+    Obtém a instância de um serviço do registro global
+
+    Args:
+        name (str): Nome do serviço (sync, config, performance, visual_feedback, analytics,
+            achievements, preloader)
+
+    Returns:
+        Any: Instância do serviço
+    """
+    return service_registry.get(name)
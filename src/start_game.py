@@ -4,11 +4,15 @@ VIVA SERGIPE! - Script de Inicialização
 Script que configura o ambiente e inicia o jogo automaticamente
 """
 
+import argparse
+import importlib.util
 import os
 import sys
 import subprocess
 from pathlib import Path
 
+from startup_profiler import get_startup_profiler
+
 def setup_environment():
     """Configura variáveis de ambiente necessárias"""
     print("🔧 Configurando ambiente...")
@@ -45,10 +49,10 @@ def check_dependencies():
     missing_modules = []
     
     for module in required_modules:
-        try:
-            __import__(module)
+        # Apenas localiza o módulo: importar mediapipe/PyQt5 aqui atrasaria o menu
+        if importlib.util.find_spec(module) is not None:
             print(f"✅ {module}")
-        except ImportError:
+        else:
             print(f"❌ {module} não encontrado")
             missing_modules.append(module)
     
@@ -68,6 +72,7 @@ def start_game():
     try:
         # Importar e executar o jogo
         import sergipe_game
+        get_startup_profiler().mark("sergipe_game importado")
         sergipe_game.main()
         
     except KeyboardInterrupt:
@@ -82,8 +87,24 @@ def start_game():
     
     return True
 
+def parse_args(argv=None):
+    """Lê as opções de linha de comando do inicializador"""
+    parser = argparse.ArgumentParser(description="VIVA SERGIPE! - Inicializador")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Mostra o tempo de importação dos módulos e das etapas até o menu aparecer")
+    parser.add_argument("--profile-output", default="startup_profile.json",
+                        help="Arquivo JSON do perfil de inicialização")
+    args, _ = parser.parse_known_args(argv)
+    return args
+
 def main():
     """Função principal"""
+    args = parse_args()
+    profiler = get_startup_profiler()
+    if args.profile_startup:
+        profiler.install()
+        profiler.output_path = args.profile_output
+
     print("🎮 VIVA SERGIPE! - Inicializador v1.2")
     print("=" * 50)
     
@@ -91,12 +112,14 @@ def main():
     if not setup_environment():
         input("\nPressione Enter para sair...")
         return
+    profiler.mark("ambiente configurado")
     
     # Verificar dependências
     if not check_dependencies():
         print("\n💡 Execute primeiro: python scripts/fix_opencv.py")
         input("\nPressione Enter para sair...")
         return
+    profiler.mark("dependências verificadas")
     
     # Iniciar jogo
     start_game()
@@ -0,0 +1,137 @@
+"""
+PERFIL DE INICIALIZAÇÃO - VIVA SERGIPE!
+Tempo de importação dos módulos e das etapas até o menu aparecer (--profile-startup)
+"""
+
+import builtins
+import json
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class StartupProfiler:
+    """
+    Perfil da inicialização do jogo.
+
+    install() substitui builtins.__import__ por uma versão que mede a primeira
+    importação de cada módulo (tempo total e próprio, como 'python -X importtime');
+    mark() registra o tempo desde a criação do perfil em cada etapa. Desabilitado,
+    mark() não faz nada.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.enabled = False
+        self.phases: List[Tuple[str, float]] = []
+        self.imports: Dict[str, Tuple[float, float]] = {}  # módulo -> (total, próprio)
+        self.reported = False
+        self.output_path: Optional[str] = None
+        self._original_import = None
+        self._local = threading.local()
+
+    def install(self):
+        """Habilita o perfil e passa a medir as importações"""
+        if self._original_import is not None:
+            return
+        self.enabled = True
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def uninstall(self):
+        """Para de medir as importações"""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """__import__ que mede apenas a primeira importação de cada módulo"""
+        if level != 0 or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        # Pilha por thread: o tempo dos filhos é descontado do tempo próprio do pai
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            if name not in self.imports:
+                self.imports[name] = (elapsed, elapsed - children)
+
+    def mark(self, phase: str):
+        """
+        Registra uma etapa da inicialização
+
+        Args:
+            phase (str): Nome da etapa
+        """
+        if self.enabled:
+            self.phases.append((phase, time.perf_counter() - self.start))
+
+    def get_report(self, top: int = 15) -> Dict:
+        """
+        Gera o relatório da inicialização
+
+        Args:
+            top (int): Quantidade de importações mais lentas no relatório
+
+        Returns:
+            Dict: Etapas (ms desde o início) e importações mais lentas (ms)
+        """
+        slowest = sorted(self.imports.items(), key=lambda item: item[1][0], reverse=True)[:top]
+        return {
+            "phases_ms": [(phase, round(elapsed * 1000, 1)) for phase, elapsed in self.phases],
+            "slowest_imports_ms": [
+                {"module": name, "total": round(total * 1000, 1), "self": round(own * 1000, 1)}
+                for name, (total, own) in slowest
+            ],
+        }
+
+    def print_report(self, path: Optional[str] = None):
+        """
+        Mostra o relatório (uma vez) e opcionalmente o salva em JSON
+
+        Args:
+            path (Optional[str]): Arquivo JSON para salvar o relatório (padrão: output_path)
+        """
+        if not self.enabled or self.reported:
+            return
+        self.reported = True
+        self.uninstall()
+        report = self.get_report()
+        path = path or self.output_path
+
+        print("\n⏱️ Perfil de inicialização")
+        for phase, elapsed in report["phases_ms"]:
+            print(f"  • {elapsed:8.1f} ms  {phase}")
+        print("  Importações mais lentas (total / próprio):")
+        for entry in report["slowest_imports_ms"]:
+            print(f"  • {entry['total']:8.1f} / {entry['self']:7.1f} ms  {entry['module']}")
+
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+            print(f"💾 Perfil de inicialização salvo em {path}")
+
+
+# Instância global do perfil de inicialização
+startup_profiler = StartupProfiler()
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """
+    Obtém a instância global do perfil de inicialização
+
+    Returns:
+        StartupProfiler: Instância do perfil
+    """
+    return startup_profiler
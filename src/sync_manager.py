@@ -34,6 +34,7 @@ class SyncManager:
         self.state_callbacks = {}
         self.cleanup_callbacks = []
         self.running = True
+        self.shut_down = False
         self.lock = threading.RLock()
         
         # Configurar handler para sinais do sistema
@@ -378,6 +379,10 @@ class SyncManager:
     
     def shutdown(self):
         """Para todos os processos e faz limpeza"""
+        with self.lock:
+            if self.shut_down:
+                return  # Já encerrado (ex: sinal seguido da saída do processo)
+            self.shut_down = True
         print("Iniciando shutdown do SyncManager...")
         
         self.running = False
@@ -428,23 +433,23 @@ class SyncManager:
             return report
 
 
-# Instância global do gerenciador de sincronização
-sync_manager = SyncManager()
-
-
 def get_sync_manager() -> SyncManager:
     """
-    Obtém a instância global do gerenciador de sincronização
+    Obtém a instância global do gerenciador de sincronização (serviço "sync")
     
     Returns:
         SyncManager: Instância do gerenciador
     """
-    return sync_manager
+    from services import get_service
+    return get_service("sync")
 
 
 def cleanup_on_exit():
-    """Função para limpeza automática na saída"""
-    sync_manager.shutdown()
+    """Função para limpeza automática na saída (encerra também os demais serviços)"""
+    from services import get_service_registry
+    registry = get_service_registry()
+    if registry.is_running("sync"):
+        registry.shutdown()
 
 
 # Registrar limpeza automática
@@ -0,0 +1,387 @@
+"""
+RENDERIZADOR DE TEXTO - VIVA SERGIPE!
+Sprites de texto pré-rasterizados (cache LRU) e atlas de glifos Unicode para o texto com contorno do jogo
+"""
+
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from blending import blend_premultiplied
+
+# Pillow é opcional: sem ele, textos não-ASCII são simplificados para ASCII
+try:
+    from PIL import ImageFont
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+HERSHEY_FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+# Fontes TrueType procuradas (em ordem) para textos com acentos, setas e emojis
+UNICODE_FONTS = [
+    "DejaVuSans-Bold.ttf",
+    "arialbd.ttf",
+    "Arial Bold.ttf",
+    "NotoSans-Bold.ttf",
+    "seguisym.ttf",
+    "seguiemj.ttf",
+    "NotoSansSymbols2-Regular.ttf",
+    "NotoEmoji-Regular.ttf",
+    "Symbola.ttf",
+    "Apple Symbols.ttf",
+]
+
+# Caractere fora de qualquer fonte, usado para reconhecer o glifo "não encontrado"
+MISSING_GLYPH_PROBE = "\U0010FFFD"
+
+
+class TextSprite:
+    """Texto rasterizado: cor pré-multiplicada e alfa invertido prontos para composição"""
+
+    __slots__ = ("premultiplied", "inverse_alpha", "origin", "nbytes")
+
+    def __init__(self, premultiplied: np.ndarray, inverse_alpha: np.ndarray, origin: Tuple[int, int]):
+        """
+        Args:
+            premultiplied (np.ndarray): Cor BGR já multiplicada pelo alfa (uint8)
+            inverse_alpha (np.ndarray): 255 - alfa, replicado nos 3 canais (uint8)
+            origin (Tuple[int, int]): Posição da linha de base do texto dentro do sprite
+        """
+        self.premultiplied = premultiplied
+        self.inverse_alpha = inverse_alpha
+        self.origin = origin
+        self.nbytes = premultiplied.nbytes + inverse_alpha.nbytes
+
+
+class GlyphAtlas:
+    """Atlas de glifos TrueType com fallback de fonte por caractere"""
+
+    def __init__(self, font_names=UNICODE_FONTS):
+        """
+        Args:
+            font_names (list): Fontes procuradas, em ordem de preferência
+        """
+        self.font_names = list(font_names)
+        self._fonts: Dict[int, list] = {}
+        self._glyphs: Dict[Tuple[str, int], Optional[tuple]] = {}
+
+    def _get_fonts(self, size: int) -> list:
+        """Carrega (uma vez por tamanho) as fontes disponíveis no sistema"""
+        fonts = self._fonts.get(size)
+        if fonts is None:
+            fonts = []
+            for name in self.font_names:
+                try:
+                    font = ImageFont.truetype(name, size)
+                except (OSError, ValueError):
+                    continue
+                fonts.append((font, self._mask_array(font.getmask(MISSING_GLYPH_PROBE))))
+            self._fonts[size] = fonts
+        return fonts
+
+    @staticmethod
+    def _mask_array(mask) -> np.ndarray:
+        """Converte a máscara de um glifo do Pillow em array (altura, largura)"""
+        width, height = mask.size
+        return np.array(mask, dtype=np.uint8).reshape(height, width)
+
+    def get_glyph(self, char: str, size: int) -> Optional[tuple]:
+        """
+        Obtém um glifo do atlas
+
+        Args:
+            char (str): Caractere
+            size (int): Tamanho da fonte em pixels
+
+        Returns:
+            Optional[tuple]: (máscara, bbox, avanço, ascendente) ou None se nenhuma fonte tem o glifo
+        """
+        key = (char, size)
+        if key in self._glyphs:
+            return self._glyphs[key]
+
+        glyph = None
+        for font, missing in self._get_fonts(size):
+            mask = self._mask_array(font.getmask(char))
+            if char.strip() and mask.shape == missing.shape and np.array_equal(mask, missing):
+                continue  # Glifo ausente nesta fonte
+            bbox = font.getbbox(char)
+            glyph = (mask, bbox, font.getlength(char), font.getmetrics())
+            break
+
+        self._glyphs[key] = glyph
+        return glyph
+
+    def render(self, text: str, size: int) -> Tuple[Optional[np.ndarray], int]:
+        """
+        Rasteriza uma linha de texto como máscara de cobertura
+
+        Args:
+            text (str): Texto
+            size (int): Tamanho da fonte em pixels
+
+        Returns:
+            Tuple[Optional[np.ndarray], int]: (máscara uint8, posição da linha de base),
+            ou (None, 0) se nenhuma fonte estiver disponível
+        """
+        found = [(char, self.get_glyph(char, size)) for char in text]
+        kept = [(char, glyph) for char, glyph in found if glyph is not None]
+        if len(kept) < len(found):
+            # Sem os glifos ausentes (ex: emoji sem fonte), remove os espaços que sobram nas pontas
+            while kept and kept[0][0].isspace():
+                kept.pop(0)
+            while kept and kept[-1][0].isspace():
+                kept.pop()
+        glyphs = [glyph for _, glyph in kept]
+        if not glyphs:
+            return None, 0
+
+        ascent = max(glyph[3][0] for glyph in glyphs)
+        descent = max(glyph[3][1] for glyph in glyphs)
+        width = int(np.ceil(sum(glyph[2] for glyph in glyphs))) + size
+        canvas = np.zeros((ascent + descent, width), dtype=np.uint8)
+
+        cursor = 0.0
+        for mask, bbox, advance, (glyph_ascent, _) in glyphs:
+            x = int(round(cursor)) + bbox[0]
+            y = bbox[1] + (ascent - glyph_ascent)
+            h, w = mask.shape
+            region = canvas[max(y, 0):y + h, max(x, 0):x + w]
+            patch = mask[max(-y, 0):max(-y, 0) + region.shape[0], max(-x, 0):max(-x, 0) + region.shape[1]]
+            np.maximum(region, patch, out=region)
+            cursor += advance
+
+        return canvas, ascent
+
+
+class TextRenderer:
+    """
+    Desenha texto com sombra e contorno a partir de sprites em cache.
+
+    Cada combinação de texto, escala, cores e espessuras é rasterizada uma
+    única vez (sombra, 8 passadas de contorno e preenchimento compostas em um
+    sprite com alfa) e depois aplicada ao frame em uma única composição.
+    """
+
+    def __init__(self, max_cache_bytes: int = 32 * 1024 * 1024):
+        """
+        Args:
+            max_cache_bytes (int): Memória máxima usada pelos sprites em cache
+        """
+        self.max_cache_bytes = max_cache_bytes
+        self.cache_bytes = 0
+        self._cache: "OrderedDict[tuple, TextSprite]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.atlas = GlyphAtlas() if PIL_AVAILABLE else None
+
+        # Estatísticas
+        self.hits = 0
+        self.misses = 0
+
+    def draw_bold_text(self, frame, text, position, font_scale=2.5, color=(255, 255, 255),
+                       thickness=5, line_type=cv2.LINE_AA, offset=3, outline_color=(0, 0, 0),
+                       outline_thickness=None):
+        """
+        Desenha texto com sombra e contorno (mesmos parâmetros de utils.draw_bold_text)
+
+        Args:
+            frame (np.ndarray): Frame BGR (modificado no lugar)
+            text (str): Texto
+            position (tuple): Posição (x, y) da linha de base
+            font_scale (float): Escala da fonte
+            color (tuple): Cor do texto (BGR)
+            thickness (int): Espessura do texto
+            line_type: Tipo de linha do OpenCV
+            offset (int): Deslocamento das passadas de contorno
+            outline_color (tuple): Cor do contorno (BGR)
+            outline_thickness (int): Espessura do contorno (padrão: thickness + 4)
+        """
+        if outline_thickness is None:
+            outline_thickness = thickness + 4
+
+        text = str(text)
+        if not text:
+            return
+
+        if frame.ndim != 3 or frame.shape[2] != 3:
+            # Frames que não são BGR usam o desenho direto
+            for mask_position, layer_color, layer_thickness in self._hershey_passes(
+                    position, color, thickness, offset, outline_color, outline_thickness):
+                cv2.putText(frame, self._to_ascii(text), mask_position, HERSHEY_FONT,
+                            font_scale, layer_color, layer_thickness, line_type)
+            return
+
+        key = (text, float(font_scale), tuple(color), thickness, line_type, offset,
+               tuple(outline_color), outline_thickness)
+        sprite = self.get_sprite(key)
+        self._blend(frame, sprite, position)
+
+    def get_sprite(self, key: tuple) -> TextSprite:
+        """
+        Obtém um sprite do cache LRU, rasterizando-o se necessário
+
+        Args:
+            key (tuple): (texto, escala, cor, espessura, tipo de linha, deslocamento,
+                cor do contorno, espessura do contorno)
+
+        Returns:
+            TextSprite: Sprite do texto
+        """
+        with self._lock:
+            sprite = self._cache.get(key)
+            if sprite is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return sprite
+
+        sprite = self._rasterize(*key)
+
+        with self._lock:
+            self.misses += 1
+            if key not in self._cache:
+                self._cache[key] = sprite
+                self.cache_bytes += sprite.nbytes
+                while self.cache_bytes > self.max_cache_bytes and len(self._cache) > 1:
+                    _, evicted = self._cache.popitem(last=False)
+                    self.cache_bytes -= evicted.nbytes
+        return sprite
+
+    def clear_cache(self):
+        """Descarta todos os sprites em cache"""
+        with self._lock:
+            self._cache.clear()
+            self.cache_bytes = 0
+
+    @staticmethod
+    def _hershey_passes(position, color, thickness, offset, outline_color, outline_thickness):
+        """Passadas de desenho do texto em negrito: sombra, 8 contornos e preenchimento"""
+        x, y = position
+        passes = [((x + 3, y + 3), (0, 0, 0), outline_thickness)]
+        for offset_x, offset_y in [
+            (-offset, -offset), (-offset, 0), (-offset, offset),
+            (0, -offset), (0, offset),
+            (offset, -offset), (offset, 0), (offset, offset),
+        ]:
+            passes.append(((x + offset_x, y + offset_y), outline_color, outline_thickness))
+        passes.append(((x, y), color, thickness))
+        return passes
+
+    @staticmethod
+    def _to_ascii(text: str) -> str:
+        """Remove acentos e caracteres que as fontes Hershey não desenham"""
+        normalized = unicodedata.normalize("NFKD", text)
+        return "".join(char for char in normalized if 32 <= ord(char) < 127).strip()
+
+    def _rasterize(self, text, font_scale, color, thickness, line_type, offset,
+                   outline_color, outline_thickness) -> TextSprite:
+        """Rasteriza o texto em camadas e compõe o sprite"""
+        is_ascii = all(ord(char) < 128 for char in text)
+        glyph_mask = None
+        if not is_ascii and self.atlas is not None:
+            # Tamanho TrueType equivalente à altura de maiúsculas da fonte Hershey
+            (_, cap_height), _ = cv2.getTextSize("H", HERSHEY_FONT, font_scale, 1)
+            glyph_mask, ascent = self.atlas.render(text, max(8, int(round(cap_height / 0.73))))
+        if glyph_mask is None and not is_ascii:
+            text = self._to_ascii(text)
+
+        pad = offset + outline_thickness + 4
+        if glyph_mask is not None:
+            layers, origin, shape = self._glyph_layers(
+                glyph_mask, ascent, pad, color, thickness, offset, outline_color, outline_thickness)
+        else:
+            (text_width, text_height), baseline = cv2.getTextSize(
+                text, HERSHEY_FONT, font_scale, outline_thickness)
+            shape = (text_height + baseline + 2 * pad + 3, text_width + 2 * pad + 3)
+            origin = (pad, pad + text_height)
+            layers = []
+            for layer_position, layer_color, layer_thickness in self._hershey_passes(
+                    origin, color, thickness, offset, outline_color, outline_thickness):
+                mask = np.zeros(shape, dtype=np.uint8)
+                cv2.putText(mask, text, layer_position, HERSHEY_FONT, font_scale, 255,
+                            layer_thickness, line_type)
+                layers.append((mask, layer_color))
+
+        return self._compose(layers, shape, origin)
+
+    @staticmethod
+    def _glyph_layers(glyph_mask, ascent, pad, color, thickness, offset, outline_color, outline_thickness):
+        """Camadas de sombra, contorno e preenchimento a partir da máscara TrueType"""
+        height, width = glyph_mask.shape
+        shape = (height + 2 * pad + 3, width + 2 * pad + 3)
+        origin = (pad, pad + ascent)
+
+        fill = np.zeros(shape, dtype=np.uint8)
+        fill[pad:pad + height, pad:pad + width] = glyph_mask
+
+        # Espessura do traço: dilata o glifo proporcionalmente à espessura pedida
+        fill_radius = max(0, thickness // 4)
+        if fill_radius:
+            kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (2 * fill_radius + 1,) * 2)
+            fill = cv2.dilate(fill, kernel)
+        outline_radius = max(1, (outline_thickness - thickness) // 2)
+        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (2 * outline_radius + 1,) * 2)
+        outline = cv2.dilate(fill, kernel)
+
+        def shifted(mask, dx, dy):
+            return cv2.warpAffine(mask, np.float32([[1, 0, dx], [0, 1, dy]]), (shape[1], shape[0]))
+
+        layers = [(shifted(outline, 3, 3), (0, 0, 0))]
+        for offset_x, offset_y in [
+            (-offset, -offset), (-offset, 0), (-offset, offset),
+            (0, -offset), (0, offset),
+            (offset, -offset), (offset, 0), (offset, offset),
+        ]:
+            layers.append((shifted(outline, offset_x, offset_y), outline_color))
+        layers.append((fill, color))
+        return layers, origin, shape
+
+    @staticmethod
+    def _compose(layers, shape, origin) -> TextSprite:
+        """Compõe as camadas em ordem (operador 'over') em um sprite pré-multiplicado"""
+        premultiplied = np.zeros(shape + (3,), dtype=np.float32)
+        alpha = np.zeros(shape, dtype=np.float32)
+        for mask, layer_color in layers:
+            coverage = mask.astype(np.float32) / 255.0
+            keep = 1.0 - coverage
+            premultiplied *= keep[..., None]
+            premultiplied += coverage[..., None] * np.float32(layer_color)[:3]
+            alpha *= keep
+            alpha += coverage
+
+        # Recorta a área sem texto para compor apenas o necessário
+        ys, xs = np.nonzero(alpha > 0.5 / 255.0)
+        if len(ys) == 0:
+            empty = np.zeros((0, 0, 3), dtype=np.uint8)
+            return TextSprite(empty, empty, (0, 0))
+        y0, y1, x0, x1 = ys.min(), ys.max() + 1, xs.min(), xs.max() + 1
+
+        premultiplied = np.clip(np.rint(premultiplied[y0:y1, x0:x1]), 0, 255).astype(np.uint8)
+        inverse_alpha = np.clip(np.rint(255.0 * (1.0 - alpha[y0:y1, x0:x1])), 0, 255).astype(np.uint8)
+        inverse_alpha = cv2.merge([inverse_alpha] * 3)
+        return TextSprite(premultiplied, inverse_alpha, (origin[0] - x0, origin[1] - y0))
+
+    @staticmethod
+    def _blend(frame, sprite: TextSprite, position):
+        """Aplica o sprite ao frame (apenas na área visível)"""
+        left = int(position[0]) - sprite.origin[0]
+        top = int(position[1]) - sprite.origin[1]
+        blend_premultiplied(frame, sprite.premultiplied, sprite.inverse_alpha, (left, top))
+
+
+# Instância global do renderizador de texto
+text_renderer = TextRenderer()
+
+
+def get_text_renderer() -> TextRenderer:
+    """
+    Obtém a instância global do renderizador de texto
+
+    Returns:
+        TextRenderer: Instância do renderizador
+    """
+    return text_renderer
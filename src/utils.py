@@ -9,19 +9,22 @@ and 2) to play the body pose game (play.py)
 
 import cv2  # OpenCV for video capture and processing
 import numpy as np  # NumPy for numerical computations
-import mediapipe as mp  # MediaPipe for pose landmark detection
 import time  # Time-related function
 import os  # Operating system-related functions, e.g. directory and path operations
-import pygame  # Pygame for game-related functionalities
+import sys  # System-specific parameters and functions
+from functools import lru_cache
 from typing import Tuple, List, Dict, Any, Optional
 
 # Compatibilidade com versões antigas do OpenCV
 if not hasattr(cv2, 'LINE_AA'):
     cv2.LINE_AA = cv2.LINE_8  # Usar LINE_8 como fallback
 
-mp_pose = mp.solutions.pose
-mp_drawing = mp.solutions.drawing_utils
-mp_drawing_styles = mp.solutions.drawing_styles
+# Cached text sprites (imported after the LINE_AA fallback above)
+from text_renderer import get_text_renderer
+from blending import tint
+from landmark_renderer import get_landmark_renderer
+
+text_renderer = get_text_renderer()
 
 ##################
 ### PARAMETERS ###
@@ -52,6 +55,9 @@ def draw_bold_text(
     """
     Draws bolder text with outline and shadow for better readability.
 
+    The shadow, eight outline passes and fill are rasterized once per combination of text and style
+    into a cached sprite. Non-ASCII text (accents, arrows) is rendered with a TrueType glyph atlas.
+
     Args:
         frame (numpy.ndarray): The image/frame on which to draw the text.
         text (str): The text to be drawn.
@@ -67,50 +73,18 @@ def draw_bold_text(
     Returns:
         None (action performed directly on frame).
     """
-    if outline_thickness is None:
-        outline_thickness = thickness + 4
-
-    # Draw shadow first (offset down and right)
-    shadow_position = (position[0] + 3, position[1] + 3)
-    cv2.putText(
-        frame,
-        text,
-        shadow_position,
-        cv2.FONT_HERSHEY_SIMPLEX,
-        font_scale,
-        (0, 0, 0),  # Black shadow
-        outline_thickness,
-        line_type,
-    )
-
-    # Draw outline in multiple directions for better visibility
-    for offset_x, offset_y in [
-        (-offset, -offset), (-offset, 0), (-offset, offset),
-        (0, -offset), (0, offset),
-        (offset, -offset), (offset, 0), (offset, offset),
-    ]:
-        outline_position = (position[0] + offset_x, position[1] + offset_y)
-        cv2.putText(
-            frame,
-            text,
-            outline_position,
-            cv2.FONT_HERSHEY_SIMPLEX,
-            font_scale,
-            outline_color,
-            outline_thickness,
-            line_type,
-        )
-
-    # Draw main text on top
-    cv2.putText(
+    # Rendered once per text/style into a cached sprite, then blended in a single pass
+    text_renderer.draw_bold_text(
         frame,
         text,
         position,
-        cv2.FONT_HERSHEY_SIMPLEX,
-        font_scale,
-        color,
-        thickness,
-        line_type,
+        font_scale=font_scale,
+        color=color,
+        thickness=thickness,
+        line_type=line_type,
+        offset=offset,
+        outline_color=outline_color,
+        outline_thickness=outline_thickness,
     )
 
 
@@ -126,20 +100,62 @@ def initialize_pose_model(
     Returns:
         mediapipe.solutions.pose.Pose: Initialized Pose Landmark Detection instance that is used for further processing in function 'process_frame'.
     """
-    return mp_pose.Pose(
+    # MediaPipe takes about a second to import, so it is loaded only when a model is needed
+    import mediapipe as mp
+
+    return mp.solutions.pose.Pose(
         model_complexity=model_complexity,
         min_detection_confidence=min_detection_confidence,
         min_tracking_confidence=min_tracking_confidence,
     )
 
 
-def process_frame(frame, pose):
+@lru_cache(maxsize=1)
+def get_screen_size(default=(1920, 1080)):
+    """
+    Returns the size of the primary screen, computed once per process.
+
+    Uses the running QApplication when the menu already created one, the Win32 API on
+    Windows and only falls back to a temporary tkinter root (slow to create) otherwise.
+
+    Args:
+        default (Tuple[int, int]): Size returned when no method works.
+
+    Returns:
+        Tuple[int, int]: (width, height) in pixels.
+    """
+    qt_widgets = sys.modules.get("PyQt5.QtWidgets")
+    if qt_widgets is not None and qt_widgets.QApplication.instance() is not None:
+        size = qt_widgets.QApplication.instance().primaryScreen().size()
+        return size.width(), size.height()
+
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            user32 = ctypes.windll.user32
+            return user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)
+        except Exception:
+            pass
+
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+        size = root.winfo_screenwidth(), root.winfo_screenheight()
+        root.destroy()
+        return size
+    except Exception:
+        return default
+
+
+def process_frame(frame, pose, draw_landmarks=True):
     """
     Processes frame from videostream using the specified MediaPipe Pose model.
 
     Args:
         frame (numpy.ndarray): The input frame in BGR format.
         pose (mediapipe.solutions.pose.Pose): Initialized Pose model.
+        draw_landmarks (bool): Whether to draw the landmarks onto the frame. Callers that
+            draw them later (e.g. after mirroring, with a LandmarkRenderer) pass False.
 
     Returns:
         Tuple[Any, numpy.ndarray]: A tuple containing
@@ -154,21 +170,27 @@ def process_frame(frame, pose):
     # Convert frame back to BGR color scheme.
     frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
 
-    # Draw landmark and landmark connections on frame using given parameters for color/style (can be adjusted)
-    mp_drawing.draw_landmarks(
-        frame,
-        results.pose_landmarks,
-        mp_pose.POSE_CONNECTIONS,
-        landmark_drawing_spec=mp_drawing.DrawingSpec(
-            color=(255, 255, 255), thickness=4, circle_radius=5  # white
-        ),
-        connection_drawing_spec=mp_drawing.DrawingSpec(
-            color=(255, 0, 0), thickness=15, circle_radius=5  # blue
-        ),
-    )
+    if draw_landmarks:
+        draw_pose_landmarks(frame, results)
     return results, frame
 
 
+def draw_pose_landmarks(frame, results):
+    """
+    Draws the landmarks and landmark connections of pose results on a frame (in place).
+
+    Args:
+        frame (numpy.ndarray): The frame in BGR format.
+        results: The results of pose processing (e.g. from 'process_frame' or a PoseInferenceWorker).
+
+    Returns:
+        numpy.ndarray: The annotated frame.
+    """
+    # Draw landmark and landmark connections on frame in the "classic" style:
+    # white landmarks, thick blue connections (see landmark_renderer.LANDMARK_STYLES)
+    return get_landmark_renderer("classic").draw(frame, results)
+
+
 def extract_landmarks(results):
     """
     This function takes the results of pose processing and extracts specific pose landmarks
@@ -390,13 +412,9 @@ def blink_screen(
         numpy.ndarray: The modified image frame (frame merged with the blink effect.)
         bool: Updated blink_flag.
     """
-    blink_rect = np.zeros_like(
-        frame
-    )  # Initializes blinking array of the same shape/size as the frame.
-    blink_rect[:, :, color_channel] = 255  # Sets blinking array the specified color.
-    frame = cv2.addWeighted(
-        frame, 1 - alpha, blink_rect, alpha, 0
-    )  # Merges frame and blinking array.
+    blink_color = [0, 0, 0]
+    blink_color[color_channel] = 255  # Blink color: full intensity on the specified channel.
+    tint(frame, blink_color, alpha)  # Merges frame and blink color in place.
 
     # Turns blinking off after blink_duration.
     if time.time() - record_time >= blink_duration:
@@ -5,9 +5,15 @@ Melhorias na interface visual e feedback para o usuário
 
 import cv2
 import numpy as np
+import threading
 import time
 from typing import Tuple, Optional, Dict, Any
 from config_manager import get_config_manager
+from blending import tint
+from landmark_renderer import get_landmark_renderer
+
+# Tamanho da miniatura usada para medir iluminação e contraste da cena
+SCENE_THUMBNAIL_SIZE = (160, 90)
 
 
 class VisualFeedbackManager:
@@ -24,8 +30,67 @@ class VisualFeedbackManager:
         }
         self.feedback_messages = []
         self.message_start_time = 0
-        
-    def analyze_detection_quality(self, frame: np.ndarray, results, body_pixels: int) -> Dict[str, Any]:
+
+        # Iluminação muda devagar: a cena é medida em uma miniatura a cada intervalo
+        self.scene_analysis_interval = self.config_manager.get('visual', 'scene_analysis_interval', 0.5)
+        self.scene_analysis_background = self.config_manager.get('visual', 'scene_analysis_background', False)
+        self.scene_stats = None  # (brilho, contraste)
+        self.last_scene_analysis = 0.0
+        self.scene_analyses = 0
+        self._scene_thread = None
+        self._scene_lock = threading.Lock()
+
+        # Última análise, reaproveitada em chamadas repetidas para o mesmo frame
+        self._analysis_key = None
+        self._analysis = None
+
+    def analyze_scene(self, frame: np.ndarray) -> Tuple[float, float]:
+        """
+        Mede brilho e contraste da cena em uma miniatura do frame
+
+        A medição é refeita no máximo uma vez por 'scene_analysis_interval'
+        segundos; nos demais frames o último valor é reaproveitado. Com
+        'scene_analysis_background', o cálculo roda em uma thread e o valor
+        anterior é usado até o novo ficar pronto.
+
+        Args:
+            frame: Frame BGR atual
+
+        Returns:
+            Tuple[float, float]: Brilho (média) e contraste (desvio padrão) em tons de cinza
+        """
+        now = time.time()
+        with self._scene_lock:
+            stats = self.scene_stats
+            stale = stats is None or now - self.last_scene_analysis >= self.scene_analysis_interval
+            busy = self._scene_thread is not None and self._scene_thread.is_alive()
+            if stale and not busy:
+                self.last_scene_analysis = now
+            else:
+                stale = False
+        if not stale:
+            return stats
+
+        # Amostragem por vizinho mais próximo: barata e não suaviza o contraste
+        thumbnail = cv2.resize(frame, SCENE_THUMBNAIL_SIZE, interpolation=cv2.INTER_NEAREST)
+        if self.scene_analysis_background and stats is not None:
+            self._scene_thread = threading.Thread(target=self._measure_scene, args=(thumbnail,), daemon=True)
+            self._scene_thread.start()
+            return stats
+        return self._measure_scene(thumbnail)
+
+    def _measure_scene(self, thumbnail: np.ndarray) -> Tuple[float, float]:
+        """Calcula brilho e contraste da miniatura e guarda o resultado"""
+        gray = cv2.cvtColor(thumbnail, cv2.COLOR_BGR2GRAY)
+        mean, std = cv2.meanStdDev(gray)
+        stats = (float(mean[0, 0]), float(std[0, 0]))
+        with self._scene_lock:
+            self.scene_stats = stats
+            self.scene_analyses += 1
+        return stats
+        
+    def analyze_detection_quality(self, frame: np.ndarray, results, body_pixels: int,
+                                  frame_id: Optional[int] = None) -> Dict[str, Any]:
         """
         Analisa a qualidade da detecção corporal
         
@@ -33,10 +98,22 @@ class VisualFeedbackManager:
             frame: Frame atual da câmera
             results: Resultados do MediaPipe
             body_pixels: Número de pixels do corpo detectados
+            frame_id: Identificador do frame; chamadas repetidas com o mesmo frame,
+                resultados e pixels devolvem a análise já calculada
             
         Returns:
-            Dict com análise da qualidade
+            Dict com análise da qualidade (compartilhado entre chamadas do mesmo frame)
         """
+        key = (frame_id, id(results), body_pixels)
+        if frame_id is not None and key == self._analysis_key:
+            return self._analysis
+
+        analysis = self._analyze_detection_quality(frame, results, body_pixels)
+        self._analysis_key, self._analysis = key, analysis
+        return analysis
+
+    def _analyze_detection_quality(self, frame: np.ndarray, results, body_pixels: int) -> Dict[str, Any]:
+        """Calcula a análise de qualidade (ver analyze_detection_quality)"""
         analysis = {
             "status": "unknown",
             "confidence": 0.0,
@@ -55,10 +132,8 @@ class VisualFeedbackManager:
             ])
             return analysis
         
-        # Analisar qualidade da iluminação
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        brightness = np.mean(gray)
-        contrast = np.std(gray)
+        # Analisar qualidade da iluminação (miniatura medida periodicamente)
+        brightness, contrast = self.analyze_scene(frame)
         
         if brightness < 80:
             analysis["issues"].append("Iluminação muito escura")
@@ -72,7 +147,7 @@ class VisualFeedbackManager:
             analysis["suggestions"].append("Use roupas contrastantes com o fundo")
         
         # Analisar pixels do corpo
-        min_pixels = self.config_manager.get('game', 'min_body_pixels', 1000)
+        min_pixels = self.config_manager.get_snapshot().min_body_pixels
         
         if body_pixels < min_pixels * 0.5:
             analysis["status"] = "poor"
@@ -228,48 +303,20 @@ class VisualFeedbackManager:
         
         return frame
     
-    def draw_pose_landmarks_enhanced(self, frame: np.ndarray, results) -> np.ndarray:
+    def draw_pose_landmarks_enhanced(self, frame: np.ndarray, results, mirrored: bool = False) -> np.ndarray:
         """
         Desenha landmarks da pose com feedback visual melhorado
         
         Args:
             frame: Frame para desenhar
             results: Resultados do MediaPipe
+            mirrored: True se o frame foi espelhado depois da detecção
             
         Returns:
             Frame com landmarks melhorados
         """
-        if results.pose_landmarks is None:
-            return frame
-        
-        # Importar MediaPipe para desenhar
-        try:
-            import mediapipe as mp
-            mp_drawing = mp.solutions.drawing_utils
-            mp_pose = mp.solutions.pose
-            
-            # Estilo personalizado para landmarks
-            landmark_style = mp_drawing.DrawingSpec(
-                color=(0, 255, 0), thickness=3, circle_radius=3
-            )
-            connection_style = mp_drawing.DrawingSpec(
-                color=(0, 200, 0), thickness=2
-            )
-            
-            # Desenhar landmarks
-            mp_drawing.draw_landmarks(
-                frame, 
-                results.pose_landmarks, 
-                mp_pose.POSE_CONNECTIONS,
-                landmark_style,
-                connection_style
-            )
-            
-        except ImportError:
-            # Fallback se MediaPipe não estiver disponível
-            pass
-        
-        return frame
+        # Estilo personalizado (landmarks e conexões verdes) pré-calculado no renderizador
+        return get_landmark_renderer("enhanced").draw(frame, results, mirrored)
     
     def show_temporary_message(self, message: str, duration: float = 3.0):
         """
@@ -325,13 +372,9 @@ class VisualFeedbackManager:
                 text_size[1] + 20
             )
             
-            overlay = frame.copy()
-            cv2.rectangle(overlay, (bg_rect[0], bg_rect[1]), 
-                         (bg_rect[0] + bg_rect[2], bg_rect[1] + bg_rect[3]),
-                         (0, 0, 0), -1)
-            
-            # Aplicar transparência
-            cv2.addWeighted(overlay, alpha * 0.7, frame, 1 - alpha * 0.7, 0, frame)
+            # Aplicar transparência apenas no retângulo do fundo
+            tint(frame, (0, 0, 0), alpha * 0.7,
+                 rect=(bg_rect[0], bg_rect[1], bg_rect[0] + bg_rect[2] + 1, bg_rect[1] + bg_rect[3] + 1))
             
             # Desenhar texto
             text_color = (255, 255, 255)
@@ -356,7 +399,7 @@ class VisualFeedbackManager:
         Returns:
             Frame com informações de performance
         """
-        if not self.config_manager.get('visual', 'show_debug_info', False):
+        if not self.config_manager.get_snapshot().show_debug_info:
             return frame
         
         height, width = frame.shape[:2]
@@ -383,15 +426,12 @@ class VisualFeedbackManager:
         return frame
 
 
-# Instância global do gerenciador de feedback visual
-visual_feedback = VisualFeedbackManager()
-
-
 def get_visual_feedback_manager() -> VisualFeedbackManager:
     """
-    Obtém a instância global do gerenciador de feedback visual
+    Obtém a instância global do gerenciador de feedback visual (serviço "visual_feedback")
     
     Returns:
         VisualFeedbackManager: Instância do gerenciador
     """
-    return visual_feedback
+    from services import get_service
+    return get_service("visual_feedback")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Teste da avaliação incremental de conquistas do VIVA SERGIPE!
+"""
+
+import sys
+import os
+import tempfile
+
+# Adicionar src ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from config_manager import ConfigManager
+from achievements import AchievementManager, ThresholdPredicate, WinRatePredicate, compile_condition
+
+def create_manager(temp_dir):
+    """Cria um gerenciador de conquistas com configuração própria"""
+    config = ConfigManager(os.path.join(temp_dir, "config.json"))
+    return AchievementManager(config)
+
+def test_compiled_predicates():
+    """Testa a compilação das condições em predicados"""
+    print("🧪 Testando predicados compilados...")
+
+    predicate = compile_condition({"best_time": 60.0, "operator": "less_than"}, 10)
+    if not isinstance(predicate, ThresholdPredicate) or predicate.keys != {"best_time"}:
+        print("❌ Condição numérica compilada incorretamente")
+        return False
+    if predicate.is_met({"best_time": 0}) or not predicate.is_met({"best_time": 45.0}):
+        print("❌ Operador less_than incorreto")
+        return False
+
+    predicate = compile_condition({"win_rate": 0.5, "min_games": 10}, 10)
+    if not isinstance(predicate, WinRatePredicate) or predicate.keys != {"games_played", "games_won"}:
+        print("❌ Condição de taxa de vitória compilada incorretamente")
+        return False
+    if predicate.progress({"games_played": 5}) != 25 or not predicate.is_met({"games_played": 10, "games_won": 5}):
+        print("❌ Progresso ou condição da taxa de vitória incorretos")
+        return False
+
+    print("✅ Condições compiladas com as estatísticas que leem")
+    return True
+
+def test_incremental_evaluation():
+    """Testa se apenas as conquistas afetadas são reavaliadas"""
+    print("🧪 Testando avaliação incremental...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = create_manager(temp_dir)
+        manager.check_achievements()
+        stats_before = dict(manager.config_manager.config['stats'])
+
+        # Nada mudou: nenhuma conquista é reavaliada
+        evaluations = manager.evaluations
+        for _ in range(100):
+            manager.check_stat_changes({"best_percentage": 0.0})
+        if manager.evaluations != evaluations:
+            print(f"❌ {manager.evaluations - evaluations} avaliações sem mudanças")
+            return False
+
+        # games_won só reavalia quem lê games_won (e a completista, após um desbloqueio)
+        newly_unlocked = manager.check_stat_changes({"games_won": 1})
+        evaluated = manager.evaluations - evaluations
+        readers = [aid for aid, predicate in manager._predicates.items() if "games_won" in predicate.keys]
+        if newly_unlocked != ["getting_started"] or evaluated != len(readers) + 1:
+            print(f"❌ Desbloqueadas {newly_unlocked} com {evaluated} avaliações")
+            return False
+
+        # As estatísticas da configuração não são alteradas
+        if manager.config_manager.config['stats'] != stats_before:
+            print("❌ Estatísticas da configuração modificadas")
+            return False
+
+        manager.config_manager.shutdown()
+
+    print(f"✅ {evaluated} avaliações para uma mudança em games_won")
+    return True
+
+def test_progress_cache():
+    """Testa o cache de progresso invalidado por estatística"""
+    print("🧪 Testando cache de progresso...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = create_manager(temp_dir)
+        manager.config_manager.update_stats(games_played=5)
+
+        progress = manager.get_achievement_progress()
+        if progress["dedicated_player"]["progress_percentage"] != 50:
+            print(f"❌ Progresso incorreto: {progress['dedicated_player']}")
+            return False
+        manager._progress_cache["marathon_runner"] = -1  # Marca para detectar recálculo
+
+        manager.config_manager.update_stats(games_played=1)
+        progress = manager.get_achievement_progress()
+        if progress["dedicated_player"]["progress_percentage"] != 60:
+            print("❌ Progresso não foi recalculado após a mudança")
+            return False
+        if progress["marathon_runner"]["progress_percentage"] != -1:
+            print("❌ Progresso de conquista não afetada foi recalculado")
+            return False
+
+        manager.config_manager.shutdown()
+
+    print("✅ Progresso recalculado apenas para as estatísticas alteradas")
+    return True
+
+def main():
+    """Função principal do teste"""
+    print("🎮 VIVA SERGIPE! - Teste de Conquistas")
+    print("=" * 50)
+
+    success = (
+        test_compiled_predicates()
+        and test_incremental_evaluation()
+        and test_progress_cache()
+    )
+
+    if success:
+        print("\n🎉 Todos os testes de conquistas passaram!")
+    else:
+        print("\n❌ Alguns testes falharam!")
+
+    return success
+
+if __name__ == "__main__":
+    main()
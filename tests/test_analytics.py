@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Teste do log de eventos de analytics do VIVA SERGIPE!
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+# Adicionar src ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import analytics
+from analytics import AnalyticsManager
+
+def create_manager(data_dir):
+    """Cria um gerenciador de analytics habilitado em uma pasta temporária"""
+    manager = AnalyticsManager(data_dir)
+    manager.enabled = True
+    return manager
+
+def test_append_only_log_and_totals():
+    """Testa o log acrescentado por linhas e os totais incrementais"""
+    print("🧪 Testando log de eventos e totais...")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        manager = create_manager(data_dir)
+        manager.track_game_session('classic', 30.0, {'won': True, 'best_percentage': 80.0})
+        manager.track_game_session('classic', 10.0, {'won': False, 'best_percentage': 40.0})
+        manager.track_achievement('first_win', 50)
+        manager._save_events()
+
+        size = os.path.getsize(manager.events_file)
+        manager.track_feature_usage('menu', 'open')
+        manager._save_events()
+
+        with open(manager.events_file, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        if len(lines) != 4 or json.loads(lines[-1])['event_type'] != 'feature_usage':
+            print(f"❌ Log com {len(lines)} linhas")
+            return False
+        if os.path.getsize(manager.events_file) <= size:
+            print("❌ Log não cresceu por acréscimo")
+            return False
+
+        # Estatísticas vêm do resumo persistido, sem reler o log
+        stats = create_manager(data_dir).get_local_statistics()
+        expected = {'total_sessions': 2, 'total_playtime': 40.0, 'win_rate': 50.0,
+                    'avg_percentage': 60.0, 'achievements_unlocked': 1, 'total_points': 50}
+        if stats != expected:
+            print(f"❌ Estatísticas incorretas: {stats}")
+            return False
+
+    print("✅ Eventos acrescentados e totais mantidos a cada evento")
+    return True
+
+def test_log_rotation():
+    """Testa a rotação e compressão do log"""
+    print("🧪 Testando rotação do log...")
+
+    original_max_bytes = analytics.MAX_LOG_BYTES
+    analytics.MAX_LOG_BYTES = 2000
+    try:
+        with tempfile.TemporaryDirectory() as data_dir:
+            manager = create_manager(data_dir)
+            for index in range(300):
+                manager.track_feature_usage('menu', f'action_{index}')
+            manager._save_events()
+
+            segments = manager._segment_files()
+            if not segments or len(segments) > analytics.MAX_LOG_SEGMENTS:
+                print(f"❌ Segmentos inesperados: {segments}")
+                return False
+            if os.path.exists(manager.events_file) and os.path.getsize(manager.events_file) > 2000 * 2:
+                print("❌ Log atual não foi rotacionado")
+                return False
+
+            # Segmentos antigos descartados, mas os totais continuam completos
+            events = manager.read_events()
+            if not events or events[-1]['properties']['action'] != 'action_299':
+                print("❌ Eventos recentes não encontrados nos segmentos")
+                return False
+            if manager.summary['events'] != 300:
+                print(f"❌ Total de eventos incorreto: {manager.summary['events']}")
+                return False
+    finally:
+        analytics.MAX_LOG_BYTES = original_max_bytes
+
+    print(f"✅ Log rotacionado em {len(segments)} segmentos comprimidos")
+    return True
+
+def test_legacy_migration_and_delete():
+    """Testa a migração do arquivo antigo e a remoção dos dados"""
+    print("🧪 Testando migração e remoção de dados...")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        legacy_events = [
+            {'event_type': 'game_session', 'timestamp': 1.0, 'session_id': 'old',
+             'properties': {'duration': 20.0, 'won': True, 'percentage': 90.0}},
+        ]
+        with open(os.path.join(data_dir, 'analytics_data.json'), 'w', encoding='utf-8') as f:
+            json.dump({'events': legacy_events}, f)
+
+        manager = create_manager(data_dir)
+        if os.path.exists(os.path.join(data_dir, 'analytics_data.json')):
+            print("❌ Arquivo antigo não foi migrado")
+            return False
+        if manager.get_local_statistics().get('total_sessions') != 1 or len(manager.read_events()) != 1:
+            print("❌ Eventos antigos perdidos na migração")
+            return False
+
+        manager.delete_all_data()
+        if os.listdir(data_dir) or manager.get_local_statistics():
+            print(f"❌ Dados restantes: {os.listdir(data_dir)}")
+            return False
+
+    print("✅ Arquivo antigo migrado e dados removidos")
+    return True
+
+def test_interrupted_legacy_migration():
+    """Testa que uma migração interrompida ou repetida não duplica eventos nem totais"""
+    print("🧪 Testando migração interrompida...")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        legacy_path = os.path.join(data_dir, 'analytics_data.json')
+        legacy_events = [
+            {'event_type': 'game_session', 'timestamp': float(index), 'session_id': 'old',
+             'properties': {'duration': 20.0, 'won': True, 'percentage': 90.0}}
+            for index in range(3)
+        ]
+        with open(legacy_path, 'w', encoding='utf-8') as f:
+            json.dump({'events': legacy_events}, f)
+
+        # Falha ao gravar o resumo: nada é contado, o arquivo antigo continua lá
+        original_write_summary = AnalyticsManager._write_summary
+        def failing_write_summary(self):
+            raise OSError("disco cheio")
+        AnalyticsManager._write_summary = failing_write_summary
+        try:
+            create_manager(data_dir)
+        finally:
+            AnalyticsManager._write_summary = original_write_summary
+
+        # Arquivo antigo que não pode ser removido (ex: travado no Windows)
+        original_unlink = analytics.Path.unlink
+        def failing_unlink(path, *args, **kwargs):
+            if path.name == 'analytics_data.json':
+                raise PermissionError("arquivo em uso")
+            return original_unlink(path, *args, **kwargs)
+        analytics.Path.unlink = failing_unlink
+        try:
+            create_manager(data_dir)
+            manager = create_manager(data_dir)
+        finally:
+            analytics.Path.unlink = original_unlink
+
+        if not os.path.exists(legacy_path):
+            print("❌ Arquivo antigo removido apesar da falha simulada")
+            return False
+
+        manager = create_manager(data_dir)
+        sessions = manager.get_local_statistics().get('total_sessions')
+        if sessions != 3 or len(manager.read_events()) != 3:
+            print(f"❌ Migração duplicada: {sessions} sessões, {len(manager.read_events())} eventos")
+            return False
+        if os.path.exists(legacy_path):
+            print("❌ Arquivo antigo não foi removido depois da migração")
+            return False
+
+    print("✅ Migração repetida sem duplicar eventos ou totais")
+    return True
+
+def main():
+    """Função principal do teste"""
+    print("🎮 VIVA SERGIPE! - Teste do Log de Analytics")
+    print("=" * 50)
+
+    success = (
+        test_append_only_log_and_totals()
+        and test_log_rotation()
+        and test_legacy_migration_and_delete()
+        and test_interrupted_legacy_migration()
+    )
+
+    if success:
+        print("\n🎉 Todos os testes de analytics passaram!")
+    else:
+        print("\n❌ Alguns testes falharam!")
+
+    return success
+
+if __name__ == "__main__":
+    main()
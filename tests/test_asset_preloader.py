@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Teste do pré-carregamento de recursos do VIVA SERGIPE!
+"""
+
+import sys
+import os
+
+# Adicionar src ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from asset_preloader import AssetPreloader
+
+CAMERA_SETTINGS = {"width": 640, "height": 480}
+
+class FakePose:
+    """Modelo de pose de teste que registra os frames processados"""
+
+    def __init__(self, model_complexity):
+        self.model_complexity = model_complexity
+        self.shapes = []
+        self.closed = False
+
+    def process(self, rgb_frame):
+        self.shapes.append(rgb_frame.shape)
+
+    def close(self):
+        self.closed = True
+
+def create_preloader(**kwargs):
+    """Cria um pré-carregador sem câmera (frames de aquecimento do tamanho de CAMERA_SETTINGS)"""
+    return AssetPreloader([(640, 360), (320, 180)], camera_settings=CAMERA_SETTINGS, open_camera=False,
+                          prepare_inference_frame=lambda frame: frame[::2, ::2], pose_factory=FakePose,
+                          **kwargs)
+
+def test_preload_and_handover():
+    """Testa o contorno em cache, o modelo aquecido e a entrega ao jogo"""
+    print("🧪 Testando pré-carregamento e entrega...")
+
+    preloader = create_preloader(sounds={})
+    preloader.start()
+    if not preloader.wait(60.0):
+        print("❌ Pré-carregamento não terminou")
+        return False
+    if preloader.errors:
+        print(f"❌ Erros no pré-carregamento: {preloader.errors}")
+        return False
+
+    variants = preloader.contour._variants
+    if (640, 360) not in variants or (320, 180) not in variants:
+        print(f"❌ Variantes do contorno não preparadas: {list(variants)}")
+        return False
+
+    # O modelo aquecido só é entregue para a complexidade pedida, e uma única vez
+    if preloader.take_pose(1) is not None:
+        print("❌ Modelo entregue com outra complexidade")
+        return False
+    pose = preloader.take_pose(0)
+    if pose is None or preloader.take_pose(0) is not None:
+        print("❌ Modelo aquecido não entregue exatamente uma vez")
+        return False
+
+    # Aquecido com frames do tamanho da inferência
+    if pose.shapes != [(240, 320, 3)] * preloader.warmup_frames:
+        print(f"❌ Frames de aquecimento incorretos: {pose.shapes}")
+        return False
+
+    status = preloader.get_status()
+    if not status["ready"] or status["steps_done"] != status["total_steps"]:
+        print(f"❌ Status incorreto: {status}")
+        return False
+
+    print(f"✅ Recursos prontos: {', '.join(f'{k} {v * 1000:.0f} ms' for k, v in preloader.timings.items())}")
+    return True
+
+def test_failed_step_and_shutdown():
+    """Testa que a falha de uma etapa não impede as demais e que shutdown libera o modelo"""
+    print("🧪 Testando falhas e encerramento...")
+
+    preloader = create_preloader(sounds={"missing": "sounds/does_not_exist.mp3"})
+    preloader.start()
+    preloader.wait(60.0)
+
+    if "sons" not in preloader.errors or preloader.get_sound("missing") is not None:
+        print(f"❌ Falha dos sons não registrada: {preloader.errors}")
+        return False
+    if preloader.contour is None or preloader._pose is None:
+        print("❌ Etapas seguintes não executadas após a falha")
+        return False
+
+    pose = preloader._pose
+    preloader.shutdown()
+    if not pose.closed or preloader._pose is not None or preloader.take_camera() is not None:
+        print("❌ Recursos não liberados no encerramento")
+        return False
+
+    print("✅ Falha isolada e recursos liberados")
+    return True
+
+def main():
+    """Função principal do teste"""
+    print("🎮 VIVA SERGIPE! - Teste do Pré-carregamento")
+    print("=" * 50)
+
+    success = (
+        test_preload_and_handover()
+        and test_failed_step_and_shutdown()
+    )
+
+    if success:
+        print("\n🎉 Todos os testes de pré-carregamento passaram!")
+    else:
+        print("\n❌ Alguns testes falharam!")
+
+    return success
+
+if __name__ == "__main__":
+    main()
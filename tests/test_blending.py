@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Teste da mistura de camadas no lugar do VIVA SERGIPE!
+"""
+
+import sys
+import os
+import cv2
+import numpy as np
+
+# Adicionar src ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from blending import blend_premultiplied, tint
+
+def create_frame():
+    """Cria um frame aleatório"""
+    return np.random.RandomState(9).randint(0, 256, (360, 640, 3), dtype=np.uint8)
+
+def test_tint_matches_add_weighted():
+    """Testa se a tinta no lugar equivale ao addWeighted com cor sólida"""
+    print("🧪 Testando tinta no frame inteiro...")
+
+    frame = create_frame()
+    expected = cv2.addWeighted(frame, 0.2, np.full_like(frame, (20, 20, 40)), 0.8, 0)
+
+    address = frame.ctypes.data
+    result = tint(frame, (20, 20, 40), 0.8)
+    if result is not frame or frame.ctypes.data != address:
+        print("❌ A tinta não foi aplicada no lugar")
+        return False
+
+    # Arredondamento em duas etapas (escala e deslocamento)
+    if cv2.absdiff(expected, frame).max() > 1:
+        print(f"❌ Diferença máxima {cv2.absdiff(expected, frame).max()}")
+        return False
+
+    print("✅ Tinta equivalente ao addWeighted, sem imagem auxiliar")
+    return True
+
+def test_tint_restricted_to_mask_and_rect():
+    """Testa se a tinta só altera os pixels da máscara ou da ROI"""
+    print("🧪 Testando tinta restrita à máscara e à ROI...")
+
+    original = create_frame()
+    mask = np.zeros(original.shape[:2], dtype=np.uint8)
+    cv2.circle(mask, (320, 180), 60, 255, -1)
+
+    frame = original.copy()
+    tint(frame, (255, 0, 0), 0.2, mask=mask)
+    tinted = cv2.addWeighted(original, 0.8, np.full_like(original, (255, 0, 0)), 0.2, 0)
+
+    inside = mask > 0
+    if not np.array_equal(frame[~inside], original[~inside]):
+        print("❌ Pixels fora da máscara foram alterados")
+        return False
+    if np.abs(frame[inside].astype(int) - tinted[inside]).max() > 1:
+        print("❌ Tinta incorreta dentro da máscara")
+        return False
+
+    frame = original.copy()
+    tint(frame, (0, 0, 0), 0.5, rect=(-10, 300, 100, 400))
+    changed = np.any(frame != original, axis=2)
+    rows, cols = np.nonzero(changed)
+    if rows.min() < 300 or cols.max() >= 100:
+        print("❌ Pixels fora da ROI foram alterados")
+        return False
+
+    print("✅ Tinta aplicada apenas na máscara e na ROI")
+    return True
+
+def test_blend_premultiplied_clipping():
+    """Testa a composição de camada pré-multiplicada parcialmente fora do frame"""
+    print("🧪 Testando composição pré-multiplicada...")
+
+    frame = np.full((100, 100, 3), 200, dtype=np.uint8)
+    premultiplied = np.full((20, 30, 3), 50, dtype=np.uint8)
+    inverse_alpha = np.full((20, 30, 3), 128, dtype=np.uint8)
+
+    blend_premultiplied(frame, premultiplied, inverse_alpha, (85, -5))
+    expected = np.uint8(round(200 * 128 / 255.0) + 50)
+    if not np.all(frame[:15, 85:] == expected) or np.any(frame[15:] != 200) or np.any(frame[:, :85] != 200):
+        print("❌ Camada composta fora da área visível")
+        return False
+
+    # Totalmente fora do frame: nada muda
+    blend_premultiplied(frame, premultiplied, inverse_alpha, (200, 200))
+
+    print("✅ Camada composta apenas na área visível")
+    return True
+
+def main():
+    """Função principal do teste"""
+    print("🎮 VIVA SERGIPE! - Teste da Mistura de Camadas")
+    print("=" * 50)
+
+    success = (
+        test_tint_matches_add_weighted()
+        and test_tint_restricted_to_mask_and_rect()
+        and test_blend_premultiplied_clipping()
+    )
+
+    if success:
+        print("\n🎉 Todos os testes de mistura passaram!")
+    else:
+        print("\n❌ Alguns testes falharam!")
+
+    return success
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Teste da captura de câmera em thread do VIVA SERGIPE!
+"""
+
+import sys
+import os
+import tempfile
+import time
+import cv2
+import numpy as np
+
+# Adicionar src ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import camera_capture
+from camera_capture import CameraCapture
+
+def create_test_video(path, frames=30, fps=30):
+    """Cria um vídeo sintético em que cada frame tem brilho proporcional ao índice"""
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), fps, (64, 48))
+    for index in range(frames):
+        writer.write(np.full((48, 64, 3), index * 8, dtype=np.uint8))
+    writer.release()
+
+class StalledSource:
+    """Fonte sintética (interface de cv2.VideoCapture) que trava por 'stall' segundos no frame 'stall_at'"""
+
+    def __init__(self, source, frames=10, stall_at=3, stall=1.5):
+        self.frames = frames
+        self.stall_at = stall_at
+        self.stall = stall
+        self.index = 0
+
+    def isOpened(self):
+        return True
+
+    def read(self, image=None):
+        if self.index >= self.frames:
+            return False, None
+        time.sleep(self.stall if self.index == self.stall_at else 0.01)
+        self.index += 1
+        return True, np.full((48, 64, 3), self.index * 8, dtype=np.uint8)
+
+    def get(self, prop):
+        return 0
+
+    def set(self, prop, value):
+        return False
+
+    def release(self):
+        pass
+
+def test_capture_all_frames():
+    """Testa a leitura de um vídeo no ritmo do seu FPS"""
+    print("🧪 Testando captura de vídeo sintético...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        video_path = os.path.join(temp_dir, "synthetic.avi")
+        create_test_video(video_path)
+
+        capture = CameraCapture(video_path)
+        if not capture.start():
+            print("❌ Não foi possível abrir o vídeo sintético")
+            return False
+
+        brightness = []
+        while True:
+            success, frame = capture.read(timeout=2.0)
+            if not success:
+                break
+            brightness.append(float(frame.mean()))
+        capture.release()
+
+        stats = capture.get_stats()
+        if stats["frames_captured"] != 30:
+            print(f"❌ Frames capturados incorretos: {stats['frames_captured']}")
+            return False
+
+        if stats["frames_delivered"] + stats["frames_dropped"] != stats["frames_captured"]:
+            print(f"❌ Contagem inconsistente: {stats}")
+            return False
+
+        # Os frames entregues devem estar sempre em ordem
+        if brightness != sorted(brightness):
+            print("❌ Frames entregues fora de ordem")
+            return False
+
+    print(f"✅ {stats['frames_delivered']} frames entregues, {stats['frames_dropped']} descartados")
+    return True
+
+def test_latest_frame_wins():
+    """Testa se um consumidor lento recebe sempre o frame mais recente"""
+    print("🧪 Testando descarte de frames antigos...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        video_path = os.path.join(temp_dir, "synthetic.avi")
+        create_test_video(video_path, frames=20)
+
+        # Sem ritmo de tempo real a thread lê o vídeo inteiro rapidamente
+        capture = CameraCapture(video_path, realtime=False)
+        if not capture.start():
+            print("❌ Não foi possível abrir o vídeo sintético")
+            return False
+
+        capture.capture_thread.join(timeout=5)
+        success, frame = capture.read(timeout=0.5)
+        stats = capture.get_stats()
+
+        if not success or capture.last_frame_id != 20:
+            print(f"❌ Frame mais recente não foi entregue: {capture.last_frame_id}")
+            return False
+
+        if stats["frames_dropped"] != 19:
+            print(f"❌ Frames descartados incorretos: {stats['frames_dropped']}")
+            return False
+
+        # Sem frames novos a leitura termina sem bloquear indefinidamente
+        start = time.time()
+        success, _ = capture.read(timeout=0.5)
+        if success or time.time() - start > 0.5 or capture.isOpened():
+            print("❌ Leitura após o fim do vídeo deveria falhar")
+            return False
+
+        # Os buffers do anel são reutilizados entre frames
+        buffers = {id(buffer) for buffer in capture._ring if buffer is not None}
+        capture.release()
+        if len(buffers) > capture.ring_size:
+            print("❌ Buffers do anel não foram reutilizados")
+            return False
+
+    print("✅ Consumidor lento recebe apenas o frame mais recente")
+    return True
+
+def test_stalled_source():
+    """Testa que um loop de renderização segue rodando enquanto a câmera trava"""
+    print("🧪 Testando câmera travada...")
+
+    video_capture = camera_capture.cv2.VideoCapture
+    camera_capture.cv2.VideoCapture = StalledSource
+    try:
+        # Aberta como arquivo: o fim da fonte sintética é o fim normal do vídeo
+        capture = CameraCapture("stalled", realtime=False)
+        if not capture.start():
+            print("❌ Não foi possível abrir a fonte sintética")
+            return False
+
+        # Loop como o do jogo: lê sem esperar e só termina quando a fonte acaba
+        brightness = []
+        iterations = 0
+        slowest_read = 0.0
+        deadline = time.time() + 10.0
+        while time.time() < deadline:
+            iterations += 1
+            start = time.perf_counter()
+            success, frame = capture.read_latest()
+            slowest_read = max(slowest_read, time.perf_counter() - start)
+            if success:
+                brightness.append(float(frame.mean()))
+            elif not capture.isOpened():
+                break
+            else:
+                time.sleep(0.005)
+        capture.release()
+    finally:
+        camera_capture.cv2.VideoCapture = video_capture
+
+    if capture.isOpened() or not brightness or brightness[-1] != 80.0:
+        print(f"❌ Loop não chegou ao fim da fonte: {brightness}")
+        return False
+    if slowest_read > 0.05:
+        print(f"❌ Leitura esperou pela câmera: {slowest_read * 1000:.0f} ms")
+        return False
+    if iterations < 100:
+        print(f"❌ Loop parado durante a trava: {iterations} voltas")
+        return False
+
+    print(f"✅ {iterations} voltas, {len(brightness)} frames, leitura mais lenta {slowest_read * 1000:.1f} ms")
+    return True
+
+def main():
+    """Função principal do teste"""
+    print("🎮 VIVA SERGIPE! - Teste de Captura de Câmera")
+    print("=" * 50)
+
+    success = test_capture_all_frames() and test_latest_frame_wins() and test_stalled_source()
+
+    if success:
+        print("\n🎉 Todos os testes de captura passaram!")
+    else:
+        print("\n❌ Alguns testes falharam!")
+
+    return success
+
+if __name__ == "__main__":
+    main()
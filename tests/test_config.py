@@ -196,6 +196,126 @@ def test_file_operations():
         traceback.print_exc()
         return False
 
+def test_settings_snapshot():
+    """Testa o snapshot imutável das configurações do loop de renderização"""
+    print("\n📸 Testando Snapshot de Configurações...")
+    print("=" * 50)
+
+    import json
+    import tempfile
+
+    try:
+        from config_manager import ConfigManager
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "config.json")
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({"visual": {"camera_mirror": "false", "scene_analysis_interval": "abc"},
+                           "game": {"min_body_pixels": "1500"}}, f)
+
+            config = ConfigManager(path)
+            snapshot = config.get_snapshot()
+
+            # Valores validados e convertidos no carregamento
+            if snapshot.camera_mirror is not False or snapshot.min_body_pixels != 1500:
+                print(f"❌ Valores não convertidos: {snapshot}")
+                return False
+            if snapshot.scene_analysis_interval != 0.5:
+                print("❌ Valor inválido não voltou ao padrão")
+                return False
+            print("✅ Configurações validadas no carregamento!")
+
+            # Mesmo objeto enquanto nada muda
+            if config.get_snapshot() is not snapshot:
+                print("❌ Snapshot recriado sem mudanças")
+                return False
+
+            try:
+                snapshot.camera_mirror = True
+                print("❌ Snapshot aceitou alteração")
+                return False
+            except AttributeError:
+                print("✅ Snapshot imutável!")
+
+            config.set('visual', 'show_debug_info', 1, save=False)
+            updated = config.get_snapshot()
+            if updated is snapshot or updated.version != config.version or updated.show_debug_info is not True:
+                print("❌ Snapshot não foi atualizado após mudança")
+                return False
+            print(f"✅ Snapshot recriado na versão {updated.version}!")
+
+            if updated.analysis_resolution != (320, 180):
+                print(f"❌ Resolução de análise incorreta: {updated.analysis_resolution}")
+                return False
+
+        return True
+
+    except Exception as e:
+        print(f"❌ Erro no teste do snapshot: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_write_behind():
+    """Testa a gravação adiada e agrupada das configurações"""
+    print("\n⏱️ Testando Gravação em Segundo Plano...")
+    print("=" * 50)
+
+    import json
+    import tempfile
+    import time
+
+    try:
+        from config_manager import ConfigManager
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "config.json")
+            config = ConfigManager(path, flush_delay=0.05)
+            writes_before = config.writes
+
+            # Muitas mudanças seguidas viram uma única escrita
+            for games in range(50):
+                config.set('stats', 'games_played', games)
+            config.update_stats(photos_saved=1)
+
+            deadline = time.time() + 3.0
+            while config._writer.dirty and time.time() < deadline:
+                time.sleep(0.02)
+            time.sleep(0.1)
+
+            if config.writes - writes_before != 1:
+                print(f"❌ Esperada 1 escrita, feitas {config.writes - writes_before}")
+                return False
+            with open(path, encoding='utf-8') as f:
+                saved = json.load(f)
+            if saved['stats']['games_played'] != 49 or saved['stats']['photos_saved'] != 1:
+                print(f"❌ Arquivo desatualizado: {saved['stats']}")
+                return False
+            print("✅ 51 mudanças gravadas em uma escrita!")
+
+            # Encerrar grava o que estiver pendente
+            config.set('game', 'duration', 90)
+            config.shutdown()
+            with open(path, encoding='utf-8') as f:
+                if json.load(f)['game']['duration'] != 90:
+                    print("❌ Mudança pendente perdida no encerramento")
+                    return False
+            print("✅ Mudanças pendentes gravadas no encerramento!")
+
+            # Escrita atômica: nenhum arquivo temporário sobra na pasta
+            leftovers = [name for name in os.listdir(temp_dir) if name != "config.json"]
+            if leftovers:
+                print(f"❌ Arquivos temporários restantes: {leftovers}")
+                return False
+
+        return True
+
+    except Exception as e:
+        print(f"❌ Erro no teste de gravação: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
 def main():
     """Executa todos os testes"""
     print("TESTE COMPLETO DO SISTEMA DE CONFIGURACOES")
@@ -205,7 +325,9 @@ def main():
         ("Gerenciador de Configurações", test_config_manager),
         ("Janela de Configurações", test_config_window),
         ("Integração com o Jogo", test_integration),
-        ("Operações de Arquivo", test_file_operations)
+        ("Operações de Arquivo", test_file_operations),
+        ("Snapshot de Configurações", test_settings_snapshot),
+        ("Gravação em Segundo Plano", test_write_behind)
     ]
 
     passed = 0
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Teste do profiler de frames do VIVA SERGIPE!
+"""
+
+import sys
+import os
+import json
+import tempfile
+import time
+import numpy as np
+
+# Adicionar src ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from frame_profiler import FrameProfiler, LatencyHistogram
+
+def test_histogram_percentiles():
+    """Testa a estimativa de percentis pelos buckets fixos"""
+    print("🧪 Testando percentis do histograma...")
+
+    samples = np.random.RandomState(3).lognormal(mean=2.0, sigma=0.8, size=5000)
+    histogram = LatencyHistogram()
+    for value in samples:
+        histogram.add(float(value))
+
+    for percent in (50, 95, 99):
+        expected = np.percentile(samples, percent)
+        estimate = histogram.percentile(percent)
+        # Limite superior do bucket: no máximo ~12% acima do valor real
+        if not expected * 0.99 <= estimate <= expected * 1.13:
+            print(f"❌ p{percent} fora da tolerância: {estimate:.3f} (real {expected:.3f})")
+            return False
+
+    if abs(histogram.summary()["mean_ms"] - samples.mean()) > 0.01:
+        print("❌ Média incorreta")
+        return False
+
+    print("✅ Percentis dentro da resolução dos buckets")
+    return True
+
+def test_stage_laps_and_report():
+    """Testa a medição por estágio e o relatório JSON"""
+    print("🧪 Testando estágios e relatório...")
+
+    profiler = FrameProfiler()
+    for _ in range(5):
+        profiler.begin_frame()
+        time.sleep(0.002)
+        profiler.lap("capture")
+        time.sleep(0.001)
+        profiler.lap("feedback")
+        time.sleep(0.001)
+        profiler.lap("feedback")  # Estágio repetido no mesmo frame é somado
+        profiler.end_frame()
+
+    report = profiler.get_report()
+    stages = report["stages"]
+    if report["frame"]["count"] != 5 or stages["feedback"]["count"] != 5:
+        print(f"❌ Contagem de frames incorreta: {report['frame']}")
+        return False
+
+    if stages["capture"]["p50_ms"] < 2.0 or stages["feedback"]["p50_ms"] < 2.0:
+        print(f"❌ Latências medidas incorretamente: {stages}")
+        return False
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "config", "frame_profile.json")
+        if not profiler.save_report(path):
+            print("❌ Relatório não foi salvo")
+            return False
+        with open(path, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+
+    if set(saved["stages"]) != {"capture", "feedback"} or "p99_ms" not in saved["stages"]["capture"]:
+        print("❌ Relatório salvo incompleto")
+        return False
+
+    print(f"✅ Relatório com {len(saved['stages'])} estágios")
+    return True
+
+def test_disabled_profiler():
+    """Testa se o profiler desativado não registra nada"""
+    print("🧪 Testando profiler desativado...")
+
+    profiler = FrameProfiler(enabled=False)
+    profiler.begin_frame()
+    profiler.lap("capture")
+    with profiler.stage("inference"):
+        pass
+    profiler.end_frame()
+
+    if profiler.histograms or profiler.frame_histogram.count or profiler.save_report(os.devnull):
+        print("❌ Profiler desativado registrou amostras")
+        return False
+
+    print("✅ Profiler desativado não mede nada")
+    return True
+
+def main():
+    """Função principal do teste"""
+    print("🎮 VIVA SERGIPE! - Teste do Profiler de Frames")
+    print("=" * 50)
+
+    success = (
+        test_histogram_percentiles()
+        and test_stage_laps_and_report()
+        and test_disabled_profiler()
+    )
+
+    if success:
+        print("\n🎉 Todos os testes do profiler passaram!")
+    else:
+        print("\n❌ Alguns testes falharam!")
+
+    return success
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Teste da tela do jogo (GameView) do VIVA SERGIPE!
+"""
+
+import sys
+import os
+import threading
+import time
+import numpy as np
+
+# Tela sem monitor nem áudio
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Adicionar src ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import menu_gui
+from game_view import GameView, NO_KEY
+from PyQt5.QtCore import Qt
+from PyQt5.QtTest import QTest
+
+def make_frame(value):
+    """Frame BGR 1080p com o pixel (0, 0) azul = 'value'"""
+    frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
+    frame[0, 0] = (value, 0, 0)
+    return frame
+
+def test_zero_copy_latest_frame():
+    """Testa que o QImage usa o buffer do frame e que só o frame mais recente é mostrado"""
+    print("🧪 Testando frames sem cópia...")
+
+    menu_gui.get_application()
+    view = GameView(refresh_rate=60)
+    view.present(make_frame(10))
+    latest = make_frame(20)
+    view.present(latest)
+    view.refresh()
+
+    if int(view.image.constBits()) != latest.ctypes.data:
+        print("❌ Frame copiado para o QImage")
+        return False
+    if view.image.pixel(0, 0) & 0xFF != 20:
+        print(f"❌ Cor incorreta: {hex(view.image.pixel(0, 0))}")
+        return False
+    if (view.frames_presented, view.frames_shown) != (2, 1):
+        print(f"❌ Contagem incorreta: {view.frames_presented} entregues, {view.frames_shown} mostrados")
+        return False
+
+    # Sem frame novo, a atualização não redesenha
+    view.refresh()
+    if view.frames_shown != 1:
+        print("❌ Frame repetido redesenhado")
+        return False
+
+    print("✅ QImage sobre o buffer do frame, intermediários descartados")
+    return True
+
+def test_keys():
+    """Testa a fila de teclas lida pela thread do jogo"""
+    print("🧪 Testando teclas...")
+
+    menu_gui.get_application()
+    view = GameView(refresh_rate=60)
+    QTest.keyClick(view, Qt.Key_Escape)
+    QTest.keyClick(view, Qt.Key_Q)
+
+    keys = [view.read_key(), view.read_key(), view.read_key()]
+    if keys != [27, ord('q'), NO_KEY]:
+        print(f"❌ Teclas incorretas: {keys}")
+        return False
+
+    start = time.perf_counter()
+    view.read_key(timeout=0.05)
+    if time.perf_counter() - start < 0.04:
+        print("❌ read_key não esperou")
+        return False
+
+    print("✅ Teclas entregues ao jogo")
+    return True
+
+def test_game_thread_drives_view():
+    """Testa uma partida simulada: frames e fim enviados por outra thread"""
+    print("🧪 Testando tela controlada pela thread do jogo...")
+
+    view = menu_gui.get_game_view()
+    frames = [make_frame(value) for value in range(1, 31)]
+
+    def game():
+        for frame in frames:
+            view.present(frame)
+            time.sleep(0.005)
+        view.finish()
+
+    thread = threading.Thread(target=game)
+    start = time.perf_counter()
+    menu_gui.show_game_view(view, on_shown=thread.start, is_running=lambda: True)
+    elapsed = time.perf_counter() - start
+    thread.join()
+
+    if view.isVisible() or view.timer.isActive():
+        print("❌ Tela continuou visível após a partida")
+        return False
+    if elapsed > 5.0 or view.frames_shown == 0:
+        print(f"❌ Partida não mostrada ({view.frames_shown} frames em {elapsed:.1f} s)")
+        return False
+    if menu_gui.get_game_view() is not view:
+        print("❌ Tela recriada")
+        return False
+
+    # Jogo parado sem finish(): a tela é escondida pelo watchdog
+    menu_gui.show_game_view(view, is_running=lambda: False)
+    if view.isVisible():
+        print("❌ Tela visível com o jogo parado")
+        return False
+
+    print(f"✅ {view.frames_shown} de {len(frames)} frames mostrados em {elapsed:.2f} s")
+    return True
+
+def main():
+    """Função principal do teste"""
+    print("🎮 VIVA SERGIPE! - Teste da Tela do Jogo")
+    print("=" * 50)
+
+    success = (
+        test_zero_copy_latest_frame()
+        and test_keys()
+        and test_game_thread_drives_view()
+    )
+
+    if success:
+        print("\n🎉 Todos os testes da tela do jogo passaram!")
+    else:
+        print("\n❌ Alguns testes falharam!")
+
+    return success
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Teste do compositor do HUD do VIVA SERGIPE!
+"""
+
+import sys
+import os
+import cv2
+import numpy as np
+
+# Adicionar src ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from hud_compositor import HudCompositor
+from sergipe_utils import ContourVariant, display_sergipe_interface, _draw_progress_bar, _draw_start_screen
+from utils import draw_bold_text
+
+def create_contour():
+    """Cria um contorno sintético"""
+    mask = np.zeros((720, 1280), dtype=np.uint8)
+    cv2.ellipse(mask, (640, 400), (300, 250), 0, 0, 360, 255, -1)
+    return ContourVariant(mask)
+
+def draw_reference(frame, contour, time_left, fill_percentage, game_started, win_threshold):
+    """Desenha a interface diretamente no frame, sem camadas em cache"""
+    # Tinta apenas dentro do contorno, linha por cima misturada com a tinta
+    blended = cv2.addWeighted(frame, 0.6, contour.overlay, 0.4, 0)
+    np.copyto(frame, blended, where=contour.mask[..., None] > 0)
+    line = np.zeros(frame.shape[:2], dtype=np.uint8)
+    cv2.drawContours(line, contour.outlines, -1, 255, 3)
+    outline = cv2.addWeighted(np.full_like(frame, (0, 255, 0)), 0.6, contour.overlay, 0.4, 0)
+    np.copyto(frame, outline, where=line[..., None] > 0)
+    if not game_started:
+        minutes = int(time_left // 60) if time_left > 0 else 5
+        _draw_start_screen(frame, (0, 0), minutes, win_threshold)
+        return
+
+    timer_color = (0, 255, 0) if time_left > 60 else (0, 255, 255) if time_left > 30 else (0, 0, 255)
+    draw_bold_text(frame, f"Tempo: {int(time_left // 60):02d}:{int(time_left % 60):02d}", (50, 80),
+                   font_scale=2.0, color=timer_color, thickness=4, outline_color=(0, 0, 0), outline_thickness=8)
+
+    if fill_percentage >= win_threshold:
+        text_color = bar_color = (0, 255, 0)
+    elif fill_percentage >= win_threshold * 0.5:
+        text_color = bar_color = (0, 255, 255)
+    else:
+        text_color, bar_color = (255, 255, 255), (255, 100, 100)
+    draw_bold_text(frame, f"Preenchimento: {fill_percentage:.1f}%", (50, 150),
+                   font_scale=1.8, color=text_color, thickness=4, outline_color=(0, 0, 0), outline_thickness=8)
+    _draw_progress_bar(frame, (0, 0), int(fill_percentage / 100.0 * 400), bar_color, win_threshold)
+
+def test_interface_matches_direct_drawing():
+    """Testa se a interface composta em camadas é igual ao desenho direto"""
+    print("🧪 Testando equivalência com o desenho direto...")
+
+    contour = create_contour()
+    background = np.random.RandomState(5).randint(0, 256, (720, 1280, 3), dtype=np.uint8)
+
+    for args in [(120, 0.0, False, 30), (95, 12.3, True, 30), (20, 45.6, True, 30)]:
+        expected = background.copy()
+        composed = background.copy()
+        draw_reference(expected, contour, *args)
+        display_sergipe_interface(composed, contour, *args)
+
+        difference = cv2.absdiff(expected, composed)
+        # Apenas arredondamento da composição em duas etapas
+        if difference.max() > 2:
+            print(f"❌ Interface diferente para {args}: diferença máxima {difference.max()}")
+            return False
+
+    print("✅ Camadas reproduzem o desenho direto")
+    return True
+
+def test_dirty_tracking():
+    """Testa se as camadas só são re-renderizadas quando seus dados mudam"""
+    print("🧪 Testando re-renderização sob demanda...")
+
+    compositor = HudCompositor()
+    frame = np.zeros((200, 300, 3), dtype=np.uint8)
+    drawn = []
+
+    def draw_box(canvas, origin):
+        drawn.append(origin)
+        cv2.rectangle(canvas, (20 - origin[0], 30 - origin[1]), (60 - origin[0], 50 - origin[1]), (0, 0, 255), -1)
+
+    rendered = [compositor.draw_layer(frame, "box", key, draw_box, rect=(10, 10, 100, 100))
+                for key in (1, 1, 1, 2, 2)]
+    if rendered != [True, False, False, True, False] or compositor.get_render_counts() != {"box": 2}:
+        print(f"❌ Re-renderizações inesperadas: {rendered}")
+        return False
+
+    # Preto e branco por renderização; a camada fica limitada à área desenhada
+    layer = compositor.layers["box"]
+    if len(drawn) != 4 or (layer.x, layer.y) != (20, 30) or layer.premultiplied.shape[:2] != (21, 41):
+        print(f"❌ ROI da camada incorreta: {(layer.x, layer.y)} {layer.premultiplied.shape}")
+        return False
+
+    if not np.array_equal(frame[30, 20], [0, 0, 255]) or frame[0, 0].any():
+        print("❌ Camada composta incorretamente")
+        return False
+
+    print("✅ Camadas re-renderizadas apenas quando a chave muda")
+    return True
+
+def test_contour_layer_cached():
+    """Testa se a camada do contorno é calculada uma vez por resolução"""
+    print("🧪 Testando cache da camada do contorno...")
+
+    compositor = HudCompositor()
+    contour = create_contour()
+    frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+
+    for _ in range(3):
+        compositor.draw_contour(frame, contour)
+    layer = compositor._contour_layers[id(contour)][1]
+    if layer.renders != 1:
+        print(f"❌ Contorno renderizado {layer.renders} vezes")
+        return False
+
+    # A camada cobre apenas a região do contorno, não o frame inteiro
+    if layer.premultiplied.shape[0] * layer.premultiplied.shape[1] >= 720 * 1280 / 2:
+        print("❌ Camada do contorno não foi limitada à sua ROI")
+        return False
+
+    print("✅ Contorno pré-calculado e limitado à sua ROI")
+    return True
+
+def main():
+    """Função principal do teste"""
+    print("🎮 VIVA SERGIPE! - Teste do Compositor do HUD")
+    print("=" * 50)
+
+    success = (
+        test_interface_matches_direct_drawing()
+        and test_dirty_tracking()
+        and test_contour_layer_cached()
+    )
+
+    if success:
+        print("\n🎉 Todos os testes do compositor passaram!")
+    else:
+        print("\n❌ Alguns testes falharam!")
+
+    return success
+
+if __name__ == "__main__":
+    main()
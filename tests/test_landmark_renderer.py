@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Teste do renderizador de landmarks do VIVA SERGIPE!
+"""
+
+import sys
+import os
+import cv2
+import numpy as np
+import mediapipe as mp
+
+# Adicionar src ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from landmark_renderer import LANDMARK_STYLES, POSE_CONNECTIONS, LandmarkRenderer
+from landmark_tracker import TrackedResults
+
+mp_drawing = mp.solutions.drawing_utils
+mp_pose = mp.solutions.pose
+
+def create_results():
+    """Cria landmarks aleatórios, alguns invisíveis ou fora da imagem"""
+    rng = np.random.RandomState(4)
+    landmark_array = np.c_[rng.uniform(-0.05, 1.05, (33, 2)), rng.uniform(0.0, 1.0, 33)]
+    return TrackedResults(landmark_array)
+
+def test_matches_mediapipe():
+    """Testa se o desenho em uma passada é igual ao mp_drawing.draw_landmarks"""
+    print("🧪 Testando equivalência com o MediaPipe...")
+
+    if sorted(map(tuple, POSE_CONNECTIONS.tolist())) != sorted(mp_pose.POSE_CONNECTIONS):
+        print("❌ Conexões diferentes de POSE_CONNECTIONS")
+        return False
+
+    results = create_results()
+    for name in ("classic", "enhanced"):
+        style = LANDMARK_STYLES[name]
+        expected = np.zeros((360, 640, 3), dtype=np.uint8)
+        mp_drawing.draw_landmarks(
+            expected, results.pose_landmarks, mp_pose.POSE_CONNECTIONS,
+            mp_drawing.DrawingSpec(color=style["landmark_color"], thickness=style["landmark_thickness"],
+                                   circle_radius=style["circle_radius"]),
+            mp_drawing.DrawingSpec(color=style["connection_color"], thickness=style["connection_thickness"]),
+        )
+
+        drawn = LandmarkRenderer(name).draw(np.zeros_like(expected), results)
+        if not np.array_equal(drawn, expected):
+            print(f"❌ Estilo '{name}' diferente do MediaPipe")
+            return False
+
+    print("✅ Desenho idêntico ao MediaPipe nos dois estilos")
+    return True
+
+def test_mirrored_drawing():
+    """Testa o desenho em coordenadas espelhadas"""
+    print("🧪 Testando desenho espelhado...")
+
+    renderer = LandmarkRenderer("enhanced")
+    results = create_results()
+    flipped = cv2.flip(renderer.draw(np.zeros((360, 640, 3), dtype=np.uint8), results), 1)
+    mirrored = renderer.draw(np.zeros((360, 640, 3), dtype=np.uint8), results, mirrored=True)
+
+    # Só o desempate da rasterização das linhas pode diferir
+    different = np.count_nonzero(cv2.absdiff(flipped, mirrored).max(axis=2))
+    if different > 0.01 * np.count_nonzero(flipped.max(axis=2)):
+        print(f"❌ {different} pixels diferentes do frame espelhado")
+        return False
+
+    print("✅ Desenho espelhado equivalente a espelhar o frame")
+    return True
+
+def test_style_none_and_no_pose():
+    """Testa o estilo 'none' e resultados sem pose"""
+    print("🧪 Testando estilo 'none' e ausência de pose...")
+
+    frame = np.zeros((100, 100, 3), dtype=np.uint8)
+    LandmarkRenderer("none").draw(frame, create_results())
+    LandmarkRenderer("classic").draw(frame, TrackedResults())
+    if frame.any():
+        print("❌ Algo foi desenhado")
+        return False
+
+    if LandmarkRenderer("inexistente").style_name != "enhanced":
+        print("❌ Estilo desconhecido não voltou ao padrão")
+        return False
+
+    print("✅ Nada desenhado sem estilo ou sem pose")
+    return True
+
+def main():
+    """Função principal do teste"""
+    print("🎮 VIVA SERGIPE! - Teste do Renderizador de Landmarks")
+    print("=" * 50)
+
+    success = (
+        test_matches_mediapipe()
+        and test_mirrored_drawing()
+        and test_style_none_and_no_pose()
+    )
+
+    if success:
+        print("\n🎉 Todos os testes do renderizador passaram!")
+    else:
+        print("\n❌ Alguns testes falharam!")
+
+    return success
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Teste do rastreador de landmarks do VIVA SERGIPE!
+"""
+
+import sys
+import os
+import numpy as np
+
+# Adicionar src ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from landmark_tracker import LandmarkTracker
+from sergipe_utils import create_body_mask
+
+class MockLandmark:
+    """Landmark simulado do MediaPipe"""
+    def __init__(self, x, y, z=0.0, visibility=1.0):
+        self.x = x
+        self.y = y
+        self.z = z
+        self.visibility = visibility
+
+class MockResults:
+    """Resultados simulados do MediaPipe"""
+    def __init__(self, points):
+        if points is None:
+            self.pose_landmarks = None
+        else:
+            self.pose_landmarks = type("MockLandmarkList", (), {})()
+            self.pose_landmarks.landmark = [MockLandmark(x, y) for x, y in points]
+
+# Pose sintética com 33 landmarks ao redor do centro da tela
+BASE_POSE = np.random.RandomState(7).uniform(0.35, 0.65, size=(33, 2))
+VELOCITY = np.array([0.2, -0.1])  # Unidades normalizadas por segundo
+
+def pose_at(t):
+    """Pose sintética em movimento retilíneo uniforme no instante t"""
+    return BASE_POSE + VELOCITY * t
+
+def test_prediction_between_detections():
+    """Testa a previsão a 30 Hz com detecções a 10 Hz"""
+    print("🧪 Testando previsão entre detecções...")
+
+    tracker = LandmarkTracker()
+    max_error = 0.0
+    for frame in range(60):
+        t = frame / 30.0
+        if frame % 3 == 0:
+            results = tracker.update(MockResults(pose_at(t)), t)
+        else:
+            results = tracker.predict(t)
+
+        if results.pose_landmarks is None:
+            print(f"❌ Frame {frame} ficou sem landmarks")
+            return False
+
+        if frame >= 6:
+            error = np.abs(results.landmark_array[:, :2] - pose_at(t)).max()
+            max_error = max(max_error, error)
+
+    if max_error > 0.005:
+        print(f"❌ Erro de previsão muito alto: {max_error:.4f}")
+        return False
+
+    print(f"✅ Erro máximo de previsão: {max_error:.5f}")
+    return True
+
+def test_predicted_results_compatible():
+    """Testa se os resultados previstos funcionam com create_body_mask"""
+    print("🧪 Testando compatibilidade dos resultados previstos...")
+
+    tracker = LandmarkTracker()
+    tracker.update(MockResults(pose_at(0.0)), 0.0)
+    tracker.update(MockResults(pose_at(0.1)), 0.1)
+    predicted = tracker.predict(0.133)
+
+    mask = create_body_mask(predicted, 640, 360)
+    expected = create_body_mask(MockResults(pose_at(0.133)), 640, 360)
+
+    overlap = np.sum((mask > 0) & (expected > 0)) / float(np.sum(expected > 0))
+    if not predicted.predicted or overlap < 0.95:
+        print(f"❌ Máscara prevista diverge da real: {overlap:.2%}")
+        return False
+
+    landmark = predicted.pose_landmarks.landmark[0]
+    if not landmark.HasField('visibility') or landmark.HasField('presence'):
+        print("❌ Landmark previsto incompatível com mp_drawing")
+        return False
+
+    print(f"✅ Máscara prevista cobre {overlap:.1%} da máscara real")
+    return True
+
+def test_tracking_expires():
+    """Testa se a previsão expira e se a perda de detecção reseta o rastreador"""
+    print("🧪 Testando expiração do rastreamento...")
+
+    tracker = LandmarkTracker(max_prediction_time=0.5)
+    tracker.update(MockResults(pose_at(0.0)), 0.0)
+
+    if tracker.predict(0.6).pose_landmarks is not None:
+        print("❌ Previsão deveria expirar sem detecções recentes")
+        return False
+
+    tracker.update(MockResults(None), 0.7)
+    if tracker.predict(0.71).pose_landmarks is not None or tracker.history:
+        print("❌ Perda de detecção deveria resetar o rastreador")
+        return False
+
+    print("✅ Rastreamento expira corretamente")
+    return True
+
+def main():
+    """Função principal do teste"""
+    print("🎮 VIVA SERGIPE! - Teste do Rastreador de Landmarks")
+    print("=" * 50)
+
+    success = (
+        test_prediction_between_detections()
+        and test_predicted_results_compatible()
+        and test_tracking_expires()
+    )
+
+    if success:
+        print("\n🎉 Todos os testes do rastreador passaram!")
+    else:
+        print("\n❌ Alguns testes falharam!")
+
+    return success
+
+if __name__ == "__main__":
+    main()
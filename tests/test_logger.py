@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Teste do sistema de logging do VIVA SERGIPE!
+"""
+
+import sys
+import os
+import logging
+import subprocess
+
+# Adicionar src ao path
+SRC_DIR = os.path.join(os.path.dirname(__file__), '..', 'src')
+sys.path.append(SRC_DIR)
+
+from logger import RateLimitFilter, get_log_manager, get_logger
+
+class MockConfigManager:
+    """Gerenciador de configurações simulado"""
+    def __init__(self, logging_config):
+        self.config = {"logging": logging_config}
+
+    def get(self, section, key, default=None):
+        return self.config.get(section, {}).get(key, default)
+
+class ListHandler(logging.Handler):
+    """Handler que guarda as mensagens formatadas"""
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+def make_record(msg, created, args=None):
+    """Cria um registro de log com horário definido"""
+    record = logging.LogRecord("viva_sergipe.test", logging.INFO, __file__, 0, msg, args, None)
+    record.created = created
+    return record
+
+def test_rate_limit_filter():
+    """Testa a supressão e agregação de mensagens repetidas"""
+    print("🧪 Testando limite de mensagens repetidas...")
+
+    rate_filter = RateLimitFilter(interval=5.0)
+    emitted = [rate_filter.filter(make_record("Fill percentage", t)) for t in (0.0, 1.0, 2.0, 3.0)]
+    if emitted != [True, False, False, False]:
+        print(f"❌ Repetições não foram suprimidas: {emitted}")
+        return False
+
+    record = make_record("Fill percentage", 6.0)
+    if not rate_filter.filter(record) or "+3" not in record.msg:
+        print(f"❌ Mensagem agregada incorreta: {record.msg}")
+        return False
+
+    if not rate_filter.filter(make_record("Outra mensagem", 6.5)):
+        print("❌ Mensagens diferentes não devem ser suprimidas")
+        return False
+
+    # Mesma linha do código, argumentos diferentes: mensagens diferentes
+    transitions = [rate_filter.filter(make_record("Qualidade %s -> %s", 7.0 + t, args))
+                   for t, args in enumerate([("high", "medium"), ("medium", "low"), ("high", "medium")])]
+    if transitions != [True, True, False]:
+        print(f"❌ Mensagens com argumentos diferentes suprimidas: {transitions}")
+        return False
+
+    # Mensagens lembradas limitadas
+    bounded = RateLimitFilter(interval=5.0, max_entries=2)
+    for index in range(3):
+        bounded.filter(make_record(f"Mensagem {index}", 0.0))
+    if len(bounded._entries) != 2 or not bounded.filter(make_record("Mensagem 0", 1.0)):
+        print("❌ Mensagens lembradas sem limite")
+        return False
+
+    print("✅ Repetições suprimidas e agregadas")
+    return True
+
+def test_module_levels_from_config():
+    """Testa níveis por módulo e a escrita pela thread de fundo"""
+    print("🧪 Testando níveis de log por módulo...")
+
+    manager = get_log_manager()
+    manager.configure(MockConfigManager({
+        "level": "WARNING",
+        "modules": {"test_module_debug": "DEBUG"},
+        "rate_limit_interval": 0,
+    }))
+
+    handler = ListHandler()
+    manager.listener.handlers = manager.listener.handlers + (handler,)
+
+    class CountingArgument:
+        """Conta quantas vezes foi formatado"""
+        formatted = 0
+        def __str__(self):
+            CountingArgument.formatted += 1
+            return "arg"
+
+    quiet = get_logger("test_module_quiet")
+    verbose = get_logger("test_module_debug")
+
+    quiet.debug("debug silencioso %s", CountingArgument())
+    quiet.info("info silencioso %s", CountingArgument())
+    quiet.warning("aviso visível")
+    verbose.debug("debug visível %s", CountingArgument())
+    manager.flush()
+
+    try:
+        if handler.messages != ["aviso visível", "debug visível arg"]:
+            print(f"❌ Mensagens incorretas: {handler.messages}")
+            return False
+
+        # Mensagens desativadas nunca são formatadas
+        if CountingArgument.formatted != 1:
+            print(f"❌ Mensagens desativadas foram formatadas: {CountingArgument.formatted}")
+            return False
+    finally:
+        manager.configure(MockConfigManager({}))
+
+    print("✅ Níveis por módulo aplicados")
+    return True
+
+def test_listener_started_lazily():
+    """Testa que importar o logger não inicia a thread de escrita, e o primeiro registro sim"""
+    print("🧪 Testando início adiado da thread de escrita...")
+
+    code = (
+        "import logger; manager = logger.get_log_manager(); "
+        "before = manager.listener is not None; "
+        "logger.get_logger('test').warning('primeiro registro'); "
+        "after = manager.listener is not None; manager.flush(); "
+        "print(f'before: {before} after: {after}')"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=SRC_DIR,
+                            capture_output=True, text=True, timeout=60)
+    output = result.stdout
+    if result.returncode != 0 or "before: False" not in output or "after: True" not in output:
+        print(f"❌ Thread de escrita iniciada fora de hora: {output} {result.stderr[-300:]}")
+        return False
+    if "primeiro registro" not in output:
+        print("❌ Primeiro registro não foi escrito")
+        return False
+
+    print("✅ Thread de escrita iniciada no primeiro registro")
+    return True
+
+def main():
+    """Função principal do teste"""
+    print("🎮 VIVA SERGIPE! - Teste de Logging")
+    print("=" * 50)
+
+    success = (
+        test_rate_limit_filter()
+        and test_module_levels_from_config()
+        and test_listener_started_lazily()
+    )
+
+    if success:
+        print("\n🎉 Todos os testes de logging passaram!")
+    else:
+        print("\n❌ Alguns testes falharam!")
+
+    return success
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Teste da reutilização das janelas dos menus do VIVA SERGIPE!
+"""
+
+import sys
+import os
+
+# Menus sem tela nem áudio
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Adicionar src ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import menu_gui
+from PyQt5.QtCore import QTimer
+
+def choose_later(name, signal_name):
+    """Emite o sinal da janela 'name' assim que o loop de eventos rodar"""
+    QTimer.singleShot(50, lambda: getattr(menu_gui._windows[name], signal_name).emit())
+
+def test_single_application():
+    """Testa que todos os menus usam a mesma QApplication"""
+    print("🧪 Testando aplicação Qt única...")
+
+    app = menu_gui.get_application()
+    if menu_gui.get_application() is not app:
+        print("❌ Mais de uma QApplication")
+        return False
+    if app.quitOnLastWindowClosed():
+        print("❌ Esconder o último menu encerraria a aplicação")
+        return False
+
+    print("✅ Uma QApplication por processo")
+    return True
+
+def test_post_game_window_reused():
+    """Testa que o menu pós-jogo é criado uma vez e atualizado a cada partida"""
+    print("🧪 Testando reutilização do menu pós-jogo...")
+
+    choose_later('post_game', 'play_again_signal')
+    first_choice = menu_gui.show_post_game_menu(True, 91.5)
+    window = menu_gui._windows['post_game']
+
+    choose_later('post_game', 'exit_signal')
+    second_choice = menu_gui.show_post_game_menu(False, 42.0)
+
+    if (first_choice, second_choice) != ('play_again', 'exit'):
+        print(f"❌ Escolhas incorretas: {first_choice}, {second_choice}")
+        return False
+    if menu_gui._windows['post_game'] is not window:
+        print("❌ Janela recriada entre as partidas")
+        return False
+    if "42.0%" not in window.message_label.text() or "TEMPO" not in window.title_label.text():
+        print(f"❌ Resultado não atualizado: {window.title_label.text()} / {window.message_label.text()}")
+        return False
+    if window.buttons[0].property("selected") is not True:
+        print("❌ Seleção não voltou ao primeiro botão")
+        return False
+
+    print("✅ Mesma janela, resultado da última partida")
+    return True
+
+def test_flag_background_scaled_once():
+    """Testa que a bandeira é escalada uma vez por tamanho de tela"""
+    print("🧪 Testando cache do background...")
+
+    first = menu_gui.get_flag_background(640, 480)
+    if menu_gui.get_flag_background(640, 480) is not first:
+        print("❌ Bandeira escalada de novo")
+        return False
+    if first is not None and (first.width() < 640 or first.height() < 480):
+        print(f"❌ Bandeira menor que a tela: {first.width()}x{first.height()}")
+        return False
+
+    print("✅ Bandeira escalada uma única vez")
+    return True
+
+def main():
+    """Função principal do teste"""
+    print("🎮 VIVA SERGIPE! - Teste das Janelas dos Menus")
+    print("=" * 50)
+
+    success = (
+        test_single_application()
+        and test_post_game_window_reused()
+        and test_flag_background_scaled_once()
+    )
+
+    if success:
+        print("\n🎉 Todos os testes dos menus passaram!")
+    else:
+        print("\n❌ Alguns testes falharam!")
+
+    return success
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Teste do controle adaptativo de qualidade do VIVA SERGIPE!
+"""
+
+import sys
+import os
+import numpy as np
+
+# Adicionar src ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from quality_controller import AdaptiveQualityController, QualityLevel, QUALITY_LADDER
+
+TARGET = 1.0 / 30
+
+def feed(controller, frame_time, frames, start, fps=30.0):
+    """Envia 'frames' tempos de frame iguais a partir do instante 'start'; retorna as mudanças"""
+    transitions = []
+    for index in range(frames):
+        transition = controller.update(frame_time, now=start + index / fps)
+        if transition is not None:
+            transitions.append(transition)
+    return transitions
+
+def test_hysteresis_and_cooldown():
+    """Testa a faixa de histerese e o intervalo mínimo entre mudanças"""
+    print("🧪 Testando histerese e intervalo entre mudanças...")
+
+    controller = AdaptiveQualityController(TARGET, initial_level="high", cooldown=3.0, window=30)
+
+    # Dentro da faixa (entre 0.7x e 1.15x do alvo): nenhuma mudança
+    if feed(controller, TARGET * 1.05, 300, 0.0) or feed(controller, TARGET * 0.8, 300, 10.0):
+        print("❌ Mudança de nível dentro da faixa de histerese")
+        return False
+
+    # Lento: desce um degrau por vez, no máximo um a cada 3 segundos
+    transitions = feed(controller, TARGET * 1.5, 180, 20.0)
+    if [t.to_level for t in transitions] != ["medium", "low"]:
+        print(f"❌ Mudanças inesperadas: {[t.to_level for t in transitions]}")
+        return False
+    if transitions[0].frame_time <= TARGET * 1.15 or transitions[0].to_dict()["from"] != "high":
+        print("❌ Mudança sem a medição que a causou")
+        return False
+
+    print(f"✅ {len(transitions)} mudanças em 6 s de frames lentos")
+    return True
+
+def test_no_return_to_expensive_level():
+    """Testa que um nível medido acima do alvo não é tentado de novo logo em seguida"""
+    print("🧪 Testando memória do custo medido...")
+
+    controller = AdaptiveQualityController(TARGET, initial_level="high", cooldown=1.0, window=10, memory=60.0)
+    feed(controller, TARGET * 1.5, 10, 0.0)
+    if controller.level.name != "medium":
+        print(f"❌ Nível inesperado: {controller.level.name}")
+        return False
+
+    # Com folga, não volta para "high" (medido lento há pouco)
+    if feed(controller, TARGET * 0.5, 100, 5.0):
+        print("❌ Voltou para um nível medido acima do alvo")
+        return False
+
+    # Depois que a medição expira, pode tentar de novo
+    transitions = feed(controller, TARGET * 0.5, 20, 70.0)
+    if [t.to_level for t in transitions] != ["high"]:
+        print(f"❌ Não voltou após a medição expirar: {[t.to_level for t in transitions]}")
+        return False
+
+    print("✅ Sem oscilação entre níveis já medidos")
+    return True
+
+def test_ladder_and_optimizer():
+    """Testa a ordenação da escada e os ajustes aplicados pelo otimizador"""
+    print("🧪 Testando escada de qualidade e otimizador...")
+
+    ladder = [QualityLevel("cheap", 0.2), QualityLevel("rich", 2.0), QualityLevel("mid", 1.0)]
+    controller = AdaptiveQualityController(TARGET, ladder, initial_level="rich")
+    if [level.name for level in controller.ladder] != ["rich", "mid", "cheap"]:
+        print("❌ Escada não ordenada por custo")
+        return False
+
+    # Sem custos, a ordem dada é mantida
+    ladder = [QualityLevel("rich"), QualityLevel("cheap")]
+    if [level.name for level in AdaptiveQualityController(TARGET, ladder).ladder] != ["rich", "cheap"]:
+        print("❌ Escada sem custos reordenada")
+        return False
+
+    # Escada padrão: nenhum nível é mais caro que o anterior em algum ajuste
+    for previous, level in zip(QUALITY_LADDER, QUALITY_LADDER[1:]):
+        if (level.model_complexity > previous.model_complexity
+                or (level.inference_width or float("inf")) > (previous.inference_width or float("inf"))
+                or level.detection_frequency < previous.detection_frequency
+                or level.resolution_scale > previous.resolution_scale
+                or (level.overlays and not previous.overlays)):
+            print(f"❌ Escada padrão fora de ordem: {previous.name} -> {level.name}")
+            return False
+
+    from performance_optimizer import get_performance_optimizer
+    optimizer = get_performance_optimizer()
+    optimizer.stop_monitoring()
+    saved_settings = optimizer.adaptive_settings.copy()
+    try:
+        optimizer._apply_quality_level(QUALITY_LADDER[3])
+        frame = np.random.RandomState(3).randint(0, 256, (720, 1280, 3), dtype=np.uint8)
+
+        # Sem filtros: o frame só muda de tamanho quando a escala pede
+        if optimizer.optimize_frame_processing(frame) is not frame:
+            print("❌ Frame alterado sem mudança de escala")
+            return False
+        inference_frame = optimizer.prepare_inference_frame(frame)
+        if inference_frame.shape != (270, 480, 3):
+            print(f"❌ Tamanho de inferência incorreto: {inference_frame.shape}")
+            return False
+        if optimizer.adaptive_settings["detection_frequency"] != 2:
+            print("❌ Frequência de detecção do nível não aplicada")
+            return False
+    finally:
+        optimizer.adaptive_settings.update(saved_settings)
+
+    print("✅ Escada ordenada e ajustes do nível aplicados")
+    return True
+
+def main():
+    """Função principal do teste"""
+    print("🎮 VIVA SERGIPE! - Teste do Controle de Qualidade")
+    print("=" * 50)
+
+    success = (
+        test_hysteresis_and_cooldown()
+        and test_no_return_to_expensive_level()
+        and test_ladder_and_optimizer()
+    )
+
+    if success:
+        print("\n🎉 Todos os testes de qualidade passaram!")
+    else:
+        print("\n❌ Alguns testes falharam!")
+
+    return success
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Teste do registro de serviços do VIVA SERGIPE!
+"""
+
+import sys
+import os
+import threading
+
+# Adicionar src ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from services import ServiceRegistry, get_service, _create_sync
+
+class FakeService:
+    """Serviço de teste que registra início e parada"""
+
+    def __init__(self, name, events):
+        self.name = name
+        self.events = events
+        events.append(f"create {name}")
+
+def create_registry(events):
+    """Cria um registro com sync real e dois serviços de teste"""
+    registry = ServiceRegistry()
+    registry.register("sync", lambda: _create_sync(registry),
+                      stop=lambda manager: (events.append("stop sync"), manager.shutdown()))
+    for name, depends in (("config", ("sync",)), ("performance", ("config",))):
+        registry.register(name, lambda name=name: FakeService(name, events),
+                          start=lambda service: events.append(f"start {service.name}"),
+                          stop=lambda service: events.append(f"stop {service.name}"),
+                          health=lambda service: {"healthy": True, "name": service.name},
+                          depends=depends)
+    return registry
+
+def test_single_instance_and_dependencies():
+    """Testa que cada serviço é criado uma vez, depois das dependências"""
+    print("🧪 Testando instância única e dependências...")
+
+    events = []
+    registry = create_registry(events)
+    first = registry.get("performance")
+    if registry.get("performance") is not first or events != [
+            "create config", "start config", "create performance", "start performance"]:
+        print(f"❌ Eventos inesperados: {events}")
+        return False
+
+    health = registry.health()
+    if not all(entry["healthy"] for entry in health.values()) or health["performance"]["name"] != "performance":
+        print(f"❌ Saúde incorreta: {health}")
+        return False
+
+    registry.shutdown()
+    print("✅ Serviços criados uma vez, na ordem das dependências")
+    return True
+
+def test_shutdown_through_sync_manager():
+    """Testa que SyncManager.shutdown para todos os serviços, na ordem inversa"""
+    print("🧪 Testando encerramento pelo SyncManager...")
+
+    events = []
+    registry = create_registry(events)
+    registry.get("performance")
+    del events[:]
+
+    registry.get("sync").shutdown()
+    if events != ["stop sync", "stop performance", "stop config"]:
+        print(f"❌ Encerramento inesperado: {events}")
+        return False
+    if any(entry["state"] != "stopped" for entry in registry.health().values()):
+        print(f"❌ Serviços ainda rodando: {registry.health()}")
+        return False
+
+    # Encerrado, o registro não reinicia serviços
+    registry.get("performance")
+    if registry.is_running("performance"):
+        print("❌ Serviço reiniciado após o encerramento")
+        return False
+
+    print("✅ Todos os serviços parados por SyncManager.shutdown")
+    return True
+
+def test_global_services():
+    """Testa que os gerenciadores globais vêm do registro (um monitor de performance)"""
+    print("🧪 Testando serviços globais...")
+
+    from performance_optimizer import get_performance_optimizer
+    from achievements import get_achievement_manager
+
+    optimizers = {id(get_performance_optimizer()) for _ in range(3)}
+    monitors = [thread for thread in threading.enumerate() if thread.name == "PerformanceMonitor"]
+    if len(optimizers) != 1 or len(monitors) != 1:
+        print(f"❌ {len(optimizers)} otimizadores, {len(monitors)} threads de monitoramento")
+        return False
+    if get_achievement_manager() is not get_service("achievements"):
+        print("❌ Gerenciador de conquistas fora do registro")
+        return False
+
+    print("✅ Uma instância e uma thread de monitoramento por processo")
+    return True
+
+def main():
+    """Função principal do teste"""
+    print("🎮 VIVA SERGIPE! - Teste do Registro de Serviços")
+    print("=" * 50)
+
+    success = (
+        test_single_instance_and_dependencies()
+        and test_shutdown_through_sync_manager()
+        and test_global_services()
+    )
+
+    if success:
+        print("\n🎉 Todos os testes de serviços passaram!")
+    else:
+        print("\n❌ Alguns testes falharam!")
+
+    return success
+
+if __name__ == "__main__":
+    main()
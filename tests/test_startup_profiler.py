@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Teste do perfil de inicialização e das importações adiadas do VIVA SERGIPE!
+"""
+
+import sys
+import os
+import json
+import subprocess
+import tempfile
+
+# Adicionar src ao path
+SRC_DIR = os.path.join(os.path.dirname(__file__), '..', 'src')
+sys.path.append(SRC_DIR)
+
+from startup_profiler import StartupProfiler
+
+def test_profiler_report():
+    """Testa as etapas, as importações medidas e o relatório salvo"""
+    print("🧪 Testando perfil de inicialização...")
+
+    profiler = StartupProfiler()
+    profiler.mark("antes de habilitar")
+    profiler.install()
+    try:
+        sys.modules.pop("colorsys", None)
+        import colorsys  # noqa: F401 - importação medida
+        profiler.mark("colorsys importado")
+    finally:
+        profiler.uninstall()
+
+    if [phase for phase, _ in profiler.phases] != ["colorsys importado"]:
+        print(f"❌ Etapas incorretas: {profiler.phases}")
+        return False
+    if "colorsys" not in profiler.imports:
+        print("❌ Importação não medida")
+        return False
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "profile.json")
+        profiler.print_report(path)
+        with open(path, encoding='utf-8') as f:
+            report = json.load(f)
+        if report["phases_ms"][0][0] != "colorsys importado" or not report["slowest_imports_ms"]:
+            print(f"❌ Relatório incompleto: {report}")
+            return False
+
+    print("✅ Etapas e importações registradas")
+    return True
+
+def test_deferred_imports():
+    """Testa que os módulos do jogo não carregam MediaPipe nem pygame ao serem importados"""
+    print("🧪 Testando importações adiadas...")
+
+    code = (
+        "import sys; import utils, sergipe_utils, sergipe_game; "
+        "print('loaded:' + ','.join(m for m in ('mediapipe', 'pygame', 'menu_gui') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=SRC_DIR,
+                            capture_output=True, text=True, timeout=120)
+    if result.returncode != 0:
+        print(f"❌ Falha ao importar: {result.stderr[-500:]}")
+        return False
+    loaded = result.stdout.rsplit("loaded:", 1)[-1].strip()
+    if loaded:
+        print(f"❌ Carregados na importação: {loaded}")
+        return False
+
+    print("✅ MediaPipe, pygame e menu carregados apenas quando usados")
+    return True
+
+def main():
+    """Função principal do teste"""
+    print("🎮 VIVA SERGIPE! - Teste do Perfil de Inicialização")
+    print("=" * 50)
+
+    success = (
+        test_profiler_report()
+        and test_deferred_imports()
+    )
+
+    if success:
+        print("\n🎉 Todos os testes de inicialização passaram!")
+    else:
+        print("\n❌ Alguns testes falharam!")
+
+    return success
+
+if __name__ == "__main__":
+    main()
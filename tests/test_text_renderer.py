@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Teste do renderizador de texto em cache do VIVA SERGIPE!
+"""
+
+import sys
+import os
+import cv2
+import numpy as np
+
+# Adicionar src ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from text_renderer import TextRenderer, PIL_AVAILABLE
+
+def draw_bold_text_putText(frame, text, position, font_scale, color, thickness, offset=3):
+    """Desenho original com 10 chamadas de cv2.putText (referência)"""
+    outline_thickness = thickness + 4
+    x, y = position
+    cv2.putText(frame, text, (x + 3, y + 3), cv2.FONT_HERSHEY_SIMPLEX, font_scale,
+                (0, 0, 0), outline_thickness, cv2.LINE_AA)
+    for dx, dy in [(-offset, -offset), (-offset, 0), (-offset, offset), (0, -offset),
+                   (0, offset), (offset, -offset), (offset, 0), (offset, offset)]:
+        cv2.putText(frame, text, (x + dx, y + dy), cv2.FONT_HERSHEY_SIMPLEX, font_scale,
+                    (0, 0, 0), outline_thickness, cv2.LINE_AA)
+    cv2.putText(frame, text, position, cv2.FONT_HERSHEY_SIMPLEX, font_scale, color,
+                thickness, cv2.LINE_AA)
+
+def test_sprite_matches_putText():
+    """Testa se o sprite reproduz o desenho com putText"""
+    print("🧪 Testando sprite contra putText...")
+
+    renderer = TextRenderer()
+    background = np.random.RandomState(5).randint(0, 256, (240, 900, 3), dtype=np.uint8)
+
+    for text, scale, thickness in [("TEMPO: 04:59", 2.0, 4), ("50.0%", 1.2, 3), ("Meta: 30%", 0.8, 2)]:
+        expected = background.copy()
+        draw_bold_text_putText(expected, text, (40, 140), scale, (0, 255, 255), thickness)
+        result = background.copy()
+        renderer.draw_bold_text(result, text, (40, 140), font_scale=scale,
+                                color=(0, 255, 255), thickness=thickness)
+
+        # Diferenças apenas de arredondamento nas bordas suavizadas
+        difference = np.abs(expected.astype(np.int16) - result.astype(np.int16))
+        if difference.max() > 8 or difference.mean() > 0.1:
+            print(f"❌ '{text}' difere do putText: diferença máxima {difference.max()}")
+            return False
+
+    print("✅ Sprites equivalentes ao putText")
+    return True
+
+def test_sprite_cache():
+    """Testa reutilização dos sprites e o limite de memória do cache"""
+    print("🧪 Testando cache LRU de sprites...")
+
+    renderer = TextRenderer()
+    frame = np.zeros((200, 600, 3), dtype=np.uint8)
+    for _ in range(5):
+        renderer.draw_bold_text(frame, "VIVA SERGIPE!", (10, 100), font_scale=1.5)
+    if renderer.misses != 1 or renderer.hits != 4:
+        print(f"❌ Cache não reutilizou o sprite: {renderer.hits} hits, {renderer.misses} misses")
+        return False
+
+    sprite_bytes = renderer.cache_bytes
+    renderer.max_cache_bytes = int(sprite_bytes * 3.5)
+    for index in range(10):
+        renderer.draw_bold_text(frame, f"TEMPO: 00:0{index}", (10, 100), font_scale=1.5)
+    if renderer.cache_bytes > renderer.max_cache_bytes or len(renderer._cache) > 4:
+        print(f"❌ Cache ultrapassou o limite: {renderer.cache_bytes} bytes")
+        return False
+
+    # Texto parcialmente fora do frame não deve falhar
+    renderer.draw_bold_text(frame, "BORDA", (-40, 10), font_scale=1.5)
+    renderer.draw_bold_text(frame, "BORDA", (580, 210), font_scale=1.5)
+
+    print(f"✅ Cache com {len(renderer._cache)} sprites ({renderer.cache_bytes} bytes)")
+    return True
+
+def test_unicode_text():
+    """Testa textos com acentos e setas"""
+    print("🧪 Testando texto Unicode...")
+
+    renderer = TextRenderer()
+    frame = np.zeros((200, 800, 3), dtype=np.uint8)
+    renderer.draw_bold_text(frame, "VITÓRIA ↑↓", (20, 120), font_scale=1.5, color=(0, 255, 0))
+    green = np.count_nonzero((frame[:, :, 1] > 200) & (frame[:, :, 2] < 50))
+
+    if green == 0:
+        print("❌ Texto Unicode não foi desenhado")
+        return False
+
+    if renderer.atlas is not None and renderer.atlas.get_glyph("↑", 40) is None:
+        print("⚠️ Nenhuma fonte com setas encontrada; texto simplificado")
+    elif not PIL_AVAILABLE:
+        print("⚠️ Pillow não instalado; texto simplificado para ASCII")
+
+    print(f"✅ Texto Unicode desenhado ({green} pixels)")
+    return True
+
+def main():
+    """Função principal do teste"""
+    print("🎮 VIVA SERGIPE! - Teste do Renderizador de Texto")
+    print("=" * 50)
+
+    success = test_sprite_matches_putText() and test_sprite_cache() and test_unicode_text()
+
+    if success:
+        print("\n🎉 Todos os testes de texto passaram!")
+    else:
+        print("\n❌ Alguns testes falharam!")
+
+    return success
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,14 @@ import numpy as np
 # Adicionar src ao path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from sergipe_utils import load_sergipe_contour
+from sergipe_utils import (
+    load_sergipe_contour,
+    ContourAsset,
+    BodyMaskRasterizer,
+    BodyFillAnalyzer,
+    create_body_mask,
+    calculate_fill_percentage,
+)
 
 def get_asset_path(relative_path):
     """Função para obter caminho de assets"""
@@ -34,12 +41,164 @@ def test_contour_loading():
         print("❌ Falha ao carregar contorno")
         return False
 
+def test_contour_asset_cache():
+    """Testa o cache de variantes do contorno por resolução"""
+    print("🧪 Testando cache do contorno por resolução...")
+    
+    contour = ContourAsset.load(get_asset_path("assets/contorno-mapa-SE.png"))
+    if contour is None:
+        print("❌ Falha ao carregar contorno")
+        return False
+    
+    variant = contour.get(1920, 1080)
+    expected_mask = cv2.resize(contour.source_mask, (1920, 1080))
+    
+    # A mesma resolução deve reutilizar a variante já calculada
+    if contour.get(1920, 1080) is not variant:
+        print("❌ Variante recalculada para a mesma resolução")
+        return False
+    
+    if variant.mask.shape != (1080, 1920) or not np.array_equal(variant.mask, expected_mask):
+        print("❌ Máscara redimensionada incorreta")
+        return False
+    
+    if variant.pixel_count != int(np.sum(expected_mask > 0)):
+        print("❌ Contagem de pixels do contorno incorreta")
+        return False
+    
+    if variant.overlay.shape != (1080, 1920, 3):
+        print("❌ Overlay do contorno com dimensões incorretas")
+        return False
+    
+    print(f"✅ Variante 1920x1080 em cache ({variant.pixel_count} pixels, {len(variant.outlines)} contornos)")
+    return True
+
+class MockLandmark:
+    """Landmark simulado do MediaPipe"""
+    def __init__(self, x, y, visibility=1.0):
+        self.x = x
+        self.y = y
+        self.visibility = visibility
+
+class MockResults:
+    """Resultados simulados do MediaPipe"""
+    def __init__(self, points):
+        if points is None:
+            self.pose_landmarks = None
+        else:
+            self.pose_landmarks = type("MockLandmarkList", (), {})()
+            self.pose_landmarks.landmark = [MockLandmark(x, y) for x, y in points]
+
+def test_body_mask_rasterizer():
+    """Testa o rasterizador da máscara corporal com buffer reutilizável"""
+    print("🧪 Testando rasterizador da máscara corporal...")
+    
+    rasterizer = BodyMaskRasterizer()
+    body = MockResults([(0.4, 0.3), (0.6, 0.3), (0.6, 0.8), (0.4, 0.8), (0.5, 0.5)])
+    
+    mask, pixels = rasterizer.rasterize(body, 640, 360)
+    if pixels == 0 or pixels != int(np.sum(mask > 0)):
+        print(f"❌ Contagem de pixels incorreta: {pixels}")
+        return False
+    
+    if not np.array_equal(mask, create_body_mask(body, 640, 360)):
+        print("❌ Máscara diferente da criada por create_body_mask")
+        return False
+    
+    # O mesmo buffer deve ser reutilizado e limpo entre frames
+    empty_mask, empty_pixels = rasterizer.rasterize(MockResults(None), 640, 360)
+    if empty_mask is not mask or empty_pixels != 0 or np.any(empty_mask):
+        print("❌ Buffer não foi reutilizado ou limpo corretamente")
+        return False
+    
+    print(f"✅ Máscara corporal com {pixels} pixels em buffer reutilizável")
+    return True
+
+def test_fill_scorer():
+    """Testa o cálculo de preenchimento restrito à região de sobreposição"""
+    print("🧪 Testando cálculo de preenchimento com ROI...")
+    
+    # Contorno sintético: elipse preenchida
+    contour_mask = np.zeros((360, 640), dtype=np.uint8)
+    cv2.ellipse(contour_mask, (320, 180), (120, 80), 0, 0, 360, 1, -1)
+    variant = ContourAsset(contour_mask).get(640, 360)
+    
+    rasterizer = BodyMaskRasterizer()
+    body = MockResults([(0.4, 0.3), (0.6, 0.3), (0.6, 0.8), (0.4, 0.8), (0.5, 0.5)])
+    body_mask, _ = rasterizer.rasterize(body, 640, 360)
+    
+    # Referência: interseção calculada no frame inteiro
+    intersection = cv2.bitwise_and(body_mask, contour_mask)
+    expected = np.sum(intersection > 0) / np.sum(contour_mask > 0) * 100.0
+    
+    with_roi = calculate_fill_percentage(body_mask, variant, rasterizer.roi)
+    without_roi = calculate_fill_percentage(body_mask, contour_mask)
+    
+    if abs(with_roi - expected) > 1e-6 or abs(without_roi - expected) > 1e-6:
+        print(f"❌ Preenchimento incorreto: {with_roi:.2f}% / {without_roi:.2f}% (esperado {expected:.2f}%)")
+        return False
+    
+    print(f"✅ Preenchimento calculado na ROI: {with_roi:.2f}%")
+    return True
+
+def test_analysis_resolution():
+    """Testa se o preenchimento em baixa resolução acompanha o da resolução de exibição"""
+    print("🧪 Testando preenchimento na resolução de análise...")
+    
+    # Tolerância: 0.5 ponto percentual entre 320x180 e a resolução de exibição,
+    # inclusive em telas que não são 16:9 (4:3 e 16:10)
+    tolerance = 0.5
+    bodies = [
+        [(0.4, 0.3), (0.6, 0.3), (0.6, 0.8), (0.4, 0.8), (0.5, 0.5)],
+        [(0.45, 0.2), (0.55, 0.2), (0.7, 0.5), (0.3, 0.5), (0.5, 0.9)],
+        [(0.2, 0.4), (0.8, 0.4), (0.8, 0.6), (0.2, 0.6)],
+    ]
+    
+    for display_width, display_height in [(1920, 1080), (1024, 768), (1920, 1200)]:
+        # Contorno sintético na resolução de exibição
+        contour_mask = np.zeros((display_height, display_width), dtype=np.uint8)
+        cv2.ellipse(contour_mask, (display_width // 2, display_height // 2),
+                    (display_width * 3 // 16, display_height * 2 // 9), 0, 0, 360, 1, -1)
+        contour = ContourAsset(contour_mask)
+        
+        for points in bodies:
+            body = MockResults(points)
+            
+            full = BodyFillAnalyzer(contour)
+            full_pixels = full.update(body, display_width, display_height)
+            analysis = BodyFillAnalyzer(contour, (320, 180))
+            analysis_pixels = analysis.update(body, display_width, display_height)
+            
+            if analysis.body_mask.shape != (180, 320):
+                print(f"❌ Máscara fora da resolução de análise: {analysis.body_mask.shape}")
+                return False
+            
+            difference = abs(analysis.fill_percentage() - full.fill_percentage())
+            if difference > tolerance:
+                print(f"❌ Diferença de preenchimento acima da tolerância em "
+                      f"{display_width}x{display_height}: {difference:.2f}")
+                return False
+            
+            # Contagem de pixels reportada na escala de exibição
+            if abs(analysis_pixels - full_pixels) > 0.05 * full_pixels:
+                print(f"❌ Pixels do corpo fora da escala: {analysis_pixels} vs {full_pixels}")
+                return False
+    
+    print(f"✅ Preenchimento em 320x180 dentro de {tolerance:.1f} p.p. da resolução de exibição")
+    return True
+
 def main():
     """Função principal do teste"""
     print("🎮 VIVA SERGIPE! - Teste de Funcionalidades Visuais")
     print("=" * 50)
     
-    success = test_contour_loading()
+    success = (
+        test_contour_loading()
+        and test_contour_asset_cache()
+        and test_body_mask_rasterizer()
+        and test_fill_scorer()
+        and test_analysis_resolution()
+    )
     
     if success:
         print("\n🎉 Todos os testes visuais passaram!")
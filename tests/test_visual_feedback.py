@@ -83,6 +83,62 @@ def test_visual_feedback_manager():
         traceback.print_exc()
         return False
 
+def test_scene_analysis_cache():
+    """Testa a análise de cena em miniatura e a memoização por frame"""
+    print("\n🌗 Testando Análise de Cena em Cache...")
+    print("=" * 50)
+
+    try:
+        from visual_feedback import VisualFeedbackManager
+
+        visual_feedback = VisualFeedbackManager()
+        visual_feedback.scene_analysis_interval = 60.0
+
+        class MockResults:
+            pose_landmarks = object()
+
+        mock_results = MockResults()
+        frame = np.random.RandomState(2).randint(60, 200, (720, 1280, 3), dtype=np.uint8)
+
+        first = visual_feedback.analyze_detection_quality(frame, mock_results, 1500, frame_id=1)
+        again = visual_feedback.analyze_detection_quality(frame, mock_results, 1500, frame_id=1)
+        if again is not first:
+            print("❌ Segunda chamada no mesmo frame não reaproveitou a análise")
+            return False
+        print("✅ Análise memoizada por frame!")
+
+        # Novo frame dentro do intervalo: análise nova, mas sem medir a cena de novo
+        visual_feedback.analyze_detection_quality(frame, mock_results, 500, frame_id=2)
+        if visual_feedback.scene_analyses != 1:
+            print(f"❌ Cena medida {visual_feedback.scene_analyses} vezes dentro do intervalo")
+            return False
+        print("✅ Cena medida uma vez por intervalo!")
+
+        # A miniatura deve estimar o brilho e o contraste do frame inteiro
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        brightness, contrast = visual_feedback.scene_stats
+        if abs(brightness - gray.mean()) > 2.0 or abs(contrast - gray.std()) > 2.0:
+            print(f"❌ Estimativa da miniatura imprecisa: {brightness:.1f}/{contrast:.1f}")
+            return False
+        print(f"✅ Brilho {brightness:.1f} e contraste {contrast:.1f} estimados pela miniatura!")
+
+        # Em segundo plano o valor anterior é usado até a nova medição terminar
+        visual_feedback.scene_analysis_interval = 0.0
+        visual_feedback.scene_analysis_background = True
+        visual_feedback.analyze_scene(np.zeros_like(frame))
+        visual_feedback._scene_thread.join(timeout=1.0)
+        if visual_feedback.scene_stats[0] != 0.0 or visual_feedback.scene_analyses != 2:
+            print("❌ Medição em segundo plano não atualizou a cena")
+            return False
+        print("✅ Medição em segundo plano funcionou!")
+        return True
+
+    except Exception as e:
+        print(f"❌ Erro no teste da análise de cena: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
 def test_sync_manager():
     """Testa o gerenciador de sincronização"""
     print("\n🔄 Testando Gerenciador de Sincronização...")
@@ -328,6 +384,7 @@ def main():
 
     tests = [
         ("Gerenciador de Feedback Visual", test_visual_feedback_manager),
+        ("Análise de Cena em Cache", test_scene_analysis_cache),
         ("Gerenciador de Sincronização", test_sync_manager),
         ("Integração com o Jogo", test_integration),
         ("Demonstração Visual", test_visual_demo)